@@ -12,16 +12,11 @@ from datetime import datetime
 # Add Custom Modules Path
 sys.path.append((os.path.join(os.path.dirname(__file__), "pymodules")).replace("/", os.sep))
 
-import Imath
-import OpenEXR
 import pydpx_meta
-from PySide2.QtCore import Qt, QThreadPool, QSettings
-from PySide2.QtCore import QObject, Signal, QRunnable
-from PySide2.QtGui import QColor, QPixmap
-from PySide2.QtWidgets import ( QMessageBox, QFileDialog, QApplication,
-                               QTableWidgetItem, QWidget, QHBoxLayout,
-                               QCheckBox, QLabel, QMenu,
-                               QStyledItemDelegate, QComboBox )
+from PySide2.QtCore import Qt, QSettings, QFileSystemWatcher, QTimer
+from PySide2.QtGui import QColor
+from PySide2.QtWidgets import ( QMessageBox, QFileDialog, QApplication, QMenu,
+                               QStyledItemDelegate, QComboBox, QAbstractItemView )
 from timecode import Timecode
 
 # Custom Modules
@@ -31,9 +26,15 @@ import pymodules.sg_manager as sg_manager
 import pymodules.nuke_manager as nuke_manager
 import pymodules.excel_manager as excel_manager
 import pymodules.ffmpeg_manager as ffmpeg_manager
+import pymodules.probe_manager as probe_manager
+import pymodules.scan_index as scan_index
+import pymodules.thumbnail_atlas as thumbnail_atlas
+import pymodules.thumbnail_scheduler as thumbnail_scheduler
+import pymodules.frame_buffer as frame_buffer
+import pymodules.exr_manager as exr_manager
+import pymodules.sequence_manager as sequence_manager
 import pymodules.deadline_manager as deadline_manager
 import pymodules.login_dialog as login_dialog
-import pymodules.progress_dialog as progress_dialog
 import pymodules.loding_dialog as loading_dialog
 import pymodules.init_logger as init_logger
 
@@ -83,13 +84,13 @@ class IOManager(ui.IOManager_UI):
         self.__is_sequence = False
         self.__use_nuke_colorspace = False
         self.__is_edit = False
-        
-        # str
-        self.__error_paths = ""
+        self.__is_loading = False
         
         # dict
         self.__missing_thumnails = {}
         self.__edit_missing_thumnails = {}
+        self.__sequences = {}  # Scan Data: ImageSequence
+        self.__loading_disabled = []  # controls disabled while rows stream in
         
         # constants
         self.headers = constants.HEADERS
@@ -109,6 +110,16 @@ class IOManager(ui.IOManager_UI):
         self.processing_dialog = loading_dialog.LoadingDialog("Processing...", self)
         self.excel_manager = excel_manager.ExcelManager()
         self.ffmpeg_io = ffmpeg_manager.FFMPEGManager()
+        self.probe_manager = probe_manager.ProbeManager()
+        self.plate_thumbnails = thumbnail_scheduler.ThumbnailScheduler(parent=self)
+        self.edit_thumbnails = thumbnail_scheduler.ThumbnailScheduler(parent=self)
+        self.plate_atlas = None
+        self.edit_atlas = None
+        self.scan_index = None
+        self.scan_watcher = QFileSystemWatcher(self)
+        self.scan_refresh_timer = QTimer(self)
+        self.scan_refresh_timer.setSingleShot(True)
+        self.scan_refresh_timer.setInterval(constants.SCAN_REFRESH_DELAY_MS)
         self.deadline_manager = deadline_manager.DeadlineManager(self.user_data.get('email'))
     
     def __connections(self):
@@ -126,14 +137,25 @@ class IOManager(ui.IOManager_UI):
         self.scan_folder_open_btn.clicked.connect(self.open_scan_folder)
         self.excel_file_open_btn.clicked.connect(self.open_excel_file)
         self.scan_folder_reload_btn.clicked.connect(self.reload_scan_folder)
+        self.scan_watcher.directoryChanged.connect(lambda path: self.scan_refresh_timer.start())
+        self.scan_refresh_timer.timeout.connect(self.scan_folder_changed)
         self.view_mode_btn.clicked.connect(lambda: self.change_view_mode(self.__simple_view))
         
         # Table
-        self.plate_table_widget.customContextMenuRequested.connect(self.table_context_menu)
-        self.plate_table_widget.itemChanged.connect(self.table_item_changed)
+        self.plate_table_view.customContextMenuRequested.connect(self.table_context_menu)
+        self.plate_table_model.cell_edited.connect(self.table_item_changed)
+        self.plate_table_model.cell_edited.connect(lambda row, col: self.update_preview_range(row))
+        self.plate_table_view.selectionModel().currentRowChanged.connect(lambda current, previous: self.preview_plate(current.row()))
+        
+        # Thumbnails
+        self.plate_table_view.verticalScrollBar().valueChanged.connect(lambda: self.prioritize_visible_thumbnails(self.plate_table_view, self.plate_thumbnails))
+        self.plate_thumbnails.succeeded.connect(lambda shot, thumb_key, data: self.thumbnail_succeeded(self.plate_table_model, self.plate_atlas, shot, thumb_key, data))
+        self.plate_thumbnails.progress.connect(self.thumbnail_progress)
+        self.plate_thumbnails.finished.connect(lambda error_paths: self.thumbnail_finished(self.plate_atlas, error_paths))
         
         # Render Settings
         self.render_fps_cmbx.currentIndexChanged.connect(self.fps_changed)
+        self.render_fps_spbx.valueChanged.connect(self.plate_scrubber.set_fps)
         self.render_start_frame_spbx.valueChanged.connect(self.start_frame_changed)
         
         # Colorspace
@@ -168,8 +190,14 @@ class IOManager(ui.IOManager_UI):
         self.edit_view_mode_btn.clicked.connect(lambda: self.change_view_mode(self.__simple_view))
         
         # Table
-        self.edit_table_widget.customContextMenuRequested.connect(self.table_context_menu)
-        self.edit_table_widget.itemChanged.connect(self.edit_table_item_changed)
+        self.edit_table_view.customContextMenuRequested.connect(self.table_context_menu)
+        self.edit_table_model.cell_edited.connect(self.edit_table_item_changed)
+        
+        # Thumbnails
+        self.edit_table_view.verticalScrollBar().valueChanged.connect(lambda: self.prioritize_visible_thumbnails(self.edit_table_view, self.edit_thumbnails))
+        self.edit_thumbnails.succeeded.connect(lambda shot, thumb_key, data: self.thumbnail_succeeded(self.edit_table_model, self.edit_atlas, shot, thumb_key, data))
+        self.edit_thumbnails.progress.connect(self.thumbnail_progress)
+        self.edit_thumbnails.finished.connect(lambda error_paths: self.thumbnail_finished(self.edit_atlas, error_paths))
         
         # Buttons
         self.edit_validate_btn.clicked.connect(self.validate_version)
@@ -205,22 +233,6 @@ class IOManager(ui.IOManager_UI):
                 self.resize_target_all_cb.blockSignals(False)
                 self.set_plate_resolution()
 
-    # Decorator
-    def disconnect_table_event(func):
-        def wrapper(self, *args, **kwargs):
-            try:
-                self.plate_table_widget.itemChanged.disconnect()
-                self.edit_table_widget.itemChanged.disconnect()
-            except:
-                pass
-            try:
-                val = func(self, *args, **kwargs)
-            finally:
-                self.plate_table_widget.itemChanged.connect(self.table_item_changed)
-                self.edit_table_widget.itemChanged.connect(self.edit_table_item_changed)
-            return val 
-        return wrapper
-    
     def populate_projects(self):
         try:
             projects = sg_manager.get_active_projects()
@@ -239,6 +251,9 @@ class IOManager(ui.IOManager_UI):
         self.edit_project_cmbx.addItems(projects)
     
     def populate_data(self):
+        if self.__is_loading:
+            return
+        
         current_project = self.project_cmbx.currentText()
         if not current_project:
             QMessageBox.warning(self, "Warning", "프로젝트를 선택해주세요.")
@@ -321,16 +336,19 @@ class IOManager(ui.IOManager_UI):
         # Reset Previous Data
         self.scan_folder_le.clear()
         self.excel_file_cmbx.clear()
-        self.plate_table_widget.clearContents()
-        self.plate_table_widget.setRowCount(0)
+        self.plate_thumbnails.cancel()
+        self.close_thumbnail_atlas(is_edit=False)
+        self.plate_table_model.clear()
         self.__missing_thumnails = {}
+        self.__sequences = {}
         self.__is_sequence = False
         
         if self.__is_edit:
             self.edit_scan_folder_le.clear()
             self.edit_excel_file_cmbx.clear()
-            self.edit_table_widget.clearContents()
-            self.edit_table_widget.setRowCount(0)
+            self.edit_thumbnails.cancel()
+            self.close_thumbnail_atlas(is_edit=True)
+            self.edit_table_model.clear()
             self.__edit_missing_thumnails = {}
         
         # Set Status Message
@@ -407,22 +425,34 @@ class IOManager(ui.IOManager_UI):
             self.reload_excel_list(folder)
             
     def reload_scan_folder(self):
+        if self.__is_loading:
+            return
+        
         if self.__is_edit:
             folder = self.edit_scan_folder_le.text()
-            table = self.edit_table_widget
+            table = self.edit_table_view
             missing_thumnails = self.__edit_missing_thumnails
         else:
             folder = self.scan_folder_le.text()
-            table = self.plate_table_widget
+            table = self.plate_table_view
             missing_thumnails = self.__missing_thumnails
             
         if not folder:
             QMessageBox.warning(self, "Warning", "스캔 폴더를 선택해주세요.")
             return
+
+        # Same plate folder, only the rows that changed are updated
+        if not self.__is_edit:
+            try:
+                if self.refresh_data(folder):
+                    return
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"데이터를 불러오는 중 오류가 발생했습니다:\n{e}")
+                logger.error(traceback.format_exc())
+                return
         
         # init table
-        table.clearContents()
-        table.setRowCount(0)
+        table.model().clear()
         
         # load data
         if self.__is_edit:
@@ -452,87 +482,328 @@ class IOManager(ui.IOManager_UI):
         if ask == QMessageBox.Yes:
             self.load_excel_file()
     
-    @disconnect_table_event  
     def load_data(self, data_root): 
-        # Show Loading Dialog
+        if self.__is_loading:
+            return self.__missing_thumnails
+
+        # Show Loading Dialog, hidden again as soon as the first row is added
         self.loading_dialog.show()
         QApplication.processEvents()
         
-        # set ascending order for scan data
-        self.plate_table_widget.sortItems(self.headers.index("Scan Data"), Qt.AscendingOrder)
-        self.plate_table_widget.clearContents()
-        self.plate_table_widget.setRowCount(0)
+        # set ascending order for scan data, rows are added in that order with sorting off
+        self.plate_table_view.sortByColumn(self.headers.index("Scan Data"), Qt.AscendingOrder)
+        self.plate_thumbnails.cancel()
+        self.plate_scrubber.set_source(None, 0, -1)
+        self.open_thumbnail_atlas(data_root)
+        self.plate_table_model.clear()
+        self.scan_index = scan_index.ScanIndex(data_root)
         
         # Clear Vars
         self.__missing_thumnails = {}
+        self.__sequences = {}
         self.__is_sequence = False
         
-        # Check if data is sequence or mov
+        # Check if data is sequence or mov, unchanged files are read from metadata cache
         logger.debug(f"Checking if data is sequence or mov in {data_root}")
-        self.__is_sequence = self.load_sequence_data(data_root)
-        print(f"Is Sequence: {self.__is_sequence}")
-        if not self.__is_sequence:
-            logger.debug(f"Data is not sequence. Loading mov data in {data_root}")
-            self.load_mov_data(data_root)
+        self.begin_table_loading(self.plate_table_view)
+        self.probe_manager.open_cache(data_root)
+        try:
+            self.__is_sequence = self.load_sequence_data(data_root)
+            print(f"Is Sequence: {self.__is_sequence}")
+            if not self.__is_sequence:
+                logger.debug(f"Data is not sequence. Loading mov data in {data_root}")
+                self.load_mov_data(data_root)
+        finally:
+            self.probe_manager.close_cache()
+            self.plate_atlas.flush()
+            self.scan_index.save()
+            self.end_table_loading(self.plate_table_view)
         
         logger.debug(f"Data loaded in {data_root}, data type: {'Sequence' if self.__is_sequence else 'MOV'}")
         self.parse_scan_data()
-            
-        # Set NoneType data's to empty string
-        for row in range(self.plate_table_widget.rowCount()):
-            for col in range(self.plate_table_widget.columnCount()):
-                item = self.plate_table_widget.item(row, col)
-                if not item:
-                    self.plate_table_widget.setItem(row, col, QTableWidgetItem(""))
+        self.watch_scan_folder(data_root)
                     
         # Set Sub-Layout Enabled
         self.splitter.widget(1).setDisabled(False)
         
-        self.loading_dialog.hide()
         self.start_frame_changed()
+
+        # Generate Missing Thumbnails
+        if self.__missing_thumnails:
+            self.run_thumb_thread(self.__missing_thumnails)
         
         return self.__missing_thumnails
     
-    @disconnect_table_event
     def load_edit_data(self, data_root):
-        # Show Loading Dialog
+        if self.__is_loading:
+            return self.__edit_missing_thumnails
+
+        # Show Loading Dialog, hidden again as soon as the first row is added
         self.loading_dialog.show()
         QApplication.processEvents()
         
-        # set ascending order for scan data
-        self.edit_table_widget.sortItems(self.edit_headers.index("Scan Data"), Qt.AscendingOrder)
-        self.edit_table_widget.clearContents()
-        self.edit_table_widget.setRowCount(0)
+        # set ascending order for scan data, rows are added in that order with sorting off
+        self.edit_table_view.sortByColumn(self.edit_headers.index("Scan Data"), Qt.AscendingOrder)
+        self.edit_thumbnails.cancel()
+        self.open_thumbnail_atlas(data_root)
+        self.edit_table_model.clear()
         
         # Clear Vars
         self.__edit_missing_thumnails = {}
         
-        self.load_mov_data(data_root)
-            
-        # Set NoneType data's to empty string
-        for row in range(self.edit_table_widget.rowCount()):
-            for col in range(self.edit_table_widget.columnCount()):
-                item = self.edit_table_widget.item(row, col)
-                if not item:
-                    self.edit_table_widget.setItem(row, col, QTableWidgetItem(""))
-                    
-        self.loading_dialog.hide()
+        self.begin_table_loading(self.edit_table_view)
+        self.probe_manager.open_cache(data_root)
+        try:
+            self.load_mov_data(data_root)
+        finally:
+            self.probe_manager.close_cache()
+            self.edit_atlas.flush()
+            self.end_table_loading(self.edit_table_view)
+
+        # Generate Missing Thumbnails
+        if self.__edit_missing_thumnails:
+            self.run_thumb_thread(self.__edit_missing_thumnails)
         
         return self.__edit_missing_thumnails
+
+    def refresh_data(self, data_root):
+        """
+        Brings the plate table up to date with the scan folder without loading it again.
+        The folder is listed (unchanged sequence folders are read from the scan index) and diffed
+        against the rows: new sequences / MOVs get a row, rows whose files are gone are removed,
+        and rows whose frames or metadata changed are filled and get a thumbnail again.
+        The other rows and the columns entered by hand (Version, Offsets, Cube, Description...) are kept.
+        Returns False if the folder has to be loaded from scratch instead.
+        """
+        if self.__is_loading:
+            return True
+        index = self.scan_index
+        model = self.plate_table_model
+        if not index or not index.is_root(data_root) or not model.rowCount() or not os.path.isdir(data_root):
+            return False
+
+        root_mtime = scan_index.folder_mtime(data_root)
+        root_files = os.listdir(data_root)
+        folders = self.get_scan_folders(data_root, root_files)
+        if bool(folders) != self.__is_sequence:
+            # Sequences replaced MOVs or the other way around
+            return False
+
+        missing_thumbnails = {}
+        self.begin_table_loading(self.plate_table_view)
+        self.probe_manager.open_cache(data_root)
+        try:
+            index.set_root_files(root_mtime, root_files)
+            if self.__is_sequence:
+                index.retain(folders)
+                removed, added, changed = self.refresh_sequence_data(data_root, folders, missing_thumbnails)
+            else:
+                removed, added, changed = self.refresh_mov_data(data_root, root_files, missing_thumbnails)
+
+            # Derived columns of the new and changed rows only, before the rows are sorted again
+            self.parse_scan_data(sorted(added))
+            self.start_frame_changed(rows=sorted(added | changed))
+            if missing_thumbnails:
+                self.run_thumb_thread(missing_thumbnails)
+        finally:
+            self.probe_manager.close_cache()
+            self.plate_atlas.flush()
+            index.save()
+            self.end_table_loading(self.plate_table_view)
+
+        self.watch_scan_folder(data_root)
+        self.status_bar_debug(
+            f"Scan folder refreshed: {len(added)} added, {len(removed)} removed, {len(changed)} changed"
+        )
+        return True
+
+    def refresh_sequence_data(self, data_root, folders, missing_thumbnails):
+        index = self.scan_index
+        model = self.plate_table_model
+
+        scanned = {}  # Scan Data: ImageSequence or None, in load order
+        folder_paths = [os.path.join(data_root, folder) for folder in folders]
+        for folder_path, sequences in self.probe_manager.map_iter(self.get_folder_sequences, folder_paths):
+            scanned.update(self.get_sequence_rows(os.path.basename(folder_path), sequences))
+
+        removed = self.remove_table_rows(lambda shot: shot.scan_data not in scanned)
+        for scan_data in removed:
+            self.__sequences.pop(scan_data, None)
+
+        rows = {model.shot(row).scan_data: row for row in range(model.rowCount())}
+        added, changed = set(), set()
+        with self.probe_manager.stream() as stream:
+            for scan_data, sequence in scanned.items():
+                row = rows.get(scan_data)
+                if row is None:
+                    row = self.insert_table_row(scan_data)
+                    rows[scan_data] = row
+                    added.add(row)
+                    if sequence:
+                        self.set_sequence_row(row, scan_data, sequence, missing_thumbnails)
+                elif not sequence_manager.same_sequence(sequence, self.__sequences.get(scan_data)):
+                    changed.add(row)
+                    if sequence:
+                        self.set_sequence_row(row, scan_data, sequence, missing_thumbnails, new_thumbnail=True)
+                    else:
+                        self.__sequences.pop(scan_data, None)
+
+                # Every row is probed again, unchanged frames are answered by the metadata cache
+                if sequence:
+                    stream.submit(row, self.probe_manager.probe_sequence, sequence.start_path, sequence.end_path)
+
+            for row, seq_header in stream.remaining():
+                scan_data = model.shot(row).scan_data
+                header = seq_header._asdict() if seq_header else None
+                if row not in added and not index.header_changed(scan_data, header):
+                    continue
+                self.set_sequence_metadata_columns(row, seq_header)
+                if header:
+                    index.set_header(scan_data, header)
+                if row not in added and row not in changed:
+                    # Same frame numbers, new files
+                    changed.add(row)
+                    missing_thumbnails[row] = self.__sequences[scan_data].start_path.replace("/", os.sep), scan_data
+
+        return removed, added, changed
+
+    def refresh_mov_data(self, data_root, root_files, missing_thumbnails):
+        index = self.scan_index
+        model = self.plate_table_model
+
+        mov_files = {
+            os.path.splitext(file_name)[0]: file_name
+            for file_name in sorted(root_files) if file_name.lower().endswith(".mov")
+        }
+        removed = self.remove_table_rows(lambda shot: shot.scan_data not in mov_files)
+
+        rows = {model.shot(row).scan_data: row for row in range(model.rowCount())}
+        added, changed = set(), set()
+        row_files = {}
+        with self.probe_manager.stream() as stream:
+            for scan_data, file_name in mov_files.items():
+                data_path = os.path.join(data_root, file_name)
+                row = rows.get(scan_data)
+                if row is None:
+                    row = self.insert_table_row(scan_data)
+                    added.add(row)
+                    legacy_path = os.path.join(data_root, "_io", "proxy_thumb", file_name.replace(".mov", ".jpg"))
+                    if not self.set_atlas_thumbnail(row, self.plate_atlas, file_name, legacy_path):
+                        missing_thumbnails[row] = data_path, file_name
+                row_files[row] = file_name
+
+                # Every MOV is probed again, unchanged files are answered by the metadata cache
+                stream.submit(row, self.probe_manager.probe_mov, data_path)
+
+            for row, metadata in stream.remaining():
+                file_name = row_files[row]
+                if row not in added and not index.mov_changed(file_name, metadata):
+                    continue
+                self.set_mov_metadata_columns(row, metadata)
+                index.set_mov_metadata(file_name, metadata)
+                if row not in added:
+                    changed.add(row)
+                    missing_thumbnails[row] = os.path.join(data_root, file_name), file_name
+
+        return removed, added, changed
+
+    def remove_table_rows(self, is_removed):
+        # Plate rows for which is_removed(shot) is True, returns their 'Scan Data'
+        model = self.plate_table_model
+        removed = []
+        for row in reversed(range(model.rowCount())):
+            shot = model.shot(row)
+            if is_removed(shot):
+                removed.append(shot.scan_data)
+                model.remove_row(row)
+        return removed
+
+    def watch_scan_folder(self, data_root):
+        """
+        Watches the loaded plate folder and its sequence folders, a change refreshes the table
+        once the folder has been quiet for SCAN_REFRESH_DELAY_MS (late shots dropped in by vendors).
+        """
+        watched = self.scan_watcher.directories()
+        if watched:
+            self.scan_watcher.removePaths(watched)
+        if not constants.SCAN_REFRESH_DELAY_MS or not os.path.isdir(data_root):
+            return
+        folders = {os.path.normpath(sequence.folder) for sequence in self.__sequences.values()}
+        self.scan_watcher.addPaths(sorted(folders | {os.path.normpath(data_root)}))
+
+    def scan_folder_changed(self):
+        data_root = self.scan_folder_le.text()
+        if not self.scan_index or not self.scan_index.is_root(data_root):
+            return
+
+        # Not while rows are loading, processed or edited, tried again later
+        busy = (
+            self.__is_loading or self.__is_edit
+            or self.processing_dialog.isVisible()
+            or self.plate_table_view.state() == QAbstractItemView.EditingState
+        )
+        if busy:
+            self.scan_refresh_timer.start()
+            return
+
+        try:
+            self.refresh_data(data_root)
+        except Exception as e:
+            logger.error(traceback.format_exc())
+            self.status_bar_error(f"Failed to refresh scan folder: {e}")
+
+    def begin_table_loading(self, table):
+        # Rows stream in while the GUI keeps running, keep the row indices stable meanwhile
+        self.__is_loading = True
+        table.setSortingEnabled(False)
+        self.tab_widget.tabBar().setEnabled(False)
+
+        # Nothing may clear or read the table until the rows are in
+        self.__loading_disabled = [control for control in self.get_loading_controls() if control.isEnabled()]
+        for control in self.__loading_disabled:
+            control.setEnabled(False)
+
+    def end_table_loading(self, table):
+        self.__is_loading = False
+        if table is self.plate_table_view and self.__is_sequence:
+            self.fill_empty_clip_names()
+        table.setSortingEnabled(True)
+        self.tab_widget.tabBar().setEnabled(True)
+        for control in self.__loading_disabled:
+            control.setEnabled(True)
+        self.__loading_disabled = []
+        self.loading_dialog.hide()
+
+    def get_loading_controls(self):
+        return [
+            self.project_cmbx, self.scan_folder_btn, self.scan_folder_reload_btn,
+            self.excel_file_load_btn, self.excel_file_create_btn, self.colorspace_cube_btn,
+            self.validate_btn, self.collect_btn, self.render_btn,
+            self.edit_project_cmbx, self.edit_scan_folder_btn, self.edit_scan_folder_reload_btn,
+            self.edit_excel_file_load_btn, self.edit_excel_file_create_btn, self.edit_task_cmbx,
+            self.edit_validate_btn, self.edit_start_btn,
+        ]
+
+    def insert_table_row(self, scan_data):
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
+
+        # Empty cells, checked 'Render', the columns are filled in as their data arrives
+        row = model.append_row()
+
+        # Set 'Scan Data' Column
+        self.set_read_only_cells(row, "Scan Data", scan_data)
+
+        # First row is on screen, let the table take over from the loading dialog
+        self.loading_dialog.hide()
+        return row
     
-    @disconnect_table_event
-    def parse_scan_data(self):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
+    def parse_scan_data(self, rows=None):
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
         
         # each row, parse scan data to get shot name and type
         pattern = r"^([A-Z0-9_]+)_(mp\d|sp\d|rp\d)_(v\d{3})"  # ex) "A01_001_mp0_v001", "A01_001_sp0_v001", "A01_001_rp0_v001"
-        for row in range(table.rowCount()):
-            scan_data = table.item(row, headers.index("Scan Data")).text()
+        for row in (range(model.rowCount()) if rows is None else rows):
+            scan_data = model.text(row, "Scan Data")
             match = re.match(pattern, scan_data)
             
             if not match:
@@ -546,122 +817,121 @@ class IOManager(ui.IOManager_UI):
                 logger.warning(f"Error parsing Scan Data: {scan_data}")
                 continue
             
-            table.setItem(row, headers.index("Sequence"), QTableWidgetItem(sequence))
-            table.setItem(row, headers.index("Shot Name"), QTableWidgetItem(shot_name))
+            model.set_text(row, "Sequence", sequence)
+            model.set_text(row, "Shot Name", shot_name)
             if not self.__is_edit:
-                table.setItem(row, headers.index("Type"), QTableWidgetItem(_type))
+                model.set_text(row, "Type", _type)
             
     def populate_cube_files(self):
-        self.plate_table_widget.setItemDelegateForColumn(self.headers.index("Cube"), None)
+        self.plate_table_view.setItemDelegateForColumn(self.headers.index("Cube"), None)
             
         cube_dir = self.colorspace_cube_le.text()
         if not cube_dir:
             return
         cube_files = [f for f in os.listdir(cube_dir) if f.endswith(".cube")]
         
-        self.plate_table_widget.setItemDelegateForColumn(self.headers.index("Cube"), CustomDelegate(self, cube_files, "None"))
+        self.plate_table_view.setItemDelegateForColumn(self.headers.index("Cube"), CustomDelegate(self, cube_files, "None"))
         
-        for row in range(self.plate_table_widget.rowCount()):
-            self.plate_table_widget.setItem(row, self.headers.index("Cube"), QTableWidgetItem("None"))
+        for row in range(self.plate_table_model.rowCount()):
+            self.plate_table_model.set_text(row, "Cube", "None")
+        self.update_cube_thumbnails()
     
-    @disconnect_table_event
     def load_mov_data(self, data_root):
         if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
+            model = self.edit_table_model
+            atlas = self.edit_atlas
             missing_thumnails = self.__edit_missing_thumnails
         else:
-            table = self.plate_table_widget
-            headers = self.headers
+            model = self.plate_table_model
+            atlas = self.plate_atlas
             missing_thumnails = self.__missing_thumnails
         
+        index = self.scan_index if not self.__is_edit else None
+        root_mtime = scan_index.folder_mtime(data_root)
+        root_files = os.listdir(data_root)
+        if index:
+            index.set_root_files(root_mtime, root_files)
         data_path_list = [
-            path for path in os.listdir(data_root) if path.lower().endswith(".mov")
+            path for path in root_files if path.lower().endswith(".mov")
         ]
         data_path_list.sort()
         
         if not data_path_list:
             return
         
-        table.setRowCount(len(data_path_list))
-        
-        # Set Items
-        for idx, file_name in enumerate(data_path_list):
-            # Set 'Render' Column
-            render_widget = QWidget()
-            render_layout = QHBoxLayout(render_widget)
-            render_layout.setAlignment(Qt.AlignCenter)
-            render_layout.setContentsMargins(0, 0, 0, 0)
-            render_ckbx = QCheckBox()
-            render_ckbx.setChecked(True)
-            render_ckbx.setStyleSheet("QCheckBox::indicator { margin-left: 8; margin-right: 0; }")
-            render_layout.addWidget(render_ckbx)
-            table.setCellWidget(idx, headers.index("Render"), render_widget)
-            
-            # Set 'Scan Data' Column
-            scan_data_item = QTableWidgetItem(os.path.splitext(file_name)[0])
-            self.set_read_only_cells(idx, "Scan Data", scan_data_item)
-            
-            # Get Metadata
-            data_path = os.path.join(data_root, file_name)
-            metadata = self.ffmpeg_io.extract_mov_metadata(data_path)
-            self.set_clip_name_column(idx, data_path, ext="mov")
-
-            if self.__is_edit:
-                type_item = QTableWidgetItem(self.edit_task_cmbx.currentText())
-                self.set_read_only_cells(idx, "Type", type_item)
+        # Set Items, each row's probe runs while the next rows are added
+        row_files = {}
+        with self.probe_manager.stream() as stream:
+            for file_name in data_path_list:
+                idx = self.insert_table_row(os.path.splitext(file_name)[0])
+                row_files[idx] = file_name
                 
-                # get datetime to YYMMDD
-                date_item = QTableWidgetItem(datetime.now().strftime("%y%m%d"))
-                table.setItem(idx, headers.index("Date"), date_item)
-            
-            if metadata:
-                start_timecode = metadata.get("start_tc", None)
-                duration = metadata.get("duration", None)
-                fps = metadata.get("fps", None)
-                end_timecode = metadata.get("end_tc", None)
+                # Queue Metadata Probe
+                data_path = os.path.join(data_root, file_name)
+                stream.submit(idx, self.probe_manager.probe_mov, data_path)
 
-                self.set_plate_resolution(idx, metadata)
-
-                start_frame = 1001
-                
-                # Set 'Frame' Columns
-                if not duration:
-                    continue
-                end_frame = start_frame + duration - 1
-
-                if not start_frame or not end_frame:
-                    continue
-                self.set_frame_columns(idx, start_frame, end_frame)
-                
-                # Set 'TimeCode' Columns
-                if not start_timecode or not end_timecode:
-                    continue
-                
-                if not self.__is_edit:
-                    self.set_timecode_item(idx, headers.index("TimeCode In"), start_timecode)
-                    self.set_timecode_item(idx, headers.index("TimeCode Out"), end_timecode)
+                if self.__is_edit:
+                    self.set_read_only_cells(idx, "Type", self.edit_task_cmbx.currentText())
                     
-            # Set 'Thumbnail' Column
-            thumb_name = os.path.basename(data_path).replace(".mov", ".jpg")
-            thumb_path = os.path.join(data_root, "_io", "proxy_thumb", thumb_name).replace("/", os.sep)
-            
-            self.ensure_dir_exists(os.path.dirname(thumb_path))
-                
-            if not os.path.exists(thumb_path):
-                missing_thumnails[idx] = data_path, thumb_path
-                continue
-            else:
-                self.set_thumbnail_column(idx, thumb_path)
-        
-        # Generate Missing Thumbnails
-        if missing_thumnails:
-            self.run_thumb_thread(missing_thumnails)
+                    # get datetime to YYMMDD
+                    model.set_text(idx, "Date", datetime.now().strftime("%y%m%d"))
                         
-        # Set Row Height
-        for row in range(table.rowCount()):
-            table.setRowHeight(row, 120)
+                # Set 'Thumbnail' Column
+                legacy_path = os.path.join(data_root, "_io", "proxy_thumb", file_name.replace(".mov", ".jpg"))
+                if not self.set_atlas_thumbnail(idx, atlas, file_name, legacy_path):
+                    missing_thumnails[idx] = data_path, file_name
+
+                # Fill rows whose probe already finished
+                for probed_idx, metadata in stream.ready():
+                    self.set_mov_metadata_columns(probed_idx, metadata)
+                    if index:
+                        index.set_mov_metadata(row_files[probed_idx], metadata)
+                self.status_bar_debug(f"Loading {idx + 1}/{len(data_path_list)}: {file_name}")
+
+                # Paint the rows added so far and keep the GUI responsive
+                QApplication.processEvents()
+            
+            # Get Metadata, fill each remaining row as soon as its probe finishes
+            for idx, metadata in stream.remaining():
+                self.set_mov_metadata_columns(idx, metadata)
+                if index:
+                    index.set_mov_metadata(row_files[idx], metadata)
+                QApplication.processEvents()
+
+        self.status_bar_debug(f"{len(data_path_list)} MOV loaded: {data_root}")
     
+    def set_mov_metadata_columns(self, idx, metadata):
+        if not metadata:
+            return
+
+        # Set 'Clip Name' Column
+        self.set_clip_name_column(idx, metadata.get("clip_name"))
+
+        if not metadata.get("width"):
+            return
+
+        start_timecode = metadata.get("start_tc", None)
+        duration = metadata.get("duration", None)
+        end_timecode = metadata.get("end_tc", None)
+
+        self.set_plate_resolution(idx, metadata)
+
+        start_frame = 1001
+
+        # Set 'Frame' Columns
+        if not duration:
+            return
+        end_frame = start_frame + duration - 1
+        self.set_frame_columns(idx, start_frame, end_frame)
+
+        # Set 'TimeCode' Columns
+        if not start_timecode or not end_timecode:
+            return
+
+        if not self.__is_edit:
+            self.set_timecode_item(idx, "TimeCode In", start_timecode)
+            self.set_timecode_item(idx, "TimeCode Out", end_timecode)
+
     def set_plate_resolution(self, idx=None, metadata=None):
         if self.__is_edit:
             return
@@ -670,8 +940,8 @@ class IOManager(ui.IOManager_UI):
             reformat_resolution = self.get_reformat_resolution()
             if not reformat_resolution:
                 return
-            for idx in range(self.plate_table_widget.rowCount()):
-                self.set_read_only_cells(idx, "Plate Resolution", QTableWidgetItem(reformat_resolution))
+            for idx in range(self.plate_table_model.rowCount()):
+                self.set_read_only_cells(idx, "Plate Resolution", reformat_resolution)
             return
 
         width = metadata.get("width", None)
@@ -679,19 +949,14 @@ class IOManager(ui.IOManager_UI):
         self.org_resolution = f"{width}*{height}"
         if not self.org_resolution:
             return
-        self.set_read_only_cells(idx, "Plate Resolution", QTableWidgetItem(self.org_resolution))
+        self.set_read_only_cells(idx, "Plate Resolution", self.org_resolution)
 
-    def set_sequence_plate_resolution_column(self, idx, first_frame_path):
-
-        exr_file = OpenEXR.InputFile(first_frame_path)
-        dw = exr_file.header()['dataWindow']
-        width = dw.max.x - dw.min.x + 1
-        height = dw.max.y - dw.min.y + 1
-        self.org_resolution = f"{width}*{height}"
-
-        if not self.org_resolution:
+    def set_sequence_plate_resolution_column(self, idx, seq_header):
+        if not seq_header.width or not seq_header.height:
             return
-        self.set_read_only_cells(idx, "Plate Resolution", QTableWidgetItem(self.org_resolution))
+
+        self.org_resolution = f"{seq_header.width}*{seq_header.height}"
+        self.set_read_only_cells(idx, "Plate Resolution", self.org_resolution)
 
     def get_reformat_resolution(self):
 
@@ -707,193 +972,301 @@ class IOManager(ui.IOManager_UI):
 
         return resolution
 
-    @disconnect_table_event
     def load_sequence_data(self, data_root):
         sequence_loaded = False
-        data_path_list = [
-            path for path in os.listdir(data_root) if os.path.isdir(os.path.join(data_root, path))
-            and path not in ["_io", "xml", "@eaDir", "proxy_thumb"]
-        ]
-        data_path_list.sort()
+        root_mtime = scan_index.folder_mtime(data_root)
+        root_files = os.listdir(data_root)
+        self.scan_index.set_root_files(root_mtime, root_files)
+        data_path_list = self.get_scan_folders(data_root, root_files)
+        self.scan_index.retain(data_path_list)
 
         if not data_path_list:
             logger.debug(f"No sequence data found in {data_root}")
             print(sequence_loaded)
             return sequence_loaded
         
-        self.plate_table_widget.setRowCount(len(data_path_list))
         logger.debug(f"Sequence data found in {data_root}")
-        # Set Items
-        for idx, data_path in enumerate(data_path_list):
-            logger.debug(f"Loading sequence data: {data_path}")
-            # Set 'Render' Column
-            render_widget = QWidget()
-            render_layout = QHBoxLayout(render_widget)
-            render_layout.setAlignment(Qt.AlignCenter)
-            render_layout.setContentsMargins(0, 0, 0, 0)
-            render_ckbx = QCheckBox()
-            render_ckbx.setChecked(True)
-            render_ckbx.setStyleSheet("QCheckBox::indicator { margin-left: 8; margin-right: 0; }")
-            render_layout.addWidget(render_ckbx)
-            self.plate_table_widget.setCellWidget(idx, self.headers.index("Render"), render_widget)
-            
-            # Set 'Scan Data' Column
-            scan_data_item = QTableWidgetItem(data_path)
-            self.set_read_only_cells(idx, "Scan Data", scan_data_item)
-
-            # Get Image Sequence
-            sequence_info = self.check_image_sequence(os.path.join(data_root, data_path))
-            if not sequence_info:
-                logger.debug(f"Failed to Check Sequence in {data_path}")
-                continue
-                
-            start_frame, end_frame, frame_to_path = sequence_info
-            start_frame_path, end_frame_path = frame_to_path[int(start_frame)], frame_to_path[int(end_frame)]
-            if not start_frame or not end_frame:
-                logger.debug(f"Could not find start or end frame in {data_path}")
-                continue
 
-            # Set 'Clip Name' Column
-            self.set_clip_name_column(idx, start_frame_path, ext="exr")
+        # Folders are scanned on the probe pool in order (unchanged ones are read from the scan index),
+        # each row is added as soon as its folder is scanned and its header probe runs while the next rows are added
+        folder_paths = [os.path.join(data_root, data_path) for data_path in data_path_list]
+        missing_rows = []
+        row_names = {}
+        with self.probe_manager.stream() as stream:
+            for folder_no, (folder_path, sequences) in enumerate(
+                self.probe_manager.map_iter(self.get_folder_sequences, folder_paths), 1
+            ):
+                data_path = os.path.basename(folder_path)
+
+                for scan_data, sequence in self.get_sequence_rows(data_path, sequences):
+                    logger.debug(f"Loading sequence data: {scan_data}")
+                    idx = self.insert_table_row(scan_data)
+                    if not sequence:
+                        continue
+                    row_names[idx] = scan_data
+                    self.set_sequence_row(idx, scan_data, sequence, self.__missing_thumnails)
+
+                    # Mark Missing Frames on the row, the load goes on
+                    if sequence.missing:
+                        missing_rows.append(idx)
+
+                    # Queue Header Probe ('Clip Name', 'Plate Resolution', 'TimeCode' Columns)
+                    stream.submit(idx, self.probe_manager.probe_sequence, sequence.start_path, sequence.end_path)
+
+                # Fill rows whose probe already finished
+                for probed_idx, seq_header in stream.ready():
+                    self.set_sequence_metadata_columns(probed_idx, seq_header)
+                    if seq_header:
+                        self.scan_index.set_header(row_names[probed_idx], seq_header._asdict())
+                self.status_bar_debug(f"Loading {folder_no}/{len(data_path_list)}: {data_path}")
+
+                # Paint the rows added so far and keep the GUI responsive
+                QApplication.processEvents()
+
+            # Get Header Metadata, fill each remaining row as soon as its probe finishes
+            for idx, seq_header in stream.remaining():
+                self.set_sequence_metadata_columns(idx, seq_header)
+                if seq_header:
+                    self.scan_index.set_header(row_names[idx], seq_header._asdict())
+                QApplication.processEvents()
+                
+        sequence_loaded = True
 
-            # Set 'Plate Resolution' Column
-            self.set_sequence_plate_resolution_column(idx, start_frame_path)
+        self.status_bar_debug(f"{self.plate_table_model.rowCount()} Sequence loaded: {data_root}")
+        if missing_rows:
+            self.status_bar_error(f"누락된 프레임이 있는 시퀀스가 {len(missing_rows)}개 있습니다: {', '.join(str(row + 1) for row in missing_rows)}행")
 
-            # Set 'Frame' Columns
-            logger.debug(f"Setting Frame Columns: {start_frame} - {end_frame}")
-            self.set_frame_columns(idx, start_frame, end_frame)
+        return sequence_loaded
 
-            # Set 'TimeCode' Columns
-            logger.debug(f"Setting TimeCode Columns: {start_frame_path} - {end_frame_path}")
-            self.set_timecode_columns(idx, start_frame_path, end_frame_path)
-            
-            # Set 'Thumbnail' Column
-            seq_path = os.path.dirname(start_frame_path).replace("/", os.sep)
-            seq_name = os.path.basename(seq_path)
-            thumb_path = os.path.join(seq_path, "proxy_thumb", f"{seq_name}.jpg").replace("/", os.sep)
-            
-            self.ensure_dir_exists(os.path.dirname(thumb_path))
-                
-            if not os.path.exists(thumb_path):
-                self.__missing_thumnails[idx] = start_frame_path.replace("/", os.sep), thumb_path
-                logger.debug(f"Thumbnail not found in {data_path}")
-                continue
-            else:
-                self.set_thumbnail_column(idx, thumb_path)
-                
-        sequence_loaded = True
+    def get_scan_folders(self, data_root, file_names):
+        # Sequence folders of the scan folder, sorted
+        return sorted(
+            path for path in file_names if os.path.isdir(os.path.join(data_root, path))
+            and path not in ["_io", "xml", "@eaDir", "proxy_thumb"]
+        )
 
-        # Generate Missing Thumbnails
-        if self.__missing_thumnails:
-            self.run_thumb_thread(self.__missing_thumnails)
-        
-        # Set Row Height
-        for row in range(self.plate_table_widget.rowCount()):
-            self.plate_table_widget.setRowHeight(row, 120)  
-        result = sequence_loaded if sequence_loaded else False
+    def get_sequence_rows(self, data_path, sequences):
+        # One row per sequence, a folder holding several sequences gets a row for each
+        if not sequences:
+            logger.debug(f"Failed to Check Sequence in {data_path}")
+            return [(data_path, None)]
+        if len(sequences) == 1:
+            return [(data_path, sequences[0])]
+        logger.debug(f"{len(sequences)} sequences found in {data_path}")
+        return sorted(
+            ((f"{data_path}/{sequence.label}", sequence) for sequence in sequences), key=lambda row: row[0]
+        )
 
-        return result
+    def set_sequence_row(self, idx, scan_data, sequence, missing_thumbnails, new_thumbnail=False):
+        """
+        Frame columns, missing frame marks and thumbnail of a sequence row.
+        new_thumbnail generates the thumbnail again even if the atlas has one (frames changed).
+        """
+        self.__sequences[scan_data] = sequence
+        start_frame, end_frame = sequence.first, sequence.last
+        start_frame_path = sequence.start_path
+
+        # Set 'Frame' Columns
+        logger.debug(f"Setting Frame Columns: {start_frame} - {end_frame}")
+        self.set_frame_columns(idx, start_frame, end_frame)
+
+        # Mark Missing Frames on the row
+        self.set_missing_frames(idx, sequence)
+
+        # Set 'Thumbnail' Column
+        seq_path = sequence.folder.replace("/", os.sep)
+        seq_name = os.path.basename(seq_path) if scan_data == os.path.basename(seq_path) else sequence.label
+        legacy_path = os.path.join(seq_path, "proxy_thumb", f"{seq_name}.jpg")
+        if new_thumbnail or not self.set_atlas_thumbnail(idx, self.plate_atlas, scan_data, legacy_path):
+            missing_thumbnails[idx] = start_frame_path.replace("/", os.sep), scan_data
+            logger.debug(f"Thumbnail not found in {scan_data}")
     
-    def set_clip_name_column(self, idx, path, ext=None):
-        if self.__is_edit:
+    def set_sequence_metadata_columns(self, idx, seq_header):
+        if not seq_header:
             return
 
-        clip_name = None
-        if ext == "mov":
-            clip_name = self.ffmpeg_io.extract_mov_clip_name(path)
+        # Set 'Clip Name' Column
+        self.set_clip_name_column(idx, seq_header.clip_name, seq_header.clip_names)
 
-            if not clip_name:
-                clip_name = os.path.basename(os.path.dirname(path))
+        # Set 'Plate Resolution' Column
+        self.set_sequence_plate_resolution_column(idx, seq_header)
 
-            clip_name_item = QTableWidgetItem(str(clip_name))
-            self.set_read_only_cells(idx, "Clip Name", clip_name_item)
+        # Set 'TimeCode' Columns
+        self.set_timecode_columns(idx, seq_header.start_tc, seq_header.end_tc)
 
-        elif ext == "exr":
-            exr_file = OpenEXR.InputFile(path)
-            header = exr_file.header()
+    def set_clip_name_column(self, idx, clip_name, clip_names=None):
+        if self.__is_edit:
+            return
 
-            clip_names = []
-            filmlight = "uk.ltd.filmlight.Clip"
-            cameraClipName = "interim.clip.cameraClipName"
-            if filmlight in header or cameraClipName in header:
-                try:
-                    filmlight = os.path.splitext(header.get(filmlight))[0]
-                    if isinstance(filmlight, bytes):
-                        filmlight = filmlight.decode("utf-8", errors="ignore")
-                    clip_names.append(filmlight)
+        # MOV: single read-only clip name
+        if clip_names is None:
+            self.set_read_only_cells(idx, "Clip Name", str(clip_name))
+            return
 
-                except Exception as e:
-                    filmlight = ""
+        # Sequence: selectable clip names from header, the editor lists the row's own (Qt.UserRole)
+        default_val = clip_name if clip_name else "None"
+        self.plate_table_model.set_text(idx, "Clip Name", default_val, read_only=False)
+        self.plate_table_model.set_cell_role(idx, "Clip Name", Qt.UserRole, clip_names)
 
-                try:
-                    cameraClipName = os.path.splitext(header.get(cameraClipName))[0]
-                    if isinstance(cameraClipName, bytes):
-                        cameraClipName = cameraClipName.decode("utf-8", errors="ignore")
-                    clip_names.append(cameraClipName)
+        column = self.headers.index("Clip Name")
+        if not isinstance(self.plate_table_view.itemDelegateForColumn(column), CustomDelegate):
+            self.plate_table_view.setItemDelegateForColumn(column, CustomDelegate(self.plate_table_view, list(clip_names), default_val))
 
-                except Exception as e:
-                    cameraClipName = ""
+    def fill_empty_clip_names(self):
+        # Sequence rows without a clip name in their header, once the load is done
+        for row in range(self.plate_table_model.rowCount()):
+            if not self.plate_table_model.text(row, "Clip Name"):
+                self.set_read_only_cells(row, "Clip Name", "None")
 
-                if not filmlight and not cameraClipName:
-                    clip_name = os.path.basename(os.path.dirname(path))
-                    clip_names.append(clip_name)
-            else:
-                clip_name = os.path.basename(os.path.dirname(path))
-                clip_names.append(clip_name)
+    def run_thumb_thread(self, missing_thumbnails):
+        # Queued per row, the rows in view are generated first and each one is shown as soon as it is ready
+        if self.__is_edit:
+            model, view, scheduler = self.edit_table_model, self.edit_table_view, self.edit_thumbnails
+        else:
+            model, view, scheduler = self.plate_table_model, self.plate_table_view, self.plate_thumbnails
 
-            default_val = cameraClipName if cameraClipName else (filmlight if filmlight else "None")
+        for row, (input_path, thumb_key) in missing_thumbnails.items():
+            scheduler.submit(model.shot(row), input_path, thumb_key)
+        self.prioritize_visible_thumbnails(view, scheduler)
 
-            item = QTableWidgetItem(default_val)
-            item.setData(Qt.UserRole, clip_names)
-            self.plate_table_widget.setItem(idx, self.headers.index("Clip Name"), item)
+    def open_thumbnail_atlas(self, data_root):
+        self.close_thumbnail_atlas(self.__is_edit)
+        atlas = thumbnail_atlas.ThumbnailAtlas(data_root)
+        self.thumbnail_cache.add_atlas(atlas)
+        if self.__is_edit:
+            self.edit_atlas = atlas
+        else:
+            self.plate_atlas = atlas
+        return atlas
 
-            self.plate_table_widget.setItemDelegateForColumn(self.headers.index("Clip Name"), CustomDelegate(self.plate_table_widget, clip_names, default_val))
+    def close_thumbnail_atlas(self, is_edit):
+        atlas = self.edit_atlas if is_edit else self.plate_atlas
+        if not atlas:
+            return
+        atlas.close()
+        self.thumbnail_cache.remove_atlas(atlas)
+        if is_edit:
+            self.edit_atlas = None
+        else:
+            self.plate_atlas = None
+
+    def set_atlas_thumbnail(self, row, atlas, thumb_key, legacy_path):
+        """
+        Sets the row's thumbnail from the scan folder's atlas, False if it has to be generated.
+        A JPEG left in proxy_thumb by earlier versions is packed into the atlas on first load.
+        """
+        if thumb_key not in atlas:
+            if not os.path.isfile(legacy_path):
+                return False
+            with open(legacy_path, "rb") as f:
+                atlas.put(thumb_key, f.read())
+        self.set_thumbnail_column(row, atlas.ref(thumb_key))
+        return True
 
-            for row in range(self.plate_table_widget.rowCount()):
-                if not self.plate_table_widget.item(row, self.headers.index("Clip Name")):
-                    clip_name_item = QTableWidgetItem("None")
-                    self.set_read_only_cells(row, "Clip Name", clip_name_item)
+    def read_thumbnail_data(self, thumb_path):
+        # JPEG bytes of an atlas thumbnail (excel export), None for a plain file path
+        ref = thumbnail_atlas.split_ref(thumb_path)
+        if not ref:
+            return None
+        atlas = self.thumbnail_cache.atlas(ref[0])
+        return atlas.read(ref[1]) if atlas else None
 
-    def run_thumb_thread(self, missing_thumbnails):
-        self.progress_dialog = progress_dialog.ProgressDialog("Generating Thumbnails...", len(missing_thumbnails), self)
-        self.progress_dialog.show()
+    def prioritize_visible_thumbnails(self, view, scheduler):
+        if not scheduler.is_running():
+            return
+        model = view.model()
+        first_row = view.rowAt(0)
+        if first_row < 0:
+            return
+        last_row = view.rowAt(view.viewport().height())
+        if last_row < 0:
+            last_row = model.rowCount() - 1
+        scheduler.prioritize(model.shot(row) for row in range(first_row, last_row + 1))
+
+    def thumbnail_succeeded(self, model, atlas, shot, thumb_key, data):
+        atlas.put(thumb_key, data)
 
-        self.workers = []
-        self.thread_pool = QThreadPool.globalInstance()
-        self.__error_paths = ""
+        # Rows may have been sorted since the job was queued
+        row = model.row_of(shot)
+        if row is None:
+            return
+        thumb_path = atlas.ref(thumb_key)
+        self.thumbnail_cache.invalidate(thumb_path)
+        model.set_thumbnail(row, thumb_path)
+
+        # 'Cube' preview of a new thumbnail, or again if the cube was changed while it was made
+        if model is self.plate_table_model:
+            base_key = thumb_key.split(constants.CUBE_THUMBNAIL_SEPARATOR)[0]
+            if self.get_cube_thumbnail_key(base_key, shot.cube) != thumb_key:
+                self.update_cube_thumbnails([row])
+
+    def get_cube_thumbnail_key(self, thumb_key, cube_name):
+        if not cube_name or cube_name == "None" or not self.colorspace_cube_le.text():
+            return thumb_key
+        return f"{thumb_key}{constants.CUBE_THUMBNAIL_SEPARATOR}{cube_name}"
+
+    def update_cube_thumbnails(self, rows=None):
+        """
+        Shows each plate row's thumbnail with its 'Cube' LUT applied.
+        Previews are kept in the atlas next to the plain thumbnail, the missing ones and the ones
+        older than their .cube file are made on the thumbnail workers, rows in view first.
+        """
+        model = self.plate_table_model
+        cube_dir = self.colorspace_cube_le.text()
+        cube_mtimes = {}
+        if rows is None:
+            rows = range(model.rowCount())
 
-        self.result = {}
-        self.progress_count = 0
+        for row in rows:
+            shot = model.shot(row)
+            ref = thumbnail_atlas.split_ref(shot.thumbnail)
+            atlas = self.thumbnail_cache.atlas(ref[0]) if ref else None
+            if not atlas:
+                continue
+            thumb_key = ref[1].split(constants.CUBE_THUMBNAIL_SEPARATOR)[0]
+            cube_key = self.get_cube_thumbnail_key(thumb_key, shot.cube)
 
-        for row, (input_path, output_path) in missing_thumbnails.items():
-            worker = ThumbnailWorker(row, input_path, output_path, ffmpeg_manager.FFMPEGManager())
-            worker.signals.succeeded.connect(self.worker_succeeded)
-            worker.signals.error_occurred.connect(self.worker_error)
+            cube_path = None
+            if cube_key != thumb_key:
+                cube_path = os.path.join(cube_dir, shot.cube).replace(os.sep, "/")
+                if cube_path not in cube_mtimes:
+                    try:
+                        cube_mtimes[cube_path] = os.stat(cube_path).st_mtime_ns
+                    except OSError:
+                        logger.warning(f"Cube file not found: {cube_path}")
+                        cube_mtimes[cube_path] = None
+                if cube_mtimes[cube_path] is None:
+                    cube_key = thumb_key
+
+            # Up to date preview (newer than the .cube and the thumbnail), or the plain thumbnail
+            mtime = atlas.mtime(cube_key)
+            if mtime is not None and (
+                cube_key == thumb_key or mtime >= max(cube_mtimes[cube_path], atlas.mtime(thumb_key) or 0)
+            ):
+                if shot.thumbnail != atlas.ref(cube_key):
+                    model.set_thumbnail(row, atlas.ref(cube_key))
+                continue
 
-            self.workers.append(worker)
-            self.thread_pool.start(worker)
+            # Plain thumbnail until the preview is ready, made once the thumbnail itself is there
+            model.set_thumbnail(row, atlas.ref(thumb_key))
+            data = atlas.read(thumb_key)
+            if data:
+                self.plate_thumbnails.submit(shot, data, cube_key, cube_path)
 
-    def worker_succeeded(self, row, thumb_path):
-        self.result[row] = thumb_path
-        self.progress_count += 1
-        self.progress_dialog.progress_bar.setValue(self.progress_count)
-        
-        if self.progress_count == len(self.workers):
-            self.progress_dialog.close()
-            for row, thumb_path in self.result.items():
-                self.set_thumbnail_column(row, thumb_path)
-                
-    def worker_error(self, row, error_path):
-        self.__error_paths += f"{error_path}\n"
-        logger.error(f"Thread Error: {error_path}")
+        self.prioritize_visible_thumbnails(self.plate_table_view, self.plate_thumbnails)
 
-        if self.progress_count == len(self.workers):
-            self.progress_dialog.close()
-            QMessageBox.critical(self, "Error", f"Thumbnail 생성 중 오류가 발생했습니다:\n{self.__error_paths}")
-            logger.error(f"Errors occurred:\n{self.__error_paths}")
+    def thumbnail_progress(self, done, total):
+        self.status_bar.showMessage(f"Generating Thumbnails... {done}/{total}")
 
-    def update_progress(self, value):
-        self.progress_dialog.progress_bar.setValue(value)
+    def thumbnail_finished(self, atlas, error_paths):
+        self.status_bar.clearMessage()
+        if atlas:
+            atlas.flush()
+        if not error_paths:
+            return
+        error_paths = "\n".join(error_paths)
+        logger.error(f"Errors occurred:\n{error_paths}")
+        QMessageBox.critical(self, "Error", f"Thumbnail 생성 중 오류가 발생했습니다:\n{error_paths}")
                     
     def set_excel_list(self, folder):
         if self.__is_edit:
@@ -918,207 +1291,141 @@ class IOManager(ui.IOManager_UI):
         
         return excel_list
     
-    def check_image_sequence(self, folder) -> tuple:
+    def check_image_sequences(self, folder):
         if not os.path.exists(folder):
-            return set()
-        
-        image_files = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
-        
-        supported_files = [f for f in image_files if f.endswith(tuple(self.seq_types))]
-        
-        if not supported_files:
-            return set()
+            return []
 
-        pattern = re.compile(r"(.+?)(\d+)(\.\w+)$")
-        frame_numbers = []
-        frame_to_path = {}
-        
-        for f in supported_files:
-            match = pattern.match(f)
-            if match:
-                frame_number = match.group(2)
-                frame_numbers.append(frame_number)
-                frame_to_path[int(frame_number)] = os.path.join(folder, f).replace(os.sep, "/")
+        sequences = sequence_manager.scan_image_sequences(folder, self.seq_types)
+        for sequence in sequences:
+            if sequence.missing:
+                logger.warning(f"Missing frames found in {folder}/{sequence.label}: {sequence_manager.format_ranges(sequence.missing)}")
 
-        # if no frame numbers found, return None for frames
-        if not frame_numbers:
-            return set()
+        return sequences
 
-        # if only one frame found, return the frame number and path
-        try:
-            if len(frame_numbers) == 1:
-                single_frame_path = frame_to_path[frame_numbers[0]]
-                return (frame_numbers[0], frame_numbers[0], single_frame_path)
-        except Exception as e:
-            logger.error(traceback.format_exc())
-            QMessageBox.critical(self, "Error", "스캔 폴더에 이미지 시퀀스가 아닌 파일이 있습니다.")
-            return set()
-
-        frame_numbers.sort(key=int)
-
-        # check for missing frames
-        missing_frame_paths = []
-        for i in range(len(frame_numbers) - 1):
-            if int(frame_numbers[i+1]) != int(frame_numbers[i]) + 1:
-                missing_frame_paths.append(folder)
-
-        # if missing frames found, show a warning message and return None for frames
-        if missing_frame_paths:
-            msg = "\n".join(missing_frame_paths)
-            QMessageBox.critical(self, "Error", f"이미지 시퀀스에 누락된 프레임이 있습니다:\n{msg}")
-            logger.warning(f"Missing frames found in {missing_frame_paths}")
-            return None
+    def set_missing_frames(self, row, sequence):
+        if not sequence.missing:
+            # Frames filled in since the last load
+            for col_name in ["Scan Data", "Org Range"]:
+                self.plate_table_model.set_cell_role(row, col_name, Qt.ToolTipRole, None)
+                self.plate_table_model.set_cell_role(row, col_name, Qt.ForegroundRole, None)
+            return
 
-        if frame_numbers:
-            start_frame = min(frame_numbers)
-            end_frame = max(frame_numbers)
-            return (start_frame, end_frame, frame_to_path)
-        
-        return set()
-        
-    def set_read_only_cells(self, row, col_name, item):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
-        
-        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-        item.setBackgroundColor(QColor(30, 30, 30))
-        table.setItem(row, headers.index(col_name), item)
+        missing_ranges = sequence_manager.format_ranges(sequence.missing)
+        missing_count = sum(last - first + 1 for first, last in sequence.missing)
+        tooltip = f"누락된 프레임 ({missing_count}): {missing_ranges}"
+
+        for col_name in ["Scan Data", "Org Range"]:
+            self.plate_table_model.set_cell_role(row, col_name, Qt.ToolTipRole, tooltip)
+            self.plate_table_model.set_cell_role(row, col_name, Qt.ForegroundRole, QColor(255, 80, 80))
+
+    def get_folder_sequences(self, folder):
+        """
+        Sequences of a folder, from the scan index while the folder is unchanged.
+        Runs on the probe pool while loading.
+        """
+        index = self.scan_index
+        sequences = index.folder_sequences(folder) if index else None
+        if sequences is None:
+            mtime = scan_index.folder_mtime(folder)
+            sequences = self.check_image_sequences(folder)
+            if index:
+                index.set_folder_sequences(folder, mtime, sequences)
+        return sequences
+
+    def get_scan_sequence(self, scan_data):
+        """
+        Sequence of a 'Scan Data' row, from the loaded rows, the scan index or by scanning its folder.
+        """
+        sequence = self.__sequences.get(scan_data)
+        if sequence:
+            return sequence
+
+        data_root = self.scan_folder_le.text()
+        if self.scan_index and self.scan_index.is_root(data_root):
+            sequence = self.scan_index.sequence(scan_data)
+            if sequence:
+                return sequence
+
+        data_path = os.path.join(data_root, scan_data)
+        if not os.path.isdir(data_path):
+            return None
+        sequences = self.get_folder_sequences(data_path)
+        return sequences[0] if len(sequences) == 1 else None
+
+    def find_scan_mov(self, data_root, scan_name):
+        """
+        Path of the first MOV of the scan folder named after scan_name, "" if there is none.
+        The scan index has the folder's MOVs while it is unchanged, it is listed again otherwise.
+        """
+        index = self.scan_index
+        mov_names = index.mov_names() if index and index.is_root(data_root) else None
+        if mov_names is None:
+            mov_names = sorted(f for f in os.listdir(data_root) if f.lower().endswith(".mov"))
+        valid_mov = [f for f in mov_names if f.startswith(scan_name)]
+        return os.path.join(data_root, valid_mov[0]) if valid_mov else ""
+        
+    def set_read_only_cells(self, row, col_name, text):
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
+        model.set_text(row, col_name, text, read_only=True)
             
     def set_frame_columns(self, row, start_frame, end_frame):
         if not start_frame or not end_frame:
             return
         
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
+        start_frame, end_frame = int(start_frame), int(end_frame)
+        
         # Set 'Start Frame' Column
-        start_frame_item = QTableWidgetItem(str(int(start_frame)))
-        self.set_read_only_cells(row, "Start Frame", start_frame_item)
+        model.set_value(row, "Start Frame", start_frame, read_only=True)
         
         # Set 'End Frame' Column
-        end_frame_item = QTableWidgetItem(str(int(end_frame)))
-        self.set_read_only_cells(row, "End Frame", end_frame_item)
+        model.set_value(row, "End Frame", end_frame, read_only=True)
     
         # Set 'Duration' Column 
-        duration = int(end_frame) - int(start_frame) + 1
-        duration_item = QTableWidgetItem(str(duration))
-        self.set_read_only_cells(row, "Duration", duration_item)
-        
-        # Set 'Org Range' Column
-        org_range = f"{int(start_frame)}-{int(end_frame)}\n({duration})"
-        org_range_item = QTableWidgetItem(org_range)
-        self.set_read_only_cells(row, "Org Range", org_range_item)
-    
-    def set_timecode_columns(self, row, start_frame_path, end_frame_path):
-        if self.__is_edit:
-            headers = self.edit_headers
-        else:
-            headers = self.headers
-        
-        # Get TimeCode
-        start_tc, end_tc = self.get_timecode_metadata(start_frame_path, end_frame_path)
+        model.set_value(row, "Duration", end_frame - start_frame + 1, read_only=True)
         
+        # Set 'Org Range' Column, shown as "1001-1100\n(100)"
+        model.set_value(row, "Org Range", (start_frame, end_frame), read_only=True)
+    
+    def set_timecode_columns(self, row, start_tc, end_tc):
         if not start_tc or not end_tc:
             return
         
         # Set 'TimeCode In' Column
-        self.set_timecode_item(row, headers.index("TimeCode In"), start_tc)
+        self.set_timecode_item(row, "TimeCode In", start_tc)
         
         # Set 'TimeCode Out' Column
-        self.set_timecode_item(row, headers.index("TimeCode Out"), end_tc)
+        self.set_timecode_item(row, "TimeCode Out", end_tc)
             
-    def get_timecode_metadata(self, start_frame_path, end_frame_path):
-        if not os.path.exists(start_frame_path) or not os.path.exists(end_frame_path):
-            logger.warning(
-                f"Start or End Frame Path not exists.\n Start Frame: {start_frame_path}\n End Frame: {end_frame_path}"
-                )
-            return None, None
-        
-        file_format = os.path.splitext(start_frame_path)[-1]
-        if file_format == ".exr":
-            start_metadata = OpenEXR.InputFile(start_frame_path).header()
-            end_metadata = OpenEXR.InputFile(end_frame_path).header()
-            start_timecode = start_metadata.get("timeCode", None)
-            end_timecode = end_metadata.get("timeCode", None)
-            
-            if not start_timecode or not end_timecode:
-                return None, None
-            
-            return start_timecode, end_timecode
-        
-        elif file_format == ".dpx":
-            try:
-                metadata = pydpx_meta.DpxHeader(start_frame_path)
-                timecode = metadata.tv_header.time_code
-                if timecode:
-                    return timecode
-            except:
-                return None, None
-        
-        else:
-            return None, None
-        
-    def set_timecode_item(self, row, col, timecode):
-        if self.__is_edit:
-            table = self.edit_table_widget
-        else:
-            table = self.plate_table_widget
+    def set_timecode_item(self, row, col_name, timecode):
         try:
-            timecode_str = f"{timecode.hours:02d}:{timecode.minutes:02d}:{timecode.seconds:02d}:{timecode.frame:02d}" if isinstance(timecode, Imath.TimeCode) else timecode
-            timecode_item = QTableWidgetItem(str(timecode_str))
-            timecode_item.setFlags(timecode_item.flags() & ~Qt.ItemIsEditable)
-            timecode_item.setBackgroundColor(QColor(30, 30, 30))
-            table.setItem(row, col, timecode_item)
+            self.set_read_only_cells(row, col_name, str(timecode))
         except Exception as e:
             logger.error(traceback.format_exc())
-            timecode_item = QTableWidgetItem("")
-            timecode_item.setFlags(timecode_item.flags() & ~Qt.ItemIsEditable)
-            timecode_item.setBackgroundColor(QColor(30, 30, 30))
-            table.setItem(row, col, timecode_item)
+            self.set_read_only_cells(row, col_name, "")
             
     def set_thumbnail_column(self, row, thumb_path):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
             
-        if not os.path.exists(thumb_path):
+        if not self.thumbnail_cache.exists(thumb_path):
             logger.warning(f"Thumbnail not found: {thumb_path}")
             return
         
-        thumb_pixmap = QPixmap(thumb_path)
-        if thumb_pixmap.isNull():
-            logger.warning(f"Thumbnail is null: {thumb_path}")
-            return
-        
-        thumb_lb = QLabel()
-        thumb_pixmap = thumb_pixmap.scaledToWidth(table.columnWidth(headers.index("Thumbnail")))
-        thumb_lb.setPixmap(thumb_pixmap)
-        thumb_lb.setScaledContents(True)
-        thumb_widget = QWidget()
-        thumb_layout = QHBoxLayout(thumb_widget)
-        thumb_layout.setAlignment(Qt.AlignCenter)
-        thumb_layout.setContentsMargins(0, 0, 0, 0)
-        thumb_layout.addWidget(thumb_lb)
-        table.setCellWidget(row, headers.index("Thumbnail"), thumb_widget)
-        table.model().setData(table.model().index(row, headers.index("Thumbnail")), thumb_path)
+        # Drawn by the 'Thumbnail' column delegate when the row comes into view,
+        # the file may have been regenerated so the cached pixmap is checked against its mtime again
+        self.thumbnail_cache.invalidate(thumb_path)
+        model.set_thumbnail(row, thumb_path)
     
-    @disconnect_table_event
     def load_excel_file(self):
         if self.__is_edit:
             folder = self.edit_scan_folder_le.text()
-            table = self.edit_table_widget
-            headers = self.edit_headers
+            model = self.edit_table_model
             excel_file = self.edit_excel_file_cmbx.currentText()
             read_only_table = self.headers_readonly_table.copy()
             read_only_table.append("Type")
         else:
             folder = self.scan_folder_le.text()
-            table = self.plate_table_widget
-            headers = self.headers
+            model = self.plate_table_model
             excel_file = self.excel_file_cmbx.currentText()
             read_only_table = self.headers_readonly_table
         
@@ -1140,9 +1447,7 @@ class IOManager(ui.IOManager_UI):
             df = self.excel_manager.load_excel(self, excel_path, not self.__is_edit)
             
             # Set Table Data
-            table.clearContents()
-            table.setRowCount(len(df))
-            table.setColumnCount(len(df.columns))
+            model.set_row_count(len(df))
             
             for row in range(len(df)):
                 for col in df.columns:
@@ -1152,34 +1457,25 @@ class IOManager(ui.IOManager_UI):
                         
                     # Set Columns
                     if col == "Render":
-                        render_widget = QWidget()
-                        render_layout = QHBoxLayout(render_widget)
-                        render_layout.setAlignment(Qt.AlignCenter)
-                        render_layout.setContentsMargins(0, 0, 0, 0)
-                        render_ckbx = QCheckBox()
-                        render_ckbx.setChecked(bool(value))
-                        render_ckbx.setStyleSheet("QCheckBox::indicator { margin-left: 8; margin-right: 0; }")
-                        render_layout.addWidget(render_ckbx)
-                        table.setCellWidget(row, headers.index("Render"), render_widget)
+                        model.set_checked(row, bool(value))
                     elif col == "Thumbnail":
                         self.set_thumbnail_column(row, value)
                     elif col.startswith("Start Frame -") or col == "Start Frame":
-                        item = QTableWidgetItem(str(value))
-                        self.set_read_only_cells(row, "Start Frame", item)
+                        self.set_read_only_cells(row, "Start Frame", str(value))
                     elif col == "Camera Model" or col == "Lens mm" or col == "Camera FPS":
                         continue
                     elif col == "Clip Name" and not self.__is_edit:
-                        item = QTableWidgetItem(str(value))
-                        self.set_read_only_cells(row, "Clip Name", item)
+                        self.set_read_only_cells(row, "Clip Name", str(value))
                     else:
-                        item = QTableWidgetItem(str(value))
-                        table.setItem(row, headers.index(col), item)
+                        model.set_text(row, col, str(value))
         except Exception as e:
             self.loading_dialog.hide()
             QMessageBox.critical(self, "Error", f"엑셀 파일을 불러오는 중 오류가 발생했습니다:\n{e}")
             logger.error(traceback.format_exc())
             return
         
+        if not self.__is_edit:
+            self.update_cube_thumbnails()
         self.loading_dialog.hide()
             
     def create_excel_file(self):
@@ -1188,8 +1484,9 @@ class IOManager(ui.IOManager_UI):
         if not self.__is_edit:
             tab = "plate"
         data_root = self.scan_folder_le.text()
-        row_cnt = self.plate_table_widget.rowCount()
-        col_cnt = self.plate_table_widget.columnCount()
+        model = self.plate_table_model
+        row_cnt = model.rowCount()
+        col_cnt = model.columnCount()
         
         if row_cnt == 0 or col_cnt == 0:
             QMessageBox.warning(self, "Warning", "데이터가 없습니다.")
@@ -1221,28 +1518,25 @@ class IOManager(ui.IOManager_UI):
             for header in __header_list:
                 # Set Start Frame
                 if header.startswith("Start Frame -"):
-                    value = self.plate_table_widget.item(row, self.headers.index("Start Frame")).text()
+                    value = model.text(row, "Start Frame")
                     result[header] = value
                     continue
                 
                 # Set Other Columns
-                col = self.headers.index(header)
-                if col == self.headers.index("Render"):    
-                    render = self.plate_table_widget.cellWidget(row, col)
-                    ckbx = render.findChild(QCheckBox)
-                    value = ckbx.isChecked()
-                elif col == self.headers.index("Thumbnail"):
-                    value = self.plate_table_widget.model().data(self.plate_table_widget.model().index(row, col))
+                if header == "Render":
+                    value = model.is_checked(row)
+                elif header == "Thumbnail":
+                    value = model.thumbnail(row)
                 else:
-                    try:
-                        value = self.plate_table_widget.item(row, col).text()
-                    except:
-                        value = ""
-                result[self.headers[col]] = value
+                    value = model.text(row, header)
+                result[header] = value
             data.append(result)
             
         try:
-            excel_path = self.excel_manager.make_excel(self, data_root, row_cnt, col_cnt, excel_file, data, tab, start_frame_header)
+            excel_path = self.excel_manager.make_excel(
+                self, data_root, row_cnt, col_cnt, excel_file, data, tab, start_frame_header,
+                thumbnail_reader=self.read_thumbnail_data
+                )
         except Exception as e:
             logger.error(traceback.format_exc())
             QMessageBox.critical(self, "Error", f"엑셀 파일을 생성하는 중 오류가 발생했습니다:\n{e}")
@@ -1257,8 +1551,9 @@ class IOManager(ui.IOManager_UI):
             tab = "edit"
 
         data_root = self.edit_scan_folder_le.text()
-        row_cnt = self.edit_table_widget.rowCount()
-        col_cnt = self.edit_table_widget.columnCount()
+        model = self.edit_table_model
+        row_cnt = model.rowCount()
+        col_cnt = model.columnCount()
         headers = self.edit_headers
         
         if row_cnt == 0 or col_cnt == 0:
@@ -1279,23 +1574,20 @@ class IOManager(ui.IOManager_UI):
         for row in range(row_cnt):
             result = {}
             for header in headers:
-                col = headers.index(header)
-                if col == headers.index("Render"):
-                    render = self.edit_table_widget.cellWidget(row, col)
-                    ckbx = render.findChild(QCheckBox)
-                    value = ckbx.isChecked()
-                elif col == headers.index("Thumbnail"):
-                    value = self.edit_table_widget.model().data(self.edit_table_widget.model().index(row, col))
+                if header == "Render":
+                    value = model.is_checked(row)
+                elif header == "Thumbnail":
+                    value = model.thumbnail(row)
                 else:
-                    try:
-                        value = self.edit_table_widget.item(row, col).text()
-                    except:
-                        value = ""
-                result[headers[col]] = value
+                    value = model.text(row, header)
+                result[header] = value
             data.append(result)
             
         try:
-            excel_path = self.excel_manager.make_excel(self, data_root, row_cnt, col_cnt, excel_file, data, tab)
+            excel_path = self.excel_manager.make_excel(
+                self, data_root, row_cnt, col_cnt, excel_file, data, tab,
+                thumbnail_reader=self.read_thumbnail_data
+                )
         except Exception as e:
             logger.error(traceback.format_exc())
             QMessageBox.critical(self, "Error", f"엑셀 파일을 생성하는 중 오류가 발생했습니다:\n{e}")
@@ -1307,9 +1599,8 @@ class IOManager(ui.IOManager_UI):
     def toggle_edit_type(self):
         current_type = self.edit_task_cmbx.currentText()
         
-        for row in range(self.edit_table_widget.rowCount()):
-            type_item = QTableWidgetItem(current_type)
-            self.set_read_only_cells(row, "Type", type_item)
+        for row in range(self.edit_table_model.rowCount()):
+            self.set_read_only_cells(row, "Type", current_type)
 
     def table_context_menu(self, pos):
         # Table Context Menu
@@ -1326,7 +1617,7 @@ class IOManager(ui.IOManager_UI):
         self.table_menu.addSeparator()
         self.reload_scan_action = self.table_menu.addAction("Reload Scan Folder")
         
-        action = self.table_menu.exec_(self.plate_table_widget.mapToGlobal(pos))
+        action = self.table_menu.exec_(self.plate_table_view.mapToGlobal(pos))
         if action == self.open_action:
             self.open_scan_folder()
         elif action == self.check_selected_action:
@@ -1340,9 +1631,9 @@ class IOManager(ui.IOManager_UI):
         elif action == self.reload_scan_action:
             self.reload_scan_folder()
             
-    @disconnect_table_event
-    def table_item_changed(self, item):
-        row, col = item.row(), item.column()
+    def table_item_changed(self, row, col):
+        model = self.plate_table_model
+        shot = model.shot(row)
         try:
             header = self.headers[col]
         except:
@@ -1352,138 +1643,111 @@ class IOManager(ui.IOManager_UI):
             "Retime End Frame", "Retime TimeCode Out", "Retime Speed"
             ]
         
+        # Show the thumbnail with the new cube
+        if header == "Cube":
+            self.update_cube_thumbnails([row])
+            return
+        
         # Check if header is in handling list
         if header not in handling_list:
             return
         
-        # Check if item is empty
-        if not item.text():
+        # Check if item is empty, non-numeric text is already rejected by the model
+        if not model.text(row, header):
             return
         
-        # Check if item is a number
-        if not header == "Retime TimeCode Out":
-            try:
-                float(item.text())
-            except ValueError:
-                self.plate_table_widget.item(row, col).setText("")
-                return
-        
-        # Get Items
-        start_frame_item = self.plate_table_widget.item(row, self.headers.index("Start Frame"))
-        end_frame_item = self.plate_table_widget.item(row, self.headers.index("End Frame"))
-        duration_item = self.plate_table_widget.item(row, self.headers.index("Duration"))
-        frame_handle_item = self.plate_table_widget.item(row, self.headers.index("Frame Handle"))
-        offset_first_item = self.plate_table_widget.item(row, self.headers.index("First Frame Offset"))
-        offset_end_item = self.plate_table_widget.item(row, self.headers.index("End Frame Offset"))
-        retime_end_frame_item = self.plate_table_widget.item(row, self.headers.index("Retime End Frame"))
-        retime_end_tc_item = self.plate_table_widget.item(row, self.headers.index("Retime TimeCode Out"))
-        retime_speed_item = self.plate_table_widget.item(row, self.headers.index("Retime Speed"))
-        
         # Get Values
-        start_frame = int(start_frame_item.text())
-        offset_first = int(offset_first_item.text()) if offset_first_item.text() else 0
-        offset_end = int(offset_end_item.text()) if offset_end_item.text() else 0
-        org_range = self.plate_table_widget.item(row, self.headers.index("Org Range")).text()
-        org_duration = int(org_range.split("(")[1].replace(")", ""))
-        new_end_frame = int(end_frame_item.text()) if end_frame_item.text() else 0
+        start_frame = shot.start_frame
+        offset_first = shot.first_frame_offset or 0
+        offset_end = shot.end_frame_offset or 0
+        org_duration = shot.org_duration
+        new_end_frame = shot.end_frame or 0
+        if start_frame is None or org_duration is None:
+            return
         
         # If Start Frame Changed
         if header == "Start Frame":
             # Get Data
-            start_frame = int(item.text())
+            start_frame = shot.value(header)
             frame_handle = self.render_start_frame_spbx.value() - start_frame
-            duration = int(duration_item.text()) if duration_item.text() else 1
+            duration = shot.duration or 1
             end_frame = start_frame + duration - 1
             
             # Set Data
-            end_frame_item.setText(str(end_frame))
-            frame_handle_item.setText(str(frame_handle))
-            retime_end_frame = retime_end_frame_item.text()
-            if retime_end_frame:
-                retime_end_frame_item.setText(str(end_frame))
+            model.set_value(row, "End Frame", end_frame)
+            model.set_value(row, "Frame Handle", frame_handle)
+            if shot.retime_end_frame is not None:
+                model.set_value(row, "Retime End Frame", end_frame)
         
         # If Frame Handle Changed
         elif header == "Frame Handle":
             # Get Data
-            start_frame = int(start_frame_item.text())
-            frame_handle = int(item.text()) if item.text() else 0
+            start_frame = shot.start_frame
+            frame_handle = shot.value(header) or 0
             start_frame_handle = int(self.render_start_frame_spbx.value()) - frame_handle
-            duration = int(duration_item.text()) if duration_item.text() else 1
+            duration = shot.duration or 1
             end_frame_handle = start_frame_handle + duration - 1
             
-            start_frame_item.setText(str(start_frame_handle))
-            end_frame_item.setText(str(end_frame_handle))
-            retime_end_frame = retime_end_frame_item.text()
-            if retime_end_frame:
-                retime_end_frame_item.setText(str(end_frame_handle))
+            model.set_value(row, "Start Frame", start_frame_handle)
+            model.set_value(row, "End Frame", end_frame_handle)
+            if shot.retime_end_frame is not None:
+                model.set_value(row, "Retime End Frame", end_frame_handle)
         
         # If First Frame Offset Changed
         elif header == "First Frame Offset":
-            try:
-                offset_first = int(item.text())
-            except:
-                offset_first = int(float(item.text())) if item.text() else 0
-                offset_first_item.setText(str(offset_first))
+            offset_first = shot.value(header) or 0
 
             new_end_frame = start_frame + org_duration - 1 - offset_first - offset_end
             # Check if new end frame is valid
             if new_end_frame < start_frame or offset_first < 0:
-                offset_first_item.setText("")
+                model.set_text(row, "First Frame Offset", "")
                 new_end_frame = start_frame + org_duration - 1
             self.clear_retime_items(row)
             
         # If End Frame Offset Changed   
         elif header == "End Frame Offset":
-            try:
-                offset_end = int(item.text())
-            except:
-                offset_end = int(float(item.text())) if item.text() else 0
-                offset_end_item.setText(str(offset_end))
+            offset_end = shot.value(header) or 0
 
             new_end_frame = start_frame + org_duration - 1 - offset_first - offset_end
             # Check if new end frame is valid
             if new_end_frame < start_frame or offset_end < 0:
-                offset_end_item.setText("")
+                model.set_text(row, "End Frame Offset", "")
                 new_end_frame = start_frame + org_duration - 1 - offset_first
             self.clear_retime_items(row)
             
         # If Retime End Frame Changed  
         elif header == "Retime End Frame":
             # clear retime timecode out and retime speed
-            retime_end_tc_item.setText("")
-            retime_speed_item.setText("")
+            model.set_text(row, "Retime TimeCode Out", "")
+            model.set_text(row, "Retime Speed", "")
             
-            try:
-                new_end_frame = int(item.text())
-            except:
-                new_end_frame = int(float(item.text())) if item.text() else 0
-                retime_end_frame_item.setText(str(new_end_frame))
+            new_end_frame = shot.value(header) or 0
 
             new_duration = new_end_frame - start_frame + 1
             # Check if new duration is valid
             if new_duration < 1:
                 new_end_frame = start_frame + org_duration - 1 - offset_first - offset_end
-                retime_speed_item.setText("")
-                retime_end_frame_item.setText("")
+                model.set_text(row, "Retime Speed", "")
+                model.set_text(row, "Retime End Frame", "")
             else:
                 retime_speed = round((org_duration - offset_first - offset_end) / new_duration, 3)
-                retime_speed_item.setText(str(retime_speed))
-            retime_end_tc_item.setText("")
+                model.set_value(row, "Retime Speed", retime_speed)
+            model.set_text(row, "Retime TimeCode Out", "")
         
         # If Retime TimeCode Out Changed  
         elif header == "Retime TimeCode Out":
             # clear retime end frame and retime speed
-            retime_end_frame_item.setText("")
-            retime_speed_item.setText("")
+            model.set_text(row, "Retime End Frame", "")
+            model.set_text(row, "Retime Speed", "")
             
             new_end_frame = 0
-            if not item.text():
+            if not model.text(row, header):
                 new_end_frame = start_frame + org_duration - 1 - offset_first - offset_end
                 self.clear_retime_items(row)
                 return
             
             # Check timecode is valid
-            new_end_tc = item.text()
+            new_end_tc = model.text(row, header)
             if not re.match(r"^\d{2}:\d{2}:\d{2}:\d{2}$", new_end_tc):
                 self.clear_retime_items(row)
                 return
@@ -1493,27 +1757,22 @@ class IOManager(ui.IOManager_UI):
             
             # Get Sequence data
             data_root = self.scan_folder_le.text().replace(os.sep, "/")
-            scan_name = self.plate_table_widget.item(row, self.headers.index("Scan Data")).text() if self.plate_table_widget.item(row, self.headers.index("Scan Data")) else None
+            scan_name = model.text(row, "Scan Data")
             if not scan_name:
                 logger.warning("Scan Data not found.")
                 QMessageBox.warning(self, "Warning", "Scan Data가 없습니다.")
                 return
             
             data_path = os.path.join(data_root, scan_name)
+            sequence = self.get_scan_sequence(scan_name)
             # if data_path is sequence root
-            if os.path.isdir(data_path):
-                sequence_info = self.check_image_sequence(data_path)
-                if not sequence_info:
+            if sequence or os.path.isdir(data_path):
+                if not sequence:
                     logger.warning(f"Sequence not found in {data_path}")
                     QMessageBox.warning(self, "Warning", "시퀀스를 찾을 수 없습니다.")
                     return
 
-                _start_frame, _end_frame, _frame_to_path = sequence_info
-                _start_frame_path, _end_frame_path = _frame_to_path[int(_start_frame)], _frame_to_path[int(_end_frame)]
-                if not _start_frame or not _end_frame:
-                    logger.warning(f"Sequence not found in {data_path}")
-                    QMessageBox.warning(self, "Warning", "시퀀스를 찾을 수 없습니다.")
-                    return
+                _start_frame_path = sequence.start_path
                 
                 filename = os.path.basename(_start_frame_path)
                 seq_timecode = ""
@@ -1522,14 +1781,12 @@ class IOManager(ui.IOManager_UI):
                     seq_timecode = Timecode(f"{self.render_fps_spbx.value()}", _dpx.tv_header.time_code)
                     
                 elif filename.endswith(".exr"):
-                    _exr = OpenEXR.InputFile(_start_frame_path)
-                    _tc_obj = _exr.header().get("timeCode", None)
-                    if not _tc_obj:
+                    tc_str = exr_manager.read_exr_header(_start_frame_path).timecode
+                    if not tc_str:
                         logger.warning(f"TimeCode not found in {_start_frame_path}")
                         QMessageBox.warning(self, "Warning", "TimeCode를 찾을 수 없습니다.")
                         return
                     
-                    tc_str = f"{_tc_obj.hours:02d}:{_tc_obj.minutes:02d}:{_tc_obj.seconds:02d}:{_tc_obj.frame:02d}"
                     seq_timecode = Timecode(f"{self.render_fps_spbx.value()}", tc_str)
                     
                 if not seq_timecode:
@@ -1546,22 +1803,20 @@ class IOManager(ui.IOManager_UI):
                 retime_speed = round((org_duration - offset_first - offset_end) / new_duration, 3)
                 new_end_frame = start_frame + new_duration - 1
                 
-                retime_speed_item.setText(str(retime_speed))
-                retime_end_frame_item.setText(str(new_end_frame))
+                model.set_value(row, "Retime Speed", retime_speed)
+                model.set_value(row, "Retime End Frame", new_end_frame)
                 
             # Get Mov Data   
             else:
-                valid_mov = [f for f in os.listdir(data_root) if f.startswith(scan_name) and f.endswith(".mov")]
-                valid_mov.sort()
-                if not valid_mov:
+                mov_path = self.find_scan_mov(data_root, scan_name).replace("/", os.sep)
+                if not mov_path:
                     logger.warning(f"Valid mov not found in {data_root}")
                     return
                 
-                mov_path = os.path.join(data_root, valid_mov[0]).replace("/", os.sep)
-                
                 # Get Metadata
-                metadata = self.ffmpeg_io.extract_mov_metadata(mov_path)
-                if not metadata:
+                metadata = self.probe_manager.probe_mov(mov_path)
+                # A failed probe still returns the clip name, but no duration
+                if not metadata.get("duration"):
                     logger.warning(f"Metadata not found in {mov_path}")
                     return
                 
@@ -1585,73 +1840,60 @@ class IOManager(ui.IOManager_UI):
                     retime_speed = round((org_duration - offset_first - offset_end) / new_duration, 3)
                     new_end_frame = start_frame + new_duration - 1
                     
-                    retime_speed_item.setText(str(retime_speed))
-                    retime_end_frame_item.setText(str(new_end_frame))
+                    model.set_value(row, "Retime Speed", retime_speed)
+                    model.set_value(row, "Retime End Frame", new_end_frame)
                     
         # If Retime Speed Changed  
         elif header == "Retime Speed":
             # clear retime end frame and retime timecode out
-            retime_end_frame_item.setText("")
-            retime_end_tc_item.setText("")
-            try:
-                retime_speed = float(item.text()) if item.text() else 1
-            except:
-                retime_speed = 1
+            model.set_text(row, "Retime End Frame", "")
+            model.set_text(row, "Retime TimeCode Out", "")
+            retime_speed = shot.retime_speed if shot.retime_speed is not None else 1
             
             if retime_speed > 0:
                 new_end_frame = (org_duration - offset_first - offset_end + (retime_speed * start_frame) - retime_speed) / retime_speed
             else:
                 new_end_frame = start_frame + org_duration - 1 - offset_first - offset_end
                 
-            retime_end_frame_item.setText(str(math.ceil(new_end_frame)))
-            retime_end_tc_item.setText("")
+            model.set_value(row, "Retime End Frame", math.ceil(new_end_frame))
+            model.set_text(row, "Retime TimeCode Out", "")
 
-        end_frame_item.setText(str(math.ceil(new_end_frame)))
-        duration_item.setText(str(math.ceil(new_end_frame) - start_frame + 1))
+        model.set_value(row, "End Frame", math.ceil(new_end_frame))
+        model.set_value(row, "Duration", math.ceil(new_end_frame) - start_frame + 1)
         
-    def edit_table_item_changed(self, item):
-        row, col = item.row(), item.column()
+    def edit_table_item_changed(self, row, col):
+        model = self.edit_table_model
+        shot = model.shot(row)
         header = self.edit_headers[col]
 
         if not header in ["Frame Handle", "First Frame Offset", "End Frame Offset"]:
             return
 
-        try:
-            value = float(item.text())
-        except ValueError:
-            self.edit_table_widget.item(row, col).setText("")
+        value = shot.value(header)
+        if value is None or shot.org_duration is None:
             return
 
-        # Get all items
-        start_frame_item = self.edit_table_widget.item(row, self.edit_headers.index("Start Frame"))
-        end_frame_item = self.edit_table_widget.item(row, self.edit_headers.index("End Frame"))
-        duration_item = self.edit_table_widget.item(row, self.edit_headers.index("Duration"))
-        frame_handle_item = self.edit_table_widget.item(row, self.edit_headers.index("Frame Handle"))
-        org_range = self.edit_table_widget.item(row, self.edit_headers.index("Org Range")).text()
-        first_frame_offset_item = self.edit_table_widget.item(row, self.edit_headers.index("First Frame Offset"))
-        end_frame_offset_item = self.edit_table_widget.item(row, self.edit_headers.index("End Frame Offset"))
-        
-        # Parse data
-        org_duration = int(org_range.split("(")[1].replace(")", ""))
-        start_frame = int(org_range.split("-")[0]) 
-        end_frame = int(org_range.split("-")[1].split("\n")[0])
-        frame_handle = int(frame_handle_item.text()) if frame_handle_item.text() else 0
-        first_frame_offset = int(first_frame_offset_item.text()) if first_frame_offset_item.text() else 0
-        end_frame_offset = int(end_frame_offset_item.text()) if end_frame_offset_item.text() else 0
+        # Get data
+        org_duration = shot.org_duration
+        start_frame = shot.org_first
+        end_frame = shot.org_last
+        frame_handle = shot.frame_handle or 0
+        first_frame_offset = shot.first_frame_offset or 0
+        end_frame_offset = shot.end_frame_offset or 0
 
 
         if frame_handle == 0 and first_frame_offset == 0 and end_frame_offset == 0:
             print("All offsets and frame handle are 0, using original range.")
-            start_frame = int(org_range.split("-")[0]) 
-            end_frame = int(org_range.split("-")[1].split("\n")[0])
-            start_frame_item.setText(str(start_frame))
-            end_frame_item.setText(str(end_frame))
+            start_frame = shot.org_first
+            end_frame = shot.org_last
+            model.set_value(row, "Start Frame", start_frame)
+            model.set_value(row, "End Frame", end_frame)
 
         if header == "Frame Handle":
             if value > 0 and (first_frame_offset > 0 or end_frame_offset > 0):
                 QMessageBox.warning(self, "Warning", "Frame Handle을 변경하면 \nFirst Frame Offset과 End Frame Offset은 적용되지 않습니다.")
-                first_frame_offset_item.setText("0")
-                end_frame_offset_item.setText("0")
+                model.set_value(row, "First Frame Offset", 0)
+                model.set_value(row, "End Frame Offset", 0)
                 return
 
             frame_handle = int(value)
@@ -1661,7 +1903,7 @@ class IOManager(ui.IOManager_UI):
         elif header in ["First Frame Offset", "End Frame Offset"]:
             if value > 0 and frame_handle > 0 :
                 QMessageBox.warning(self, "Warning", f"{header}을 변경하면 \nFrame Handle은 적용되지 않습니다.")
-                frame_handle_item.setText("0")
+                model.set_value(row, "Frame Handle", 0)
                 return
             
             if header == "First Frame Offset":
@@ -1677,40 +1919,33 @@ class IOManager(ui.IOManager_UI):
         # Update UI
         if start_frame > end_frame:
             QMessageBox.warning(self, "Warning", "Start Frame이 End Frame보다 \n클 수 없습니다.")
-            item.setText("")
+            model.set_text(row, header, "")
             return
 
-        start_frame_item.setText(str(start_frame))
-        end_frame_item.setText(str(end_frame))
-        duration_item.setText(str(end_frame - start_frame + 1))
-        frame_handle_item.setText(str(frame_handle))
+        model.set_value(row, "Start Frame", start_frame)
+        model.set_value(row, "End Frame", end_frame)
+        model.set_value(row, "Duration", end_frame - start_frame + 1)
+        model.set_value(row, "Frame Handle", frame_handle)
         
     def clear_retime_items(self, row):
-        self.plate_table_widget.item(row, self.headers.index("Retime Speed")).setText("")
-        self.plate_table_widget.item(row, self.headers.index("Retime End Frame")).setText("")
-        self.plate_table_widget.item(row, self.headers.index("Retime TimeCode Out")).setText("")
+        self.plate_table_model.set_text(row, "Retime Speed", "")
+        self.plate_table_model.set_text(row, "Retime End Frame", "")
+        self.plate_table_model.set_text(row, "Retime TimeCode Out", "")
 
     def set_checkbox_state(self, target="selected", state=True):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
+        table = self.edit_table_view if self.__is_edit else self.plate_table_view
+        model = table.model()
         
         if target == "selected":
             selected = table.selectedIndexes()
-            rows = {item.row() for item in selected}
+            rows = {index.row() for index in selected}
         elif target == "all":
-            rows = range(table.rowCount())
+            rows = range(model.rowCount())
         else:
             return
 
         for row in rows:
-            render = table.cellWidget(row, headers.index("Render"))
-            ckbx = render.findChild(QCheckBox)
-            if ckbx:
-                ckbx.setChecked(bool(state))
+            model.set_checked(row, state)
             
     def open_scan_folder(self):
         if self.__is_edit:
@@ -1757,14 +1992,55 @@ class IOManager(ui.IOManager_UI):
         self.edit_view_mode_btn.setIcon(self.edit_hide_icon if self.__simple_view else self.edit_show_icon)
         
         # Set column visibility based on view mode
-        for i in range(self.plate_table_widget.columnCount()):
+        for i in range(self.plate_table_model.columnCount()):
             should_hide = self.__simple_view and self.headers[i] in self.headers_ignore
-            self.plate_table_widget.setColumnHidden(i, should_hide)
+            self.plate_table_view.setColumnHidden(i, should_hide)
             
-        for i in range(self.edit_table_widget.columnCount()):
+        for i in range(self.edit_table_model.columnCount()):
             should_hide = self.__simple_view and self.headers[i] in self.headers_ignore
-            self.edit_table_widget.setColumnHidden(i, should_hide)
+            self.edit_table_view.setColumnHidden(i, should_hide)
                 
+    def preview_plate(self, row):
+        """
+        Shows the plate of the row in the preview pane, frames are decoded ahead of the playhead.
+        """
+        model = self.plate_table_model
+        if row < 0 or row >= model.rowCount():
+            self.plate_scrubber.set_source(None, 0, -1)
+            return
+        shot = model.shot(row)
+
+        sequence = self.__sequences.get(shot.scan_data)
+        if sequence:
+            source = frame_buffer.SequenceFrameSource(sequence)
+            first_frame, last_frame = sequence.first, sequence.last
+        else:
+            mov_path = os.path.join(self.scan_folder_le.text(), f"{shot.scan_data}.mov").replace(os.sep, "/")
+            if not os.path.isfile(mov_path) or shot.org_first is None or shot.org_last is None:
+                self.plate_scrubber.set_source(None, 0, -1)
+                return
+            source = frame_buffer.MovFrameSource(mov_path, shot.org_first)
+            first_frame, last_frame = shot.org_first, shot.org_last
+
+        current = self.plate_scrubber.source
+        if current is None or current.key != source.key:
+            self.plate_scrubber.set_fps(self.render_fps_spbx.value())
+            self.plate_scrubber.set_source(source, first_frame, last_frame)
+        self.update_preview_range(row)
+
+    def update_preview_range(self, row):
+        # Plate frames the render uses: 'First Frame Offset' on from the first frame, 'Start Frame' to 'End Frame' long
+        if row != self.plate_table_view.currentIndex().row():
+            return
+        shot = self.plate_table_model.shot(row)
+        first_frame = self.plate_scrubber.first_frame
+        in_frame = first_frame + (shot.first_frame_offset or 0)
+        if shot.start_frame is not None and shot.end_frame is not None:
+            out_frame = in_frame + shot.end_frame - shot.start_frame
+        else:
+            out_frame = self.plate_scrubber.last_frame - (shot.end_frame_offset or 0)
+        self.plate_scrubber.set_used_range(in_frame, out_frame, shot.start_frame)
+
     def fps_changed(self):
         is_custom = self.render_fps_cmbx.currentText() == "Custom"
         self.render_fps_spbx.setEnabled(is_custom)
@@ -1772,31 +2048,31 @@ class IOManager(ui.IOManager_UI):
         if not is_custom:
             self.render_fps_spbx.setValue(float(self.render_fps_cmbx.currentText()))
 
-    @disconnect_table_event
-    def start_frame_changed(self, *args, **kwargs):
+    def start_frame_changed(self, *args, rows=None, **kwargs):
         start_frame = self.render_start_frame_spbx.value()
         
-        for row in range(self.plate_table_widget.rowCount()):
+        model = self.plate_table_model
+        for row in (range(model.rowCount()) if rows is None else rows):
             # Get Data
-            duration = int(self.plate_table_widget.item(row, self.headers.index("Duration")).text() if self.plate_table_widget.item(row, self.headers.index("Duration")).text() else 0)
+            duration = int(model.text(row, "Duration") if model.text(row, "Duration") else 0)
             end_frame = start_frame + duration - 1
 
             # Adjust for Frame Handle if present
-            frame_handle = self.plate_table_widget.item(row, self.headers.index("Frame Handle")).text()
+            frame_handle = model.text(row, "Frame Handle")
             if frame_handle:
                 frame_handle = int(frame_handle)
                 start_frame -= frame_handle
                 end_frame -= frame_handle
-                self.plate_table_widget.item(row, self.headers.index("Start Frame")).setText(str(frame_handle))
+                model.set_text(row, "Start Frame", str(frame_handle))
 
             # Update Retime End Frame if present
-            retime_end_frame = self.plate_table_widget.item(row, self.headers.index("Retime End Frame")).text()
+            retime_end_frame = model.text(row, "Retime End Frame")
             if retime_end_frame:
-                self.plate_table_widget.item(row, self.headers.index("Retime End Frame")).setText(str(end_frame))
+                model.set_text(row, "Retime End Frame", str(end_frame))
 
             # Set Start and End Frame
-            self.plate_table_widget.item(row, self.headers.index("Start Frame")).setText(str(start_frame))
-            self.plate_table_widget.item(row, self.headers.index("End Frame")).setText(str(end_frame))
+            model.set_text(row, "Start Frame", str(start_frame))
+            model.set_text(row, "End Frame", str(end_frame))
 
     def switch_colorspace(self):
         use_nuke_default = self.colorspace_switch_btn.text() == "Use Nuke Default"
@@ -1865,13 +2141,16 @@ class IOManager(ui.IOManager_UI):
             self.render_crop_y_spbx.setEnabled(False)
             
     def validate_version(self):
+        if self.__is_loading:
+            return
+        
         if self.__is_edit:
             project_name = self.edit_project_cmbx.currentText()
-            table = self.edit_table_widget
+            table = self.edit_table_view
             headers = self.edit_headers
         else:
             project_name = self.project_cmbx.currentText()
-            table = self.plate_table_widget
+            table = self.plate_table_view
             headers = self.headers
         
         # Get Selected Rows and Confirm
@@ -1885,12 +2164,13 @@ class IOManager(ui.IOManager_UI):
         QApplication.processEvents()
         
         err_list = []
+        row_keys = {}
         for row in selected_rows:
             # Get table data
-            row_data = self._get_row_data(row)
-            sequence = row_data.get("Sequence") if row_data.get("Sequence") else ""
-            shot_name = row_data.get("Shot Name") if row_data.get("Shot Name") else ""
-            _type = row_data.get("Type") if row_data.get("Type") else ""
+            shot = self._get_shot(row)
+            sequence = shot.sequence
+            shot_name = shot.shot_name
+            _type = shot.type
             
             if not sequence:
                 err_list.append(f"{row + 1}행에 시퀀스가 없습니다.")
@@ -1901,37 +2181,38 @@ class IOManager(ui.IOManager_UI):
             if not _type:
                 err_list.append(f"{row + 1}행에 타입이 없습니다.")
                 continue
+            row_keys[row] = (sequence, shot_name, _type)
+        
+        # Find Versions and Cubes of every row at once
+        try:
+            validated = sg_manager.validate_versions_bulk(project_name, row_keys.values())
+        except Exception as e:
+            logger.error(traceback.format_exc())
+            err_list.append(f"Error occurred while finding versions: {e}")
+            row_keys = {}
+        
+        items = None
+        for row, key in row_keys.items():
+            version_list, cube_name = validated[key]
             
-            # Find Version, set version column. if not found, set 1
-            try:
-                version_list, cube_name = sg_manager.validate_versions(project_name, sequence, shot_name, _type)
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                err_list.append(f"Error occurred while finding versions: {e}")
-                self.loading_dialog.hide()
-                continue
-            
-            # Set Latest Version
-            set_version = 1
-            if version_list:
-                for version in version_list:
-                    set_version = int(version.split("_v")[-1].split('_')[0]) + 1
-            
-            table.item(row, headers.index("Version")).setText(str(set_version))
+            # Set Latest Version, 1 if not found
+            table.model().set_value(row, "Version", sg_manager.next_version(version_list))
             
             # Set Cube Name
             if not self.__is_edit:
                 if cube_name:
-                    # Get Delegate's Items List
-                    items = table.itemDelegateForColumn(headers.index("Cube")).get_items()
-                    
-                    table.item(row, headers.index("Cube")).setText(cube_name) \
-                    if cube_name in items \
-                    else table.item(row, headers.index("Cube")).setText("None")
+                    if items is None:
+                        # Get Delegate's Items List, no delegate when the cube folder is empty
+                        delegate = table.itemDelegateForColumn(headers.index("Cube"))
+                        items = delegate.get_items() if delegate else ["None"]
+                    table.model().set_text(row, "Cube", cube_name if cube_name in items else "None")
                 else:
-                    table.item(row, headers.index("Cube")).setText("None")
-            
-            self.loading_dialog.hide()
+                    table.model().set_text(row, "Cube", "None")
+        
+        self.loading_dialog.hide()
+        
+        if not self.__is_edit:
+            self.update_cube_thumbnails(selected_rows)
         
         if err_list:
             # process error list
@@ -1981,6 +2262,9 @@ class IOManager(ui.IOManager_UI):
             QMessageBox.information(self, "Success", "편집본 배치가 완료되었습니다.")
        
     def process_edit(self):
+        if self.__is_loading:
+            return ["스캔 폴더를 불러오는 중입니다."]
+        
         selected_rows = self._validate_selection()
         if not selected_rows:
             return ["선택된 데이터가 없습니다."]
@@ -1997,109 +2281,111 @@ class IOManager(ui.IOManager_UI):
         
         shot_cache = {}
         err_list = []
+        sg_index = self._prefetch_sg_project(sg_proj_data, selected_rows, ["EDIT"])
+        # Shot / Task / retake updates are sent in batches after the rows, a row whose update fails
+        # still has its Version and mov, its errors start with the row number
+        sg_buffer = sg_manager.MutationBuffer()
         
-        for row in selected_rows:
-            row_data = self._get_row_data(row)
-            self.status_bar_debug(f"Processing {row + 1}/{len(selected_rows)}: {row_data.get('Scan Data')}")
+        try:
+            for row in selected_rows:
+                shot = self._get_shot(row)
+                self.status_bar_debug(f"Processing {row + 1}/{len(selected_rows)}: {shot.scan_data}")
+                sg_buffer.label_prefix = f"{row + 1}행 ({shot.shot_name}): "
             
-            sg_shot, err_msg = self._process_shot_cache(shot_cache, sg_proj_data, row_data)
-            if err_msg:
-                err_list.append(err_msg)
-                continue
+                sg_shot, err_msg = self._process_shot_cache(shot_cache, sg_proj_data, shot, sg_index)
+                if err_msg:
+                    err_list.append(err_msg)
+                    continue
             
-            orig_mov_path = os.path.join(data_root, f"{row_data.get('Scan Data')}.mov").replace(os.sep, "/")
-            dst_root = os.path.join(self.default_drive, project_name, "sequences", row_data.get("Sequence"), row_data.get("Shot Name"), self.edit_task_cmbx.currentText(), f"v{int(row_data.get('Version')):03d}").replace(os.sep, "/")
-            dst_mov_name = f"{row_data.get('Shot Name')}_{row_data.get('Type')}_v{int(row_data.get('Version')):03d}_{row_data.get('Date')}.mov"
-            dst_mov_path = os.path.join(dst_root, dst_mov_name).replace(os.sep, "/")
+                orig_mov_path = os.path.join(data_root, f"{shot.scan_data}.mov").replace(os.sep, "/")
+                dst_root = os.path.join(self.default_drive, project_name, "sequences", shot.sequence, shot.shot_name, self.edit_task_cmbx.currentText(), f"v{shot.version:03d}").replace(os.sep, "/")
+                dst_mov_name = f"{shot.connect_name}_{shot.date}.mov"
+                dst_mov_path = os.path.join(dst_root, dst_mov_name).replace(os.sep, "/")
             
-            try:
-                edit_duration = row_data.get('Org Range').split("(")[1].replace(")", "")
-            except:
-                err_list.append(f"{row + 1}행의 Org Range이 올바르지 않습니다.")
-                continue
+                edit_duration = shot.org_duration
+                if edit_duration is None:
+                    err_list.append(f"{row + 1}행의 Org Range이 올바르지 않습니다.")
+                    continue
             
-            if not os.path.exists(orig_mov_path):
-                err_list.append(f"{row + 1}행의 원본 mov 파일이 없습니다.")
-                continue
+                if not os.path.exists(orig_mov_path):
+                    err_list.append(f"{row + 1}행의 원본 mov 파일이 없습니다.")
+                    continue
             
-            self.ensure_dir_exists(dst_root)
+                self.ensure_dir_exists(dst_root)
             
-            # copy mov file
-            try:
-                shutil.copy2(orig_mov_path, dst_mov_path)
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 mov 파일을 복사하는 중 오류가 발생했습니다: {e}")
-                continue
+                # copy mov file
+                try:
+                    shutil.copy2(orig_mov_path, dst_mov_path)
+                except Exception as e:
+                    err_list.append(f"{row + 1}행의 mov 파일을 복사하는 중 오류가 발생했습니다: {e}")
+                    continue
             
-            # set shot data
-            sg_shot_data = {
-                "sg_ep": row_data.get("Episode"),
-                "sg_edit_duration": edit_duration,
-                "sg_working_duration": row_data.get("Duration"),
-                "sg_working_cut_in": row_data.get("Start Frame"),
-                "sg_working_cut_out": row_data.get("End Frame"),
-            }
+                # set shot data
+                sg_shot_data = {
+                    "sg_ep": shot.episode,
+                    "sg_edit_duration": edit_duration,
+                    "sg_working_duration": shot.duration,
+                    "sg_working_cut_in": shot.start_frame,
+                    "sg_working_cut_out": shot.end_frame,
+                }
             
-            try:
-                sg_manager.con.update("Shot", sg_shot["id"], sg_shot_data)
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 Shot 정보를 업데이트하는 중 오류가 발생했습니다: {e}")
-                continue
+                sg_buffer.update("Shot", sg_shot["id"], sg_shot_data, label="Shot 정보를 업데이트하는 중 오류가 발생했습니다")
             
-            # create task
-            try:
-                sg_edit_task = sg_manager.find_or_create_task(sg_proj_data, sg_shot, "EDIT", "EDIT", self.edit_task_cmbx.currentText())
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 EDIT Task를 생성하는 중 오류가 발생했습니다: {e}")
-                continue
+                # create task
+                try:
+                    sg_edit_task = sg_manager.find_or_create_task(sg_proj_data, sg_shot, "EDIT", "EDIT", self.edit_task_cmbx.currentText(), index=sg_index)
+                except Exception as e:
+                    err_list.append(f"{row + 1}행의 EDIT Task를 생성하는 중 오류가 발생했습니다: {e}")
+                    continue
             
-            # check previous version
-            v_err_list = []
-            try:
-                v_err_list = sg_manager.retake_low_versions(project_name, row_data.get("Shot Name"), "EDIT", self.edit_task_cmbx.currentText(), "retake")
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 이전 버전을 체크하는 중 오류가 발생했습니다: {e}")
-                continue
+                # check previous version
+                v_err_list = []
+                try:
+                    v_err_list = sg_manager.retake_low_versions(project_name, shot.shot_name, "EDIT", self.edit_task_cmbx.currentText(), "retake", buffer=sg_buffer)
+                except Exception as e:
+                    err_list.append(f"{row + 1}행의 이전 버전을 체크하는 중 오류가 발생했습니다: {e}")
+                    continue
             
-            if v_err_list:
-                err_list.extend(v_err_list)
-                continue
+                if v_err_list:
+                    err_list.extend(v_err_list)
+                    continue
             
-            # set version data
-            sg_version_data = {
-                "code": f"{row_data.get('Shot Name')}_{row_data.get('Type')}_v{int(row_data.get('Version')):03d}_{row_data.get('Date')}",
-                "project": sg_proj_data,
-                "entity": sg_shot,
-                "description": row_data.get("Version Description"),
-                "sg_path_to_movie": dst_mov_path,
-                "sg_task": sg_edit_task,
-                "user": sg_manager.get_user_by_email(self.user_data.get("email")),
-                "sg_status_list": self.uploaded_version_status,
-            }
-            
-            # create version
-            try:
-                sg_version = sg_manager.con.create("Version", sg_version_data)
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 Version을 생성하는 중 오류가 발생했습니다: {e}")
-                continue
+                # set version data
+                sg_version_data = {
+                    "code": f"{shot.connect_name}_{shot.date}",
+                    "project": sg_proj_data,
+                    "entity": sg_shot,
+                    "description": shot.version_description,
+                    "sg_path_to_movie": dst_mov_path,
+                    "sg_task": sg_edit_task,
+                    "user": sg_manager.get_user_by_email(self.user_data.get("email")),
+                    "sg_status_list": self.uploaded_version_status,
+                }
+            
+                # create version
+                try:
+                    sg_version = sg_manager.con.create("Version", sg_version_data)
+                except Exception as e:
+                    err_list.append(f"{row + 1}행의 Version을 생성하는 중 오류가 발생했습니다: {e}")
+                    continue
             
-            # update task status
-            try:
-                sg_manager.con.update("Task", sg_edit_task.get("id"), {"sg_status_list": "po"})
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 EDIT Task를 업데이트하는 중 오류가 발생했습니다: {e}")
-                continue
+                # update task status
+                sg_buffer.update("Task", sg_edit_task.get("id"), {"sg_status_list": "po"}, label="EDIT Task를 업데이트하는 중 오류가 발생했습니다")
             
-            # upload mov file
-            try:
-                sg_manager.con.upload("Version", sg_version.get("id"), dst_mov_path, "sg_uploaded_movie")
-            except Exception as e:
-                err_list.append(f"{row + 1}행의 mov 파일을 업로드하는 중 오류가 발생했습니다: {e}")
-                continue
+                # upload mov file
+                try:
+                    sg_manager.con.upload("Version", sg_version.get("id"), dst_mov_path, "sg_uploaded_movie")
+                except Exception as e:
+                    err_list.append(f"{row + 1}행의 mov 파일을 업로드하는 중 오류가 발생했습니다: {e}")
+                    continue
+        finally:
+            err_list += sg_buffer.flush()
         return err_list
     
     def process_plate(self):
+        if self.__is_loading:
+            return ["스캔 폴더를 불러오는 중입니다."]
+        
         # Get Settings
         render_settings, err_msg = self._get_settings()
         if not render_settings:
@@ -2137,417 +2423,419 @@ class IOManager(ui.IOManager_UI):
         
         shot_cache = {}
         err_list = []
+        sg_index = self._prefetch_sg_project(sg_proj_data, selected_rows, ["EDIT", "Plate", "Comp"])
+        sg_shot_infos = self._snapshot_sg_shots(project_name, selected_rows)
+        # Shot / retake updates are sent in batches after the rows, a row whose update fails
+        # still has its Deadline jobs, its errors start with the row number
+        sg_buffer = sg_manager.MutationBuffer()
         
         scandata_pattern = re.compile(r'((.+?)(_)(\w+))(\.?)')
-        digit_pattern = re.compile(r'\d+')
         
         row_cnt = 0
-        for row in selected_rows:
-            row_cnt += 1
-
-            # Get table data
-            row_data = self._get_row_data(row)
-            scan_data = row_data.get("Scan Data")
-            shot_name = row_data.get("Shot Name")
-            plate_type = row_data.get("Type") # mp0
-            version = f"v{int(row_data.get('Version')):03}" # v001
-            plate_version = f"{plate_type}_{version}" # mp0_v001
-            org_range = row_data.get("Org Range")
-            start_frame = row_data.get("Start Frame")
-            end_frame = row_data.get("End Frame")
-            duration = row_data.get("Duration")
-            start_frame_offset = row_data.get("First Frame Offset")
-            end_frame_offset = row_data.get("End Frame Offset")
-
-            self.status_bar_debug(f"Processing {row_cnt}/{len(selected_rows)}: {scan_data}")
-
-            if int(start_frame) > int(end_frame):
-                err_list.append(f"{row_cnt}행의 Start Frame이 End Frame보다 큽니다.")
-                continue
+        try:
+            for row in selected_rows:
+                row_cnt += 1
+
+                # Get table data
+                shot = self._get_shot(row)
+                scan_data = shot.scan_data
+                shot_name = shot.shot_name
+                sg_buffer.label_prefix = f"{row + 1}행 ({shot_name}): "
+                plate_type = shot.type # mp0
+                version = f"v{shot.version:03}" # v001
+                plate_version = shot.plate_version # mp0_v001
+                start_frame = shot.start_frame
+                end_frame = shot.end_frame
+                duration = shot.duration
+                start_frame_offset = shot.first_frame_offset or 0
+                end_frame_offset = shot.end_frame_offset or 0
+
+                self.status_bar_debug(f"Processing {row_cnt}/{len(selected_rows)}: {scan_data}")
+
+                if start_frame > end_frame:
+                    err_list.append(f"{row_cnt}행의 Start Frame이 End Frame보다 큽니다.")
+                    continue
 
-            # Find or create ShotGrid shot, if already exists, use cache
-            sg_shot, err_msg = self._process_shot_cache(shot_cache, sg_proj_data, row_data)
-            if err_msg:
-                err_list.append(err_msg)
-                continue
+                # Find or create ShotGrid shot, if already exists, use cache
+                sg_shot, err_msg = self._process_shot_cache(shot_cache, sg_proj_data, shot, sg_index)
+                if err_msg:
+                    err_list.append(err_msg)
+                    continue
 
-            # Set Paths for Render
-            plate_root, data_path, mov_path, connect_name = self._prepare_render_paths(project_name, data_root, row_data)
-            if os.path.isfile(mov_path):
+                # Set Paths for Render
+                plate_root, data_path, mov_path, connect_name = self._prepare_render_paths(project_name, data_root, shot)
+                if os.path.isfile(mov_path):
 
-                connect_dir = os.path.join(data_root, "_io", scan_data, connect_name)
-                seq_ext = sg_proj_data.get('sg_out_plate_ext')
-                di_data_seq = mov_path.replace(os.sep, "/")
-            else:
-                connect_dir = os.path.join(data_path, connect_name).replace(os.sep, "/")
+                    connect_dir = os.path.join(data_root, "_io", scan_data, connect_name)
+                    seq_ext = sg_proj_data.get('sg_out_plate_ext')
+                    di_data_seq = mov_path.replace(os.sep, "/")
+                else:
+                    connect_dir = os.path.join(data_path, connect_name).replace(os.sep, "/")
             
-            self.ensure_dir_exists(connect_dir)
+                self.ensure_dir_exists(connect_dir)
             
-            shot_plate_dir = os.path.join(plate_root, plate_version, connect_name).replace(os.sep, "/")
-            if render_settings.get("render_exr"):
-                self.ensure_dir_exists(shot_plate_dir)
+                shot_plate_dir = os.path.join(plate_root, plate_version, connect_name).replace(os.sep, "/")
+                if render_settings.get("render_exr"):
+                    self.ensure_dir_exists(shot_plate_dir)
             
-            # find mp or sp in scan data
-            match = scandata_pattern.match(scan_data)
+                # find mp or sp in scan data
+                match = scandata_pattern.match(scan_data)
             
-            if match:
-                __data_name = match.group(4)
-                __data_path = os.path.join(data_root, match.group(1)).replace("/", os.sep)
-            else:
-                __data_name = scan_data
-                __data_path = data_path.replace("/", os.sep)
+                if match:
+                    __data_name = match.group(4)
+                    __data_path = os.path.join(data_root, match.group(1)).replace("/", os.sep)
+                else:
+                    __data_name = scan_data
+                    __data_path = data_path.replace("/", os.sep)
             
-            seq_info = self.check_image_sequence(__data_path)
+                seq_info = self.get_scan_sequence(scan_data)
+                if not seq_info and os.path.isdir(__data_path):
+                    sequences = self.get_folder_sequences(__data_path)
+                    seq_info = sequences[0] if len(sequences) == 1 else None
+
+                if seq_info and seq_info.missing:
+                    err_list.append(f"{scan_data}: 누락된 프레임이 있습니다 ({sequence_manager.format_ranges(seq_info.missing)})")
+                    continue
             
-            # Set Plate Match Dict
-            plate_match_dict = {}
+                # Set Plate Match Dict
+                plate_match_dict = {}
             
-            if seq_info:
-                __start_frame, __end_frame, __frame_to_path = seq_info
-                frame_paths_list = [__frame_to_path[f] for f in range(int(__start_frame), int(__end_frame) + 1)]
-                __start_frame_path, __end_frame_path = frame_paths_list[0], frame_paths_list[-1]
+                if seq_info:
+                    __start_frame, __end_frame = seq_info.first, seq_info.last
+                    seq_ext = seq_info.ext                                                   # ex) test_test001_v001.1001.exr -> .exr
                 
-                real_path_start_frame = digit_pattern.findall(__start_frame_path)[-1]   # ex) test_test001_v001.1001.exr -> 1001
-                seq_header = os.path.basename(__start_frame_path).split(".")[0]         # ex) test_test001_v001.1001.exr -> test_test001_v001
-                seq_ext = os.path.splitext(__start_frame_path)[-1]                      # ex) test_test001_v001.1001.exr -> .exr
+                    di_data_seq = os.path.join(
+                        seq_info.folder, 
+                        f"{seq_info.pattern} {__start_frame}-{__end_frame}"                  # ex) test_test001_v001.%04d.exr 1001-1100
+                        ).replace(os.sep, "/")
                 
-                di_data_seq = os.path.join(
-                    data_path, 
-                    f"{seq_header}.%0{len(real_path_start_frame)}d{seq_ext} {__start_frame}-{__end_frame}"  # ex) test_test001_v001.%04d.exr 1001-1100
-                    ).replace(os.sep, "/")
-                
-                # If render exr, adjust frame range
+                    # If render exr, adjust frame range
+                    if render_settings.get("render_exr"):
+                        frame = start_frame - start_frame_offset
+                        _end_frame = start_frame + (shot.org_duration or 0) - start_frame_offset - end_frame_offset - 1
+
+                        # Set Plate Match Dict
+                        for frame_path in seq_info.frame_paths():
+                            di_data_path = frame_path.replace(os.sep, "/")
+                            shot_data_path = os.path.join(shot_plate_dir, f"{connect_name}.{frame:04}{seq_ext}")
+                            plate_match_dict[di_data_path] = shot_data_path
+                            frame += 1
+            
+                # Set Deadline Dependency List
+                upload_depen_list = []
+            
+                # Set EXR Path, rendered plates are written from 'Start Frame' to 'End Frame'
+                plate_job_list = []
+                shot_plate_path = ""
+                shot_plate_range = (start_frame, end_frame)
                 if render_settings.get("render_exr"):
-                    frame = int(start_frame) if start_frame else 0
-                    if start_frame_offset:
-                        frame -= int(start_frame_offset) if start_frame_offset else 0
-                    _org_duration = int(org_range.split("(")[1].replace(")", "")) if org_range else 0
-                    _end_frame = int(start_frame or 0) + _org_duration - int(start_frame_offset or 0) - int(end_frame_offset or 0) - 1
-
-                    # Set Plate Match Dict
-                    for frame_path in frame_paths_list:
-                        di_data_path = frame_path.replace(os.sep, "/")
-                        shot_data_path = os.path.join(shot_plate_dir, f"{connect_name}.{frame:04}{seq_ext}")
-                        plate_match_dict[di_data_path] = shot_data_path
-                        frame += 1
-            
-            # Set Deadline Dependency List
-            upload_depen_list = []
-            
-            # Set EXR Path
-            plate_job_list = []
-            shot_plate_path = ""
-            if render_settings.get("render_exr"):
-                shot_data_path = os.path.join(shot_plate_dir, f"{connect_name}.%04d{seq_ext if seq_ext.startswith('.') else '.' + seq_ext}").replace(os.sep, "/")
-                # If no need to Nuke Process, copy plate to shot data
-                if (os.path.splitext(di_data_seq)[-1].lower() == ".mov" or 
-                    render_settings["reformat_x"] or 
-                    render_settings["reformat_y"] or 
-                    not render_settings["crop_preset"] == "Original"  or
-                    org_range.split("(")[1].replace(")", "") != duration):
+                    shot_data_path = os.path.join(shot_plate_dir, f"{connect_name}.%04d{seq_ext if seq_ext.startswith('.') else '.' + seq_ext}").replace(os.sep, "/")
+                    # If no need to Nuke Process, copy plate to shot data
+                    if (os.path.splitext(di_data_seq)[-1].lower() == ".mov" or 
+                        render_settings["reformat_x"] or 
+                        render_settings["reformat_y"] or 
+                        not render_settings["crop_preset"] == "Original"  or
+                        shot.org_duration != duration):
                     
-                    shot_plate_path = shot_data_path.replace(os.sep, "/")
-                else:
-                    copy_py_path = os.path.join(connect_dir, f".copy_to_{connect_name}.py")
+                        shot_plate_path = shot_data_path.replace(os.sep, "/")
+                    else:
+                        # Copied plates keep every scan frame, from 'Start Frame' minus 'First Frame Offset'
+                        copy_first = start_frame - start_frame_offset
+                        shot_plate_range = (copy_first, copy_first + len(seq_info) - 1)
+                        copy_py_path = os.path.join(connect_dir, f".copy_to_{connect_name}.py")
+                        try:
+                            plate_job_list = self.deadline_manager.submit_copy_job(
+                                plate_match_dict, copy_py_path, priority=int(render_settings["priority"]), 
+                                depen_list=[], grp_name=deadline_group_name
+                            )
+                            upload_depen_list += plate_job_list
+                        except Exception as e:
+                            logger.error(traceback.format_exc())
+                            err_list.append(f"Error occurred while submitting copy job: {e}")
+                            continue
+                
+                # Set JPG Path
+                shot_jpg_path = ""
+                if render_settings.get("render_jpg"):
+                    shot_jpg_dir = os.path.join(plate_root, plate_version, "jpg", connect_name)
+                    self.ensure_dir_exists(shot_jpg_dir)
+                    shot_jpg_path = os.path.join(shot_jpg_dir, f"{connect_name}.%04d.jpg").replace(os.sep, "/")
+                
+                # Set MOV Path
+                shot_mov_path = ""
+                _export_mov = False
+                if render_settings.get("render_mov"):
+                    shot_mov_dir = os.path.join(plate_root, plate_version).replace(os.sep, "/")
+                    shot_mov_path = os.path.join(shot_mov_dir, f"{connect_name}.mov").replace(os.sep, "/")
+                    self.ensure_dir_exists(shot_mov_dir)
+                    _export_mov = True
+                
+                # Set PNG Path
+                shot_png_path = ""
+                if render_settings.get("render_png"):
+                    shot_png_dir = os.path.join(plate_root, plate_version, "png", connect_name)
+                    self.ensure_dir_exists(shot_png_dir)
+                    shot_png_path = os.path.join(shot_png_dir, f"{connect_name}.%04d.png").replace(os.sep, "/")
+            
+                create_comp = False
+                sg_plate_task = None
+
+                # Set SG Task
+                mp_plate = plate_type.lower().startswith("mp")
+                sp_plate = plate_type.lower().startswith("sp")
+                if plate_type.lower() == "edit":
                     try:
-                        plate_job_list = self.deadline_manager.submit_copy_job(
-                            plate_match_dict, copy_py_path, priority=int(render_settings["priority"]), 
-                            depen_list=[], grp_name=deadline_group_name
-                        )
-                        upload_depen_list += plate_job_list
+                        sg_plate_task = sg_manager.find_or_create_task(sg_proj_data, sg_shot, "EDIT", "EDIT", "edit", index=sg_index)
                     except Exception as e:
                         logger.error(traceback.format_exc())
-                        err_list.append(f"Error occurred while submitting copy job: {e}")
+                        err_list.append(f"Error occurred while finding or creating ShotGrid task: {e}")
                         continue
-                
-            # Set JPG Path
-            shot_jpg_path = ""
-            if render_settings.get("render_jpg"):
-                shot_jpg_dir = os.path.join(plate_root, plate_version, "jpg", connect_name)
-                self.ensure_dir_exists(shot_jpg_dir)
-                shot_jpg_path = os.path.join(shot_jpg_dir, f"{connect_name}.%04d.jpg").replace(os.sep, "/")
-                
-            # Set MOV Path
-            shot_mov_path = ""
-            _export_mov = False
-            if render_settings.get("render_mov"):
-                shot_mov_dir = os.path.join(plate_root, plate_version).replace(os.sep, "/")
-                shot_mov_path = os.path.join(shot_mov_dir, f"{connect_name}.mov").replace(os.sep, "/")
-                self.ensure_dir_exists(shot_mov_dir)
-                _export_mov = True
-                
-            # Set PNG Path
-            shot_png_path = ""
-            if render_settings.get("render_png"):
-                shot_png_dir = os.path.join(plate_root, plate_version, "png", connect_name)
-                self.ensure_dir_exists(shot_png_dir)
-                shot_png_path = os.path.join(shot_png_dir, f"{connect_name}.%04d.png").replace(os.sep, "/")
-            
-            create_comp = False
-            sg_plate_task = None
-
-            # Set SG Task
-            mp_plate = plate_type.lower().startswith("mp")
-            sp_plate = plate_type.lower().startswith("sp")
-            if plate_type.lower() == "edit":
-                try:
-                    sg_plate_task = sg_manager.find_or_create_task(sg_proj_data, sg_shot, "EDIT", "EDIT", "edit")
-                except Exception as e:
-                    logger.error(traceback.format_exc())
-                    err_list.append(f"Error occurred while finding or creating ShotGrid task: {e}")
-                    continue
 
-            elif mp_plate or sp_plate:
-                try:
-                    sg_plate_task = sg_manager.find_or_create_task(sg_proj_data, sg_shot, "Plate", "Plate", "plate")
-                except Exception as e:
-                    logger.error(traceback.format_exc())
-                    err_list.append(f"Error occurred while finding or creating ShotGrid task: {e}")
-                    continue
-                
-                # If data type is main plate, make comp script
-                if mp_plate:
+                elif mp_plate or sp_plate:
                     try:
-                        # Create CMP Task
-                        sg_manager.find_or_create_task(sg_proj_data, sg_shot, "Comp", "CMP", "cmp")
+                        sg_plate_task = sg_manager.find_or_create_task(sg_proj_data, sg_shot, "Plate", "Plate", "plate", index=sg_index)
                     except Exception as e:
                         logger.error(traceback.format_exc())
                         err_list.append(f"Error occurred while finding or creating ShotGrid task: {e}")
                         continue
-                    
-                    shot_root = os.path.join(self.default_drive, project_name, "sequences", row_data.get("Sequence"), shot_name, "CMP", "cmp").replace(os.sep, "/")
-                    nk_file = f'{shot_name}_cmp_v000.nk'
-
-                    exr_output_dir = os.path.join(shot_root, "wip", "nuke", "images").replace(os.sep, "/")
-                    exr_output_name = f"{shot_name}_cmp_{version}.%04d.exr"
-                    mov_output_dir = os.path.join(shot_root, "wip", "review").replace(os.sep, "/")
-                    mov_output_name = f"{shot_name}_cmp_{version}.mov"
-                    exr_output_path = os.path.join(exr_output_dir, exr_output_name).replace(os.sep, "/")
-                    mov_output_path = os.path.join(mov_output_dir, mov_output_name).replace(os.sep, "/")
-                    
-                    nuke_shot_work_path = os.path.join(shot_root, "wip", "nuke", "scenes", nk_file)
-                    self.ensure_dir_exists(os.path.dirname(nuke_shot_work_path))
-                    
-                    comp_temp_py = nuke_shot_work_path.replace(".nk", ".py").replace(os.sep, "/")
-                    nk_plate_path = ""
-                    if render_settings.get("render_exr"):
-                        nk_plate_path = shot_data_path
-                    elif not os.path.exists(nuke_shot_work_path) and render_settings.get("render_mov"):
-                        nk_plate_path = shot_mov_path
-                    elif not os.path.exists(nuke_shot_work_path) and render_settings.get("render_jpg"):
-                        nk_plate_path = shot_jpg_path
-                    elif not os.path.exists(nuke_shot_work_path) and render_settings.get("render_png"):
-                        nk_plate_path = shot_png_path
-                        
-                    if nk_plate_path and not os.path.exists(comp_temp_py):
-                        cube_path = ""
-                        cube_dir = self.colorspace_cube_le.text().replace("/", os.sep)
-                        cube_name = self.plate_table_widget.item(row, self.headers.index("Cube")).text()
-                        if cube_name and not cube_name == "None":
-                            cube_path = os.path.join(cube_dir, cube_name).replace(os.sep, "/")
-                            if not os.path.exists(cube_path):
-                                cube_path = ""
-                        _paths = (nuke_shot_work_path, nk_plate_path, sg_proj_data.get("sg_default_comp_nk").replace(os.sep, "/"), exr_output_path, mov_output_path, cube_path)
+                
+                    # If data type is main plate, make comp script
+                    if mp_plate:
                         try:
-                            nk_cmd = nuke_manager.get_comp_cmd(_paths, row_data, render_settings, sg_proj_data, comp_temp_py)
-                            with open(comp_temp_py, "w", encoding="utf-8") as f:
-                                f.write(nk_cmd)
-                                create_comp = True
+                            # Create CMP Task
+                            sg_manager.find_or_create_task(sg_proj_data, sg_shot, "Comp", "CMP", "cmp", index=sg_index)
                         except Exception as e:
                             logger.error(traceback.format_exc())
-                            err_list.append(f"Error occurred while creating comp script: {e}")
+                            err_list.append(f"Error occurred while finding or creating ShotGrid task: {e}")
                             continue
-
-                    timecode_in = row_data.get("TimeCode In")
-                    timecode_out = row_data.get("TimeCode Out")
-
-                    # Update Shot Data
-                    sg_data = {
-                        'sg_cut_in': int(start_frame) if start_frame else None,
-                        'sg_cut_out': int(end_frame) if end_frame else None,
-                        'sg_cut_duration': int(duration) if duration else None,
-                        'sg_tc_in': timecode_in if timecode_in else None,
-                        'sg_tc_out': timecode_out if timecode_out else None,
-                    }
-                    try:
-                        sg_manager.con.update("Shot", sg_shot.get("id"), sg_data)
-                    except Exception as e:
-                        logger.error(traceback.format_exc())
-                        err_list.append(f"Error occurred while updating ShotGrid data: {e}")
-                        continue
-
-            clip_name = self._prepare_clip_name(project_name, sg_shot, row_data)
-            scan_path = self._prepare_scan_path(project_name, sg_shot, row_data)
-            plate_resolution = self._prepare_plate_resolution(project_name, sg_shot, row_data)
-
-            sg_data = {
-                'sg_clip_name': clip_name if clip_name else None,
-                'sg_scan_path': scan_path if scan_path else None,
-                'sg_plate_resolution': plate_resolution if plate_resolution else None,
-            }
-
-            try:
-                sg_manager.con.update("Shot", sg_shot.get("id"), sg_data)
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                err_list.append(f"Error occurred while updating ShotGrid data: {e}")
-                continue
-
+                    
+                        shot_root = os.path.join(self.default_drive, project_name, "sequences", shot.sequence, shot_name, "CMP", "cmp").replace(os.sep, "/")
+                        nk_file = f'{shot_name}_cmp_v000.nk'
+
+                        exr_output_dir = os.path.join(shot_root, "wip", "nuke", "images").replace(os.sep, "/")
+                        exr_output_name = f"{shot_name}_cmp_{version}.%04d.exr"
+                        mov_output_dir = os.path.join(shot_root, "wip", "review").replace(os.sep, "/")
+                        mov_output_name = f"{shot_name}_cmp_{version}.mov"
+                        exr_output_path = os.path.join(exr_output_dir, exr_output_name).replace(os.sep, "/")
+                        mov_output_path = os.path.join(mov_output_dir, mov_output_name).replace(os.sep, "/")
+                    
+                        nuke_shot_work_path = os.path.join(shot_root, "wip", "nuke", "scenes", nk_file)
+                        self.ensure_dir_exists(os.path.dirname(nuke_shot_work_path))
+                    
+                        comp_temp_py = nuke_shot_work_path.replace(".nk", ".py").replace(os.sep, "/")
+                        nk_plate_path = ""
+                        if render_settings.get("render_exr"):
+                            nk_plate_path = shot_data_path
+                        elif not os.path.exists(nuke_shot_work_path) and render_settings.get("render_mov"):
+                            nk_plate_path = shot_mov_path
+                        elif not os.path.exists(nuke_shot_work_path) and render_settings.get("render_jpg"):
+                            nk_plate_path = shot_jpg_path
+                        elif not os.path.exists(nuke_shot_work_path) and render_settings.get("render_png"):
+                            nk_plate_path = shot_png_path
+
+                        # The plate frames are known here, the comp script does not have to list the plate folder
+                        if nk_plate_path and not nk_plate_path.lower().endswith(".mov"):
+                            nk_plate_path = f"{nk_plate_path} {shot_plate_range[0]}-{shot_plate_range[1]}"
+                        
+                        if nk_plate_path and not os.path.exists(comp_temp_py):
+                            cube_path = ""
+                            cube_dir = self.colorspace_cube_le.text().replace("/", os.sep)
+                            cube_name = shot.cube
+                            if cube_name and not cube_name == "None":
+                                cube_path = os.path.join(cube_dir, cube_name).replace(os.sep, "/")
+                                if not os.path.exists(cube_path):
+                                    cube_path = ""
+                            _paths = (nuke_shot_work_path, nk_plate_path, sg_proj_data.get("sg_default_comp_nk").replace(os.sep, "/"), exr_output_path, mov_output_path, cube_path)
+                            try:
+                                nk_cmd = nuke_manager.get_comp_cmd(_paths, shot, render_settings, sg_proj_data, comp_temp_py)
+                                with open(comp_temp_py, "w", encoding="utf-8") as f:
+                                    f.write(nk_cmd)
+                                    create_comp = True
+                            except Exception as e:
+                                logger.error(traceback.format_exc())
+                                err_list.append(f"Error occurred while creating comp script: {e}")
+                                continue
+
+                        timecode_in = shot.timecode_in
+                        timecode_out = shot.timecode_out
+
+                        # Update Shot Data
+                        sg_data = {
+                            'sg_cut_in': start_frame,
+                            'sg_cut_out': end_frame,
+                            'sg_cut_duration': duration,
+                            'sg_tc_in': timecode_in if timecode_in else None,
+                            'sg_tc_out': timecode_out if timecode_out else None,
+                        }
+                        sg_buffer.update("Shot", sg_shot.get("id"), sg_data, label="Error occurred while updating ShotGrid data")
+
+                shot_info = self._get_sg_shot_info(sg_shot_infos, project_name, sg_shot)
+                clip_name = self._prepare_clip_name(shot_info, shot)
+                scan_path = self._prepare_scan_path(shot_info, shot)
+                plate_resolution = self._prepare_plate_resolution(shot_info, shot)
+
+                sg_data = {
+                    'sg_clip_name': clip_name if clip_name else None,
+                    'sg_scan_path': scan_path if scan_path else None,
+                    'sg_plate_resolution': plate_resolution if plate_resolution else None,
+                }
+                # Later rows of the same Shot append to what this row sets
+                shot_info.update(sg_data)
+
+                sg_buffer.update("Shot", sg_shot.get("id"), sg_data, label="Error occurred while updating ShotGrid data")
             
-            try:
-                sg_manager.retake_low_versions(project_name, shot_name, "plate", plate_type, "retake")
-            except Exception as e:
-                logger.error(traceback.format_exc())
+                try:
+                    sg_manager.retake_low_versions(project_name, shot_name, "plate", plate_type, "retake", buffer=sg_buffer)
+                except Exception as e:
+                    logger.error(traceback.format_exc())
                 
-            try:
-                err_msg = sg_manager.get_plate_versions(sg_shot, shot_name, plate_version)
-                if err_msg:
-                    print("sg_manager.get_plate_versions() error")
-                    err_list.append(err_msg)
-            except Exception as e:
-                logger.error(traceback.format_exc())
+                try:
+                    err_msg = sg_manager.get_plate_versions(sg_shot, shot_name, plate_version, buffer=sg_buffer)
+                    if err_msg:
+                        print("sg_manager.get_plate_versions() error")
+                        err_list.append(err_msg)
+                except Exception as e:
+                    logger.error(traceback.format_exc())
             
-            # Make .nk File to Render jpg, mov
-            render_nk_path = os.path.join(connect_dir, f".render_{connect_name}.nk").replace(os.sep, "/")
+                # Make .nk File to Render jpg, mov
+                render_nk_path = os.path.join(connect_dir, f".render_{connect_name}.nk").replace(os.sep, "/")
                     
-            cube_path = ""
-            cube_dir = self.colorspace_cube_le.text().replace("/", os.sep)
-            cube_name = self.plate_table_widget.item(row, self.headers.index("Cube")).text()
-            if cube_name and not cube_name == "None":
-                cube_path = os.path.join(cube_dir, cube_name).replace(os.sep, "/")
-                if not os.path.exists(cube_path):
-                    cube_path = ""
-            _paths = (render_nk_path, di_data_seq, shot_plate_path, shot_png_path, shot_jpg_path, shot_mov_path, cube_path)
-            try:
-                render_cmd = nuke_manager.get_render_cmd(_paths, row_data, render_settings, sg_proj_data)
-                render_temp_py = render_nk_path.replace(".nk", ".py")
-                with open(render_temp_py, "w", encoding="utf-8") as f:
-                    f.write(render_cmd)
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                err_list.append(f"Error occurred while creating render script: {e}")
-                continue
+                cube_path = ""
+                cube_dir = self.colorspace_cube_le.text().replace("/", os.sep)
+                cube_name = shot.cube
+                if cube_name and not cube_name == "None":
+                    cube_path = os.path.join(cube_dir, cube_name).replace(os.sep, "/")
+                    if not os.path.exists(cube_path):
+                        cube_path = ""
+                _paths = (render_nk_path, di_data_seq, shot_plate_path, shot_png_path, shot_jpg_path, shot_mov_path, cube_path)
+                try:
+                    render_cmd = nuke_manager.get_render_cmd(_paths, shot, render_settings, sg_proj_data)
+                    render_temp_py = render_nk_path.replace(".nk", ".py")
+                    with open(render_temp_py, "w", encoding="utf-8") as f:
+                        f.write(render_cmd)
+                except Exception as e:
+                    logger.error(traceback.format_exc())
+                    err_list.append(f"Error occurred while creating render script: {e}")
+                    continue
             
-            # Submit Create nk Job
-            _job_name = f"[{connect_name}] - Make Render NK"
-            try:
-                render_nk_id = self.deadline_manager.submit_nuke_py_to_deadline(
-                    render_temp_py, 
-                    _job_name, 
-                    int(render_settings.get("priority")), 
-                    depen_list=[], 
-                    grp_name=deadline_group_name
-                    )
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                err_list.append(f"Error occurred while submitting nuke job: {e}")
-                continue
+                # Submit Create nk Job
+                _job_name = f"[{connect_name}] - Make Render NK"
+                try:
+                    render_nk_id = self.deadline_manager.submit_nuke_py_to_deadline(
+                        render_temp_py, 
+                        _job_name, 
+                        int(render_settings.get("priority")), 
+                        depen_list=[], 
+                        grp_name=deadline_group_name
+                        )
+                except Exception as e:
+                    logger.error(traceback.format_exc())
+                    err_list.append(f"Error occurred while submitting nuke job: {e}")
+                    continue
             
-            # Submit Render Job
-            plate_job_list = []
-            jpg_job_list = []
-            mov_job = None
-            png_job_list = []
-            try:
-                plate_job_list, jpg_job_list, mov_job, png_job_list = self.deadline_manager.submit_nuke_to_deadline(
-                    render_nk_path, row_data, render_settings, [render_nk_id], deadline_group_name, 
-                    export_plate=shot_plate_path!="", 
-                    export_jpg=render_settings.get("render_jpg"), 
-                    export_mov=_export_mov, 
-                    export_png=render_settings.get("render_png"),
-                )
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                err_list.append(f"Error occurred while submitting render job: {e}")
-                continue
-            if plate_job_list:
-                upload_depen_list += plate_job_list
-            if jpg_job_list:
-                upload_depen_list += jpg_job_list
-            if mov_job:
-                upload_depen_list.append(mov_job)
-            if png_job_list:
-                upload_depen_list += png_job_list
-            
-            if create_comp:
-                _job_name = f"[{connect_name}] - Make Comp NK"
+                # Submit Render Job
+                plate_job_list = []
+                jpg_job_list = []
+                mov_job = None
+                png_job_list = []
                 try:
-                    self.deadline_manager.submit_nuke_py_to_deadline(
-                        comp_temp_py, _job_name, int(render_settings.get("priority")),
-                        plate_job_list, deadline_group_name
+                    plate_job_list, jpg_job_list, mov_job, png_job_list = self.deadline_manager.submit_nuke_to_deadline(
+                        render_nk_path, shot, render_settings, [render_nk_id], deadline_group_name, 
+                        export_plate=shot_plate_path!="", 
+                        export_jpg=render_settings.get("render_jpg"), 
+                        export_mov=_export_mov, 
+                        export_png=render_settings.get("render_png"),
                     )
                 except Exception as e:
                     logger.error(traceback.format_exc())
-                    err_list.append(f"Error occurred while submitting comp job: {e}")
+                    err_list.append(f"Error occurred while submitting render job: {e}")
                     continue
-            else:
-                logger.debug("No Comp Script Created")
+                if plate_job_list:
+                    upload_depen_list += plate_job_list
+                if jpg_job_list:
+                    upload_depen_list += jpg_job_list
+                if mov_job:
+                    upload_depen_list.append(mov_job)
+                if png_job_list:
+                    upload_depen_list += png_job_list
+            
+                if create_comp:
+                    _job_name = f"[{connect_name}] - Make Comp NK"
+                    try:
+                        self.deadline_manager.submit_nuke_py_to_deadline(
+                            comp_temp_py, _job_name, int(render_settings.get("priority")),
+                            plate_job_list, deadline_group_name
+                        )
+                    except Exception as e:
+                        logger.error(traceback.format_exc())
+                        err_list.append(f"Error occurred while submitting comp job: {e}")
+                        continue
+                else:
+                    logger.debug("No Comp Script Created")
                 
-            # Update Shot Data
-            version_data = {
-                'entity': sg_shot,
-                'sg_user': sg_manager.get_user_by_email(self.user_data.get("email")),
-                'name': connect_name,
-                'des': row_data.get("Version Description") if row_data.get("Version Description") else "",
-                'status': self.uploaded_version_status
-            }
-            if sg_plate_task:
-                version_data['entity'] = sg_plate_task
-            if render_settings.get("render_exr"):
-                _input_file = shot_data_path
-            elif render_settings.get("render_jpg"):
-                _input_file = shot_jpg_path
-            else:
-                _input_file = shot_mov_path
-            
-            try:
-                self.deadline_manager.submit_sg_upload_to_deadline(
-                    version_data, _input_file, shot_mov_path, 
-                    row_data, render_settings, project_name, upload_depen_list, deadline_group_name,
-                    not render_settings.get("render_mov")
-                )
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                err_list.append(f"Error occurred while submitting upload job: {e}")
-                continue
+                # Update Shot Data
+                version_data = {
+                    'entity': sg_shot,
+                    'sg_user': sg_manager.get_user_by_email(self.user_data.get("email")),
+                    'name': connect_name,
+                    'des': shot.version_description,
+                    'status': self.uploaded_version_status
+                }
+                if sg_plate_task:
+                    version_data['entity'] = sg_plate_task
+                if render_settings.get("render_exr"):
+                    _input_file = shot_data_path
+                elif render_settings.get("render_jpg"):
+                    _input_file = shot_jpg_path
+                else:
+                    _input_file = shot_mov_path
             
+                try:
+                    self.deadline_manager.submit_sg_upload_to_deadline(
+                        version_data, _input_file, shot_mov_path, 
+                        shot, render_settings, project_name, upload_depen_list, deadline_group_name,
+                        not render_settings.get("render_mov")
+                    )
+                except Exception as e:
+                    logger.error(traceback.format_exc())
+                    err_list.append(f"Error occurred while submitting upload job: {e}")
+                    continue
+        finally:
+            err_list += sg_buffer.flush()
         return err_list
     
-    def _prepare_clip_name(self, project_name, sg_shot, row_data):
+    def _prepare_clip_name(self, shot_info, shot):
         sg_new_clip_name = self._prepare_sg_field(
-            project_name, sg_shot, row_data, "Clip Name", "sg_clip_name"
+            shot_info, shot, "Clip Name", "sg_clip_name"
         )
         return sg_new_clip_name
 
-    def _prepare_scan_path(self, project_name, sg_shot, row_data):
+    def _prepare_scan_path(self, shot_info, shot):
         scan_folder_dir = self.scan_folder_le.text()
         sg_new_scan_path = self._prepare_sg_field(
-            project_name, sg_shot, row_data, "Scan Data", "sg_scan_path", 
+            shot_info, shot, "Scan Data", "sg_scan_path", 
             extra_path=scan_folder_dir
         )
         return sg_new_scan_path
 
-    def _prepare_plate_resolution(self, project_name, sg_shot, row_data):
+    def _prepare_plate_resolution(self, shot_info, shot):
         sg_new_plate_resolution = self._prepare_sg_field(
-            project_name, sg_shot, row_data, 
+            shot_info, shot, 
             "Plate Resolution", "sg_plate_resolution"
         )
         return sg_new_plate_resolution
 
     def _prepare_sg_field(
-            self, project_name, sg_shot, row_data, 
+            self, shot_info, shot, 
             row_key, sg_key, extra_path=None
     ):
-        if not row_data:
+        if not shot:
             return
 
-        shot_info = sg_manager.get_shot_info(project_name, sg_shot)
         sg_value = shot_info.get(sg_key)
 
-        type_name = row_data.get("Type")
-        version = row_data.get("Version")
-        base_value = row_data.get(row_key)
-        plate_version = f"{type_name}_v{int(version):03}"
+        base_value = shot.text(row_key)
+        plate_version = shot.plate_version
 
         if extra_path:
             scan_path = os.path.join(extra_path, base_value)
@@ -2557,25 +2845,51 @@ class IOManager(ui.IOManager_UI):
 
         return f"{sg_value}\n{new_value}" if sg_value else new_value
     
-    def _process_shot_cache(self, shot_cache, sg_proj_data, row_data):
-        key = (row_data["Sequence"], row_data["Shot Name"])
+    def _snapshot_sg_shots(self, project_name, selected_rows):
+        # Clip Name / Scan Path / Plate Resolution of the batch's Shots in one request, by Shot id
+        shot_codes = {self._get_shot(row).shot_name for row in selected_rows}
+        try:
+            return sg_manager.get_shots_info(project_name, shot_codes)
+        except Exception:
+            logger.error(traceback.format_exc())
+            return {}
+
+    def _get_sg_shot_info(self, sg_shot_infos, project_name, sg_shot):
+        # Shots missing from the snapshot (created during the batch) are read once and kept
+        if sg_shot["id"] not in sg_shot_infos:
+            sg_shot_infos[sg_shot["id"]] = dict(sg_manager.get_shot_info(project_name, sg_shot) or {})
+        return sg_shot_infos[sg_shot["id"]]
+
+    def _prefetch_sg_project(self, sg_proj_data, selected_rows, step_names):
+        # ShotGrid entities of the batch's sequences in a few requests, None looks each one up instead
+        sequence_names = {self._get_shot(row).sequence for row in selected_rows}
+        try:
+            return sg_manager.ProjectIndex(sg_proj_data, sequence_names, step_names)
+        except Exception:
+            logger.error(traceback.format_exc())
+            return None
+
+    def _process_shot_cache(self, shot_cache, sg_proj_data, shot, sg_index=None):
+        key = (shot.sequence, shot.shot_name)
         if key not in shot_cache:
             try:
-                sg_shot = sg_manager.find_or_create_shot(sg_proj_data, row_data["Sequence"], row_data["Shot Name"])
+                sg_shot = sg_manager.find_or_create_shot(sg_proj_data, shot.sequence, shot.shot_name, index=sg_index)
                 shot_cache[key] = sg_shot
             except Exception as e:
                 logger.error(traceback.format_exc())
                 return None, f"샷그리드의 샷 정보를 생성하는 중 오류가 발생했습니다: {e}"
         return shot_cache[key], None
     
-    def _prepare_render_paths(self, project_name, data_root, row_data):
-        plate_root = os.path.join(self.default_drive, project_name, "sequences", row_data["Sequence"], row_data["Shot Name"], "plate")
+    def _prepare_render_paths(self, project_name, data_root, shot):
+        plate_root = os.path.join(self.default_drive, project_name, "sequences", shot.sequence, shot.shot_name, "plate")
         self.ensure_dir_exists(plate_root)
         
-        connect_name = f"{row_data['Shot Name']}_{row_data['Type']}_v{int(row_data['Version']):03}"
-        data_path = os.path.join(data_root, row_data["Scan Data"])
-        valid_mov = [f for f in os.listdir(data_root) if f.startswith(row_data["Scan Data"]) and f.lower().endswith(".mov")]
-        mov_path = os.path.join(data_root, valid_mov[0]) if valid_mov else ""
+        connect_name = shot.connect_name
+        data_path = os.path.join(data_root, shot.scan_data)
+        sequence = self.__sequences.get(shot.scan_data)
+        if sequence:
+            data_path = sequence.folder
+        mov_path = self.find_scan_mov(data_root, shot.scan_data)
         return (plate_root, data_path, mov_path, connect_name)
 
     def _confirm_process(self):
@@ -2684,37 +2998,14 @@ class IOManager(ui.IOManager_UI):
         
         return data, ""
     
-    def _get_row_data(self, row):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
-        
-        row_data = {
-            header: (
-                table.item(row, headers.index(header)).text() 
-                if table.item(row, headers.index(header)) else ""
-                )
-            for header in headers
-            }
-        return row_data
+    def _get_shot(self, row):
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
+        return model.shot(row)
     
     def _get_selected_rows(self):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
         
-        selected_rows = []
-        for row in range(table.rowCount()):
-            render = table.cellWidget(row, headers.index("Render"))
-            ckbx = render.findChild(QCheckBox)
-            if ckbx.isChecked():
-                selected_rows.append(row)
+        selected_rows = [row for row in range(model.rowCount()) if model.is_checked(row)]
         
         if not selected_rows:
             QMessageBox.warning(self, "Warning", "선택된 데이터가 없습니다.")
@@ -2729,31 +3020,17 @@ class IOManager(ui.IOManager_UI):
         return selected_rows
     
     def _validate_row_data(self, selected_rows):
-        if self.__is_edit:
-            table = self.edit_table_widget
-            headers = self.edit_headers
-        else:
-            table = self.plate_table_widget
-            headers = self.headers
+        model = self.edit_table_model if self.__is_edit else self.plate_table_model
         
         for row in selected_rows:
-            sequence_item = table.item(row, headers.index("Sequence"))
-            shot_name_item = table.item(row, headers.index("Shot Name"))
-            scan_data_item = table.item(row, headers.index("Scan Data"))
-            version_item = table.item(row, headers.index("Version"))
-            org_range_item = table.item(row, headers.index("Org Range"))
-            start_frame_item = table.item(row, headers.index("Start Frame"))
-            end_frame_item = table.item(row, headers.index("End Frame"))
-            duration_item = table.item(row, headers.index("Duration"))
-            
-            sequence_item = sequence_item.text() if sequence_item else ""
-            shot_name_item = shot_name_item.text() if shot_name_item else ""
-            scan_data_item = scan_data_item.text() if scan_data_item else ""
-            version_item = version_item.text() if version_item else ""
-            org_range_item = org_range_item.text() if org_range_item else ""
-            start_frame_item = start_frame_item.text() if start_frame_item else ""
-            end_frame_item = end_frame_item.text() if end_frame_item else ""
-            duration_item = duration_item.text() if duration_item else ""
+            sequence_item = model.text(row, "Sequence")
+            shot_name_item = model.text(row, "Shot Name")
+            scan_data_item = model.text(row, "Scan Data")
+            version_item = model.text(row, "Version")
+            org_range_item = model.text(row, "Org Range")
+            start_frame_item = model.text(row, "Start Frame")
+            end_frame_item = model.text(row, "End Frame")
+            duration_item = model.text(row, "Duration")
 
             if not sequence_item:
                 QMessageBox.warning(self, "Warning", f"{scan_data_item}: Sequence 값이 없습니다.")
@@ -2766,7 +3043,7 @@ class IOManager(ui.IOManager_UI):
                 return False 
 
             if self.__is_edit:
-                date_item = table.item(row, headers.index("Date")).text()
+                date_item = model.text(row, "Date")
                 if not date_item:
                     QMessageBox.warning(self, "Warning", f"{scan_data_item}: Date 값이 없습니다.")
                     return False
@@ -2827,6 +3104,11 @@ class IOManager(ui.IOManager_UI):
         
     def closeEvent(self, event):
         self.save_settings()
+        self.plate_scrubber.stop()
+        self.plate_thumbnails.cancel()
+        self.edit_thumbnails.cancel()
+        self.close_thumbnail_atlas(is_edit=False)
+        self.close_thumbnail_atlas(is_edit=True)
         event.accept()
         
     def save_settings(self):
@@ -2908,7 +3190,7 @@ class CustomDelegate(QStyledItemDelegate):
 
     def setEditorData(self, editor, index):
         value = index.model().data(index, Qt.EditRole)
-        if value and value in self.items:
+        if value and editor.findText(value) >= 0:
             editor.setCurrentText(value)
         else:
             editor.setCurrentText(self.default_text)
@@ -2917,26 +3199,6 @@ class CustomDelegate(QStyledItemDelegate):
         value = editor.currentText()
         model.setData(index, value, Qt.EditRole)
 
-class WorkerSignals(QObject):
-    succeeded = Signal(int, str)
-    error_occurred = Signal(int, str)
-    
-class ThumbnailWorker(QRunnable):
-    def __init__(self, row, input_path, output_path, ffmpeg_io):
-        super().__init__()
-        self.row = row
-        self.input_path = input_path
-        self.output_path = output_path
-        self.ffmpeg_io = ffmpeg_io
-        self.signals = WorkerSignals()
-
-    def run(self):
-        try:
-            thumb_path = self.ffmpeg_io.extract_thumbnail(self.input_path, self.output_path)
-            self.signals.succeeded.emit(self.row, thumb_path)
-        except Exception as e:
-            self.signals.error_occurred.emit(self.row, self.input_path)
-
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -85,3 +85,62 @@ DEFAULT_OCIO_CONFIG = "V:/ORV/stuff/spec/_OCIO/config.ocio"
 SEQUENCE_TYPES = [
     ".jpg", ".exr", ".dpx", ".png",
 ]
+
+## PROBE
+# Max concurrent metadata probes (ffprobe / EXR header reads) while loading a scan folder
+PROBE_MAX_WORKERS = 8
+
+# Probe results cache, stored in <scan folder>/_io
+METADATA_CACHE_NAME = "metadata_cache.db"
+
+# Sequences, headers and MOVs found by the last load, stored in <scan folder>/_io
+SCAN_INDEX_NAME = "index.json"
+
+# Quiet time after a change in the loaded scan folder before its rows are refreshed, 0 to not watch it
+SCAN_REFRESH_DELAY_MS = 3000
+
+## THUMBNAIL
+# Scaled thumbnails kept in memory by the table delegates
+THUMBNAIL_CACHE_MB = 256
+
+# Concurrent thumbnail decodes while scrolling
+THUMBNAIL_DECODE_WORKERS = 4
+
+# Concurrent ffmpeg processes / EXR and DPX decodes generating missing thumbnails
+THUMBNAIL_FFMPEG_WORKERS = 4
+
+# Generated thumbnail (width, height) and JPEG quality
+THUMBNAIL_SIZE = (240, 150)
+THUMBNAIL_JPEG_QUALITY = 90
+
+# Thumbnails of a scan folder packed in one file, stored in <scan folder>/_io
+THUMBNAIL_ATLAS_NAME = "thumbnail.atlas"
+
+# 'Cube' column preview of a thumbnail, stored in the atlas as <thumbnail key>@<cube name>
+CUBE_THUMBNAIL_SEPARATOR = "@"
+
+# 3D LUT interpolation of the 'Cube' column thumbnails, "tetrahedral" or "trilinear"
+CUBE_LUT_INTERPOLATION = "tetrahedral"
+
+## SCRUBBER
+# Plate preview frames (width, height), letterboxed
+SCRUBBER_PROXY_SIZE = (640, 360)
+
+# Decoded preview frames kept in memory, shared by every row
+SCRUBBER_BUFFER_MB = 256
+
+# Frames decoded ahead of the playhead
+SCRUBBER_READ_AHEAD = 48
+
+## SHOTGRID
+# Creates / updates sent in one ShotGrid batch request by the plate and edit uploads
+SG_BATCH_SIZE = 50
+
+# ShotGrid connections open at once, one per thread using ShotGrid
+SG_POOL_SIZE = 4
+
+# Seconds a ShotGrid connection is reused without checking it still answers
+SG_KEEP_ALIVE_S = 300
+
+# Seconds a thread waits for a ShotGrid connection when SG_POOL_SIZE are in use
+SG_POOL_TIMEOUT_S = 60
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+from functools import lru_cache
+
+import numpy as np
+
+# Custom Modules
+try:
+    import constants
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+# Pixels per pass, the gathered corner arrays stay in cache
+APPLY_CHUNK_PIXELS = 1 << 14
+
+
+class CubeLUTError(Exception):
+    pass
+
+
+class CubeLUT():
+    """
+    Parsed .cube file (Resolve / Adobe format), a 3D LUT or a 1D LUT.
+    table is float32, (size ** 3, 3) for a 3D LUT with red changing fastest as in the file,
+    (size, 3) for a 1D LUT. domain_min / domain_max are the input range per channel.
+    """
+    def __init__(self, path, table, size, dimensions, domain_min, domain_max, title=""):
+        self.path = path
+        self.table = table
+        self.size = size
+        self.dimensions = dimensions
+        self.domain_min = domain_min
+        self.domain_max = domain_max
+        self.title = title
+
+    def __repr__(self):
+        return f"CubeLUT({os.path.basename(self.path)!r}, {self.dimensions}D, size={self.size})"
+
+    def apply(self, rgb, interpolation=None):
+        return apply_lut(rgb, self, interpolation)
+
+
+def parse_cube(path):
+    """
+    Reads a .cube file into a CubeLUT. Keywords are case sensitive as in the spec,
+    comments (#), blank lines and unknown keywords are skipped.
+    LUT_3D_INPUT_RANGE / LUT_1D_INPUT_RANGE (Resolve) set the domain of all three channels.
+    """
+    title = ""
+    size = None
+    dimensions = None
+    domain_min = np.zeros(3, dtype=np.float32)
+    domain_max = np.ones(3, dtype=np.float32)
+    values = []
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            # Table lines are the bulk of the file, checked first
+            if line[0].isdigit() or line[0] in "-+.":
+                values.append(line)
+                continue
+
+            keyword, _, value = line.partition(" ")
+            value = value.strip()
+            try:
+                if keyword == "TITLE":
+                    title = value.strip('"')
+                elif keyword == "LUT_3D_SIZE":
+                    size, dimensions = int(value), 3
+                elif keyword == "LUT_1D_SIZE":
+                    size, dimensions = int(value), 1
+                elif keyword == "DOMAIN_MIN":
+                    domain_min = np.array(value.split(), dtype=np.float32)
+                elif keyword == "DOMAIN_MAX":
+                    domain_max = np.array(value.split(), dtype=np.float32)
+                elif keyword in ("LUT_3D_INPUT_RANGE", "LUT_1D_INPUT_RANGE"):
+                    # Resolve: one input range for all channels
+                    range_min, range_max = (float(v) for v in value.split())
+                    domain_min = np.full(3, range_min, dtype=np.float32)
+                    domain_max = np.full(3, range_max, dtype=np.float32)
+                else:
+                    logger.debug(f"Unknown keyword {keyword} ignored in {path}:{line_no}")
+            except ValueError:
+                raise CubeLUTError(f"Invalid {keyword} in {path}:{line_no}")
+
+    if size is None:
+        raise CubeLUTError(f"No LUT_3D_SIZE / LUT_1D_SIZE in {path}")
+    if size < 2:
+        raise CubeLUTError(f"LUT size {size} in {path}")
+    if domain_min.shape != (3,) or domain_max.shape != (3,) or np.any(domain_max <= domain_min):
+        raise CubeLUTError(f"Invalid DOMAIN_MIN / DOMAIN_MAX in {path}")
+
+    expected = size ** 3 if dimensions == 3 else size
+    try:
+        table = np.array(" ".join(values).split(), dtype=np.float32)
+    except ValueError:
+        raise CubeLUTError(f"Invalid table value in {path}")
+    if table.size != expected * 3:
+        raise CubeLUTError(f"Expected {expected} entries, found {table.size / 3:g} in {path}")
+
+    return CubeLUT(path, table.reshape(expected, 3), size, dimensions, domain_min, domain_max, title)
+
+
+@lru_cache(maxsize=32)
+def _load_cube(path, mtime):
+    start = time.perf_counter()
+    lut = parse_cube(path)
+    logger.debug(f"Cube parsed in {time.perf_counter() - start:.3f}s: {lut}")
+    return lut
+
+
+def load_cube(path):
+    """
+    Parsed LUT of the .cube file, cached until the file is modified.
+    """
+    return _load_cube(os.path.normpath(path), os.stat(path).st_mtime_ns)
+
+
+def apply_lut(rgb, lut, interpolation=None):
+    """
+    Applies the LUT to an (..., 3) array. uint8 input is read as code values / 255,
+    float input as is. Returns float32 of the same shape, not clipped.
+    interpolation is "tetrahedral" or "trilinear" (3D LUTs only), constants.CUBE_LUT_INTERPOLATION by default.
+    """
+    interpolation = interpolation or constants.CUBE_LUT_INTERPOLATION
+    if interpolation not in ("tetrahedral", "trilinear"):
+        raise CubeLUTError(f"Unknown interpolation: {interpolation}")
+
+    rgb = np.asarray(rgb)
+    shape = rgb.shape
+    pixels = rgb.reshape(-1, 3)
+    output = np.empty(pixels.shape, dtype=np.float32)
+
+    # uint8 input: lattice index and weight of each of the 256 code values, looked up per pixel
+    code_tables = _code_tables(lut) if pixels.dtype == np.uint8 else None
+
+    for start in range(0, len(pixels), APPLY_CHUNK_PIXELS):
+        chunk = pixels[start:start + APPLY_CHUNK_PIXELS]
+        if code_tables:
+            index_table, weight_table = code_tables
+            index = [np.take(index_table[c], chunk[:, c]) for c in range(3)]
+            weight = [np.take(weight_table[c], chunk[:, c]) for c in range(3)]
+        else:
+            index, weight = _lattice(chunk.astype(np.float32), lut)
+
+        if lut.dimensions == 1:
+            output[start:start + len(chunk)] = _apply_1d(lut, index, weight)
+        elif interpolation == "tetrahedral":
+            output[start:start + len(chunk)] = _apply_tetrahedral(lut, index, weight)
+        else:
+            output[start:start + len(chunk)] = _apply_trilinear(lut, index, weight)
+    return output.reshape(shape)
+
+
+def apply_lut_uint8(rgb, lut, interpolation=None):
+    # Display image in, display image out
+    output = apply_lut(rgb, lut, interpolation)
+    np.clip(output, 0.0, 1.0, out=output)
+    output *= 255.0
+    output += 0.5
+    return output.astype(np.uint8)
+
+
+def _lattice(values, lut):
+    """
+    Lower lattice index (int32, 0..size - 2) and weight (float32, 0..1) of each channel.
+    Values outside the domain are clamped to the table edges.
+    """
+    scale = (lut.size - 1) / (lut.domain_max - lut.domain_min)
+    scaled = ((values - lut.domain_min) * scale).astype(np.float32)
+    np.clip(scaled, 0.0, lut.size - 1, out=scaled)
+    lower = np.minimum(scaled.astype(np.int32), lut.size - 2)
+    weight = scaled - lower.astype(np.float32)
+    return [lower[:, c] for c in range(3)], [weight[:, c] for c in range(3)]
+
+
+@lru_cache(maxsize=32)
+def _code_tables(lut):
+    codes = np.repeat(np.arange(256, dtype=np.float32)[:, None] / 255.0, 3, axis=1)
+    return _lattice(codes, lut)
+
+
+def _apply_1d(lut, index, weight):
+    table = lut.table
+    return np.stack([
+        table[index[c], c] * (1.0 - weight[c]) + table[index[c] + 1, c] * weight[c] for c in range(3)
+    ], axis=-1)
+
+
+def _corner(table, offset):
+    # np.take is several times faster than fancy indexing for row gathers
+    return np.take(table, offset, axis=0)
+
+
+def _lerp(a, b, weight):
+    # a + (b - a) * weight, in place on b
+    b -= a
+    b *= weight
+    b += a
+    return b
+
+
+def _apply_trilinear(lut, index, weight):
+    table = lut.table
+    size = lut.size
+    r, g, b = index
+    fr, fg, fb = (w[:, None] for w in weight)
+    base = (b * size + g) * size + r
+    dr, dg, db = 1, size, size * size
+
+    c00 = _lerp(_corner(table, base), _corner(table, base + dr), fr)
+    c10 = _lerp(_corner(table, base + dg), _corner(table, base + dg + dr), fr)
+    c01 = _lerp(_corner(table, base + db), _corner(table, base + db + dr), fr)
+    c11 = _lerp(_corner(table, base + db + dg), _corner(table, base + db + dg + dr), fr)
+    return _lerp(_lerp(c00, c10, fg), _lerp(c01, c11, fg), fb)
+
+
+@lru_cache(maxsize=8)
+def _tetrahedron_steps(size):
+    """
+    Offsets of the corners after the first and second step, indexed by
+    (r >= g) << 2 | (r >= b) << 1 | (g >= b).
+    """
+    dr, dg, db = 1, size, size * size
+    first_step = np.empty(8, dtype=np.int32)
+    second_step = np.empty(8, dtype=np.int32)
+    for order in range(8):
+        r_over_g, r_over_b, g_over_b = bool(order & 4), bool(order & 2), bool(order & 1)
+        if r_over_g and r_over_b:
+            first_step[order] = dr
+        elif not r_over_g and g_over_b:
+            first_step[order] = dg
+        else:
+            first_step[order] = db
+        if g_over_b:
+            last_step = db if r_over_b else dr
+        else:
+            last_step = dg if r_over_g else dr
+        second_step[order] = dr + dg + db - last_step
+    return first_step, second_step
+
+
+def _apply_tetrahedral(lut, index, weight):
+    """
+    The cube cell is split into 6 tetrahedra along the diagonal. Walking from the lower corner
+    to the upper one, the axis with the largest weight is stepped first, then the middle one:
+    out = c000 + (c1 - c000) * max + (c2 - c1) * mid + (c111 - c2) * min
+    where c1 / c2 are the corners after the first / second step. 4 table reads per pixel instead of 8.
+    """
+    table = lut.table
+    size = lut.size
+    r, g, b = index
+    fr, fg, fb = weight
+    base = (b * size + g) * size + r
+    dr, dg, db = 1, size, size * size
+
+    # Tetrahedron of each pixel from the 3 weight comparisons, ties are ordered r, g, b
+    first_step, second_step = _tetrahedron_steps(size)
+    order = (fr >= fg).view(np.uint8) << 2
+    order |= (fr >= fb).view(np.uint8) << 1
+    order |= (fg >= fb).view(np.uint8)
+    w_max = np.maximum(np.maximum(fr, fg), fb)
+    w_min = np.minimum(np.minimum(fr, fg), fb)
+    w_mid = fr + fg + fb - w_max - w_min
+
+    c000 = _corner(table, base)
+    c1 = _corner(table, base + np.take(first_step, order))
+    c2 = _corner(table, base + np.take(second_step, order))
+    c111 = _corner(table, base + (dr + dg + db))
+
+    c111 -= c2
+    c111 *= w_min[:, None]
+    c2 -= c1
+    c2 *= w_mid[:, None]
+    c1 -= c000
+    c1 *= w_max[:, None]
+    c000 += c1
+    c000 += c2
+    c000 += c111
+    return c000
+
+
+if __name__ == "__main__":
+    # Benchmark: python cube_lut.py <cube_file> [thumbnails]
+    cube_path = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\luts\show.cube"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    width, height = constants.THUMBNAIL_SIZE
+
+    start = time.perf_counter()
+    lut = load_cube(cube_path)
+    print(f"Parse        : {time.perf_counter() - start:.3f}s {lut}")
+    start = time.perf_counter()
+    load_cube(cube_path)
+    print(f"Parse cached : {time.perf_counter() - start:.5f}s")
+
+    images = np.random.randint(0, 256, (count, height, width, 3), dtype=np.uint8)
+    for interpolation in ("trilinear", "tetrahedral"):
+        start = time.perf_counter()
+        apply_lut_uint8(images, lut, interpolation)
+        print(f"{interpolation:12} : {time.perf_counter() - start:.3f}s ({count} thumbnails {width}x{height})")
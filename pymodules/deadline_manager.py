@@ -71,12 +71,12 @@ class DeadlineManager():
         return deadline_job['_id']
     
     def submit_nuke_to_deadline(
-        self, nk_path, row_data, render_settings, depen_list=[], grp_name="", 
+        self, nk_path, shot, render_settings, depen_list=[], grp_name="", 
         export_plate=False, export_jpg=True, export_mov=True, export_png=False,
         ):
         
-        start_frame = int(row_data.get('Start Frame')) if row_data.get('Start Frame') else 0
-        end_frame = int(row_data.get('End Frame')) if row_data.get('End Frame') else 0
+        start_frame = shot.start_frame or 0
+        end_frame = shot.end_frame or 0
         priority = int(render_settings.get('priority')) if render_settings.get('priority') else 50
         
         # Job configuration
@@ -258,11 +258,11 @@ class DeadlineManager():
 
         return copy_id_list
     
-    def submit_sg_upload_to_deadline(self, ver_dict, input_file, proxy_mov, row_data, render_settings, project_name, depen_list=[], grp_name='', remove_mov=False):
+    def submit_sg_upload_to_deadline(self, ver_dict, input_file, proxy_mov, shot, render_settings, project_name, depen_list=[], grp_name='', remove_mov=False):
         """Deadline을 통해 ShotGrid에 Version 업로드"""
         # ShotGrid 업로드 스크립트 생성
-        first_frame = row_data.get('Start Frame')
-        last_frame = row_data.get('End Frame')
+        first_frame = shot.start_frame
+        last_frame = shot.end_frame
         fps = render_settings.get('fps')
         priority = render_settings.get('priority')
         
@@ -2,6 +2,7 @@
 
 import os
 import sys
+from io import BytesIO
 
 import pandas as pd
 import openpyxl
@@ -25,7 +26,10 @@ class ExcelManager():
         self.headers = constants.HEADERS
         self.headers_readonly = constants.READONLY_HEADERS
         
-    def make_excel(self, parent, data_root, row_cnt, col_cnt, output_path, data, tab_name, start_frame_header_name="Start Frame"):
+    def make_excel(self, parent, data_root, row_cnt, col_cnt, output_path, data, tab_name, start_frame_header_name="Start Frame", thumbnail_reader=None):
+        """
+        thumbnail_reader: returns the JPEG bytes of a 'Thumbnail' value that is not a file (atlas reference)
+        """
 
         # validate data
         validate_result = self.validate_data(parent, data_root, row_cnt, col_cnt, output_path, data)
@@ -57,7 +61,15 @@ class ExcelManager():
             # Set Thumbnail
             thumbnail_col_index = self.headers.index("Thumbnail")
             for row, thum in enumerate(df['Thumbnail'], start=1):
-                if thum:  # Ensure thumbnail path exists
+                if not thum:
+                    continue
+                image_data = thumbnail_reader(thum) if thumbnail_reader else None
+                if image_data:
+                    worksheet.insert_image(
+                        row, thumbnail_col_index, "thumbnail.jpg",
+                        {'image_data': BytesIO(image_data), 'x_scale': 1, 'y_scale': 1}
+                        )
+                else:
                     worksheet.insert_image(row, thumbnail_col_index, thum, {'x_scale': 1, 'y_scale': 1})
             
             # Set Column
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import mmap
+import time
+import struct
+from typing import NamedTuple, Optional, Tuple
+
+import pydpx_meta
+
+# Custom Modules
+try:
+    import constants
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+FILMLIGHT_CLIP_ATTR = "uk.ltd.filmlight.Clip"
+CAMERA_CLIP_ATTR = "interim.clip.cameraClipName"
+
+COMPRESSION_NAMES = [
+    "none", "rle", "zips", "zip", "piz", "pxr24", "b44", "b44a", "dwaa", "dwab"
+]
+
+# EXR file layout
+EXR_MAGIC = 20000630
+EXR_VERSION = 2
+MULTIPART_FLAG = 0x1000
+MAX_NAME_LENGTH = 256
+
+
+class ExrHeaderError(Exception):
+    pass
+
+
+class ExrHeader(NamedTuple):
+    path: str
+    data_window: Tuple[int, int, int, int]  # xmin, ymin, xmax, ymax
+    display_window: Optional[Tuple[int, int, int, int]]
+    timecode: Optional[str]
+    filmlight_clip: str
+    camera_clip: str
+    compression: Optional[str]
+
+
+class SequenceHeader(NamedTuple):
+    """
+    Header facts of one sequence row, harvested from its first and last frame.
+    """
+    width: Optional[int]
+    height: Optional[int]
+    start_tc: Optional[str]
+    end_tc: Optional[str]
+    clip_name: str
+    clip_names: Tuple[str, ...]
+    compression: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data["clip_names"] = tuple(data["clip_names"])
+        return cls(**data)
+
+
+def read_exr_header(path):
+    """
+    Header of the first part of an EXR file, read without the OpenEXR binding.
+    """
+    header = read_exr_parts(path)[0]
+    if "dataWindow" not in header:
+        raise ExrHeaderError(f"dataWindow attribute not found: {path}")
+
+    return ExrHeader(
+        path,
+        header["dataWindow"],
+        header.get("displayWindow"),
+        header.get("timeCode") or None,
+        _get_header_string(header, FILMLIGHT_CLIP_ATTR),
+        _get_header_string(header, CAMERA_CLIP_ATTR),
+        header.get("compression"),
+    )
+
+
+def read_exr_parts(path):
+    """
+    Decoded attributes of every part header, one dict per part.
+    The file is memory-mapped, so only the pages holding the header are read
+    in; pixel data and the offset tables are never touched.
+    Only box2i, timecode, string and compression attributes are decoded,
+    the other attribute types are skipped.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < 9:
+            raise ExrHeaderError(f"File too small: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version = struct.unpack_from("<ii", mm, 0)
+            if magic != EXR_MAGIC:
+                raise ExrHeaderError(f"Not an OpenEXR file: {path}")
+            if version & 0xff != EXR_VERSION:
+                raise ExrHeaderError(f"Unsupported OpenEXR version {version & 0xff}: {path}")
+
+            # Single part (scanline or tiled) has one header, multipart ends with an empty one
+            offset = 8
+            if not version & MULTIPART_FLAG:
+                return [_read_header(mm, offset)[0]]
+
+            parts = []
+            while offset < len(mm):
+                header, offset = _read_header(mm, offset)
+                if not header:
+                    break
+                parts.append(header)
+
+    if not parts:
+        raise ExrHeaderError(f"No part header found: {path}")
+    return parts
+
+
+def _read_header(buf, offset):
+    header = {}
+    while True:
+        name, offset = _read_cstring(buf, offset)
+        if not name:
+            return header, offset
+        type_name, offset = _read_cstring(buf, offset)
+        size = struct.unpack_from("<i", buf, offset)[0]
+        offset += 4
+        if size < 0 or offset + size > len(buf):
+            raise ExrHeaderError(f"Invalid attribute size {name}: {size}")
+
+        decoder = ATTRIBUTE_DECODERS.get(type_name)
+        if decoder:
+            header[name] = decoder(buf[offset:offset + size])
+        offset += size
+
+
+def _read_cstring(buf, offset):
+    end = buf.find(b"\x00", offset, offset + MAX_NAME_LENGTH)
+    if end < 0:
+        raise ExrHeaderError(f"Unterminated attribute name at {offset}")
+    return buf[offset:end].decode("ascii", errors="ignore"), end + 1
+
+
+def _decode_box2i(value):
+    return struct.unpack("<iiii", value)
+
+
+def _decode_compression(value):
+    compression = value[0]
+    if compression < len(COMPRESSION_NAMES):
+        return COMPRESSION_NAMES[compression]
+    return str(compression)
+
+
+def _decode_string(value):
+    return value.decode("utf-8", errors="ignore")
+
+
+def _decode_timecode(value):
+    # SMPTE 12M packed BCD, same 'HH:MM:SS:FF' as Imath.TimeCode formatted before
+    time_and_flags = struct.unpack_from("<I", value)[0]
+    frame = _bcd(time_and_flags, 0, 0x3)
+    seconds = _bcd(time_and_flags, 8, 0x7)
+    minutes = _bcd(time_and_flags, 16, 0x7)
+    hours = _bcd(time_and_flags, 24, 0x3)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frame:02d}"
+
+
+def _bcd(value, shift, tens_mask):
+    return (value >> shift & 0xf) + (value >> shift + 4 & tens_mask) * 10
+
+
+ATTRIBUTE_DECODERS = {
+    "box2i": _decode_box2i,
+    "compression": _decode_compression,
+    "string": _decode_string,
+    "timecode": _decode_timecode,
+}
+
+
+def harvest_sequence_header(start_frame_path, end_frame_path):
+    """
+    Opens the first and last frame exactly once each.
+    """
+    file_format = os.path.splitext(start_frame_path)[-1].lower()
+    folder_name = os.path.basename(os.path.dirname(start_frame_path))
+
+    if file_format == ".exr":
+        first = read_exr_header(start_frame_path)
+        last = first if end_frame_path == start_frame_path else read_exr_header(end_frame_path)
+
+        xmin, ymin, xmax, ymax = first.data_window
+        clip_names = [name for name in (first.filmlight_clip, first.camera_clip) if name]
+        clip_name = first.camera_clip or first.filmlight_clip or "None"
+        has_tc = first.timecode and last.timecode
+
+        return SequenceHeader(
+            xmax - xmin + 1,
+            ymax - ymin + 1,
+            first.timecode if has_tc else None,
+            last.timecode if has_tc else None,
+            clip_name,
+            tuple(clip_names) if clip_names else (folder_name,),
+            first.compression,
+        )
+
+    start_tc = None
+    end_tc = None
+    if file_format == ".dpx":
+        try:
+            start_tc = pydpx_meta.DpxHeader(start_frame_path).tv_header.time_code
+            end_tc = pydpx_meta.DpxHeader(end_frame_path).tv_header.time_code
+        except:
+            start_tc = None
+            end_tc = None
+
+    return SequenceHeader(None, None, start_tc or None, end_tc or None, "None", (folder_name,), None)
+
+
+def _get_header_string(header, key):
+    value = header.get(key)
+    if not value:
+        return ""
+    return os.path.splitext(value)[0]
+
+
+if __name__ == "__main__":
+    # Benchmark against the OpenEXR binding: python exr_manager.py <exr_folder>
+    exr_root = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan"
+    paths = []
+    for root, dirs, files in os.walk(exr_root):
+        paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(".exr"))
+    print(f"{len(paths)} exr files in {exr_root}")
+    if not paths:
+        sys.exit()
+
+    print(read_exr_header(paths[0]))
+
+    start = time.perf_counter()
+    for path in paths:
+        read_exr_header(path)
+    native_time = time.perf_counter() - start
+    print(f"Native  : {native_time:.3f}s ({native_time / len(paths) * 1000:.3f} ms/file)")
+
+    start = time.perf_counter()
+    import OpenEXR
+    import_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for path in paths:
+        OpenEXR.InputFile(path).header()
+    openexr_time = time.perf_counter() - start
+    print(f"OpenEXR : {openexr_time:.3f}s ({openexr_time / len(paths) * 1000:.3f} ms/file), import {import_time:.3f}s")
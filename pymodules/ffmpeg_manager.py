@@ -2,7 +2,10 @@
 
 import os
 import sys
+import json
 import subprocess
+from typing import NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 from timecode import Timecode
 from fractions import Fraction
 
@@ -42,68 +45,96 @@ class FFMPEGManager():
             logger.error(f"Error processing {input_path}: {e}")
             return None
         
-    def extract_mov_metadata(self, input_path):
+    def probe_mov(self, input_path):
+        """
+        Single ffprobe call (JSON output) returning a MovProbe, or None on failure.
+        """
         if not os.path.exists(input_path):
             print(f"File not found: {input_path}")
             logger.error(f"File not found: {input_path}")
             return None
         
-        result = {}
         cmd = [
             'ffprobe', '-v', 'error',
-            '-select_streams', 'v:0', '-show_entries', 
-            'stream_tags=timecode:stream=r_frame_rate:stream=width,height:format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', input_path
+            '-print_format', 'json',
+            '-show_streams', '-show_format',
+            input_path
         ]
         try:
-            # output = ['1920\r', '1080\r', '24/1\r', '00:03:27:23\r', '1.791667']
-            output = subprocess.check_output(cmd).decode().strip().split('\n')
-            width = int(output[0].strip())
-            height = int(output[1].strip())
-            fps = round(float(Fraction(output[2].strip())), 3)
-            start_tc = output[3].strip()
-            duration = round(float(output[4].strip()) * fps)
-            end_tc = Timecode(fps, start_tc) + duration - 1
-
-            result["start_tc"] = start_tc
-            result["duration"] = duration
-            result["fps"] = fps
-            result["end_tc"] = end_tc
-            result["width"] = width
-            result["height"] = height
-            return result
+            output = subprocess.check_output(cmd)
+            return parse_probe_json(json.loads(output.decode("utf-8", errors="ignore")))
         except Exception as e:
             print(f"Error processing {input_path}: {e}")
             logger.error(f"Error processing {input_path}: {e}")
             return None
     
-    def extract_mov_clip_name(self, input_path):
+    def probe_mov_batch(self, input_paths, max_workers=None):
+        """
+        Probes many MOVs concurrently. Returns {input_path: MovProbe or None}.
+        """
+        max_workers = max_workers or constants.PROBE_MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(input_paths, executor.map(self.probe_mov, input_paths)))
+
+
+class MovProbe(NamedTuple):
+    width: int
+    height: int
+    r_frame_rate: str
+    fps: float
+    duration: int
+    start_tc: Optional[str]
+    end_tc: Optional[str]
+    reel_name: Optional[str]
+
+
+def parse_probe_json(data):
+    streams = data.get("streams", [])
+    fmt = data.get("format", {})
+    
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if not video:
+        return None
+    
+    # tmcd track is exposed as a data stream
+    tmcd = next(
+        (s for s in streams if s.get("codec_type") == "data" and s.get("codec_tag_string") == "tmcd"), None
+    )
+    if not tmcd:
+        tmcd = next((s for s in streams if s.get("codec_type") == "data"), None)
+    tmcd_tags = tmcd.get("tags", {}) if tmcd else {}
+    
+    r_frame_rate = video.get("r_frame_rate", "0/1")
+    
+    # nb_frames is exact for mov, format duration is the fallback
+    duration = int(video.get("nb_frames") or 0)
+    if not duration and r_frame_rate != "0/0":
+        duration = round(float(video.get("duration") or fmt.get("duration") or 0) * float(Fraction(r_frame_rate)))
+    
+    start_tc = (
+        tmcd_tags.get("timecode")
+        or video.get("tags", {}).get("timecode")
+        or fmt.get("tags", {}).get("timecode")
+    )
+    reel_name = tmcd_tags.get("reel_name") or fmt.get("tags", {}).get("reel_name")
+    
+    return build_mov_probe(int(video["width"]), int(video["height"]), r_frame_rate, duration, start_tc, reel_name)
+
+
+def build_mov_probe(width, height, r_frame_rate, duration, start_tc, reel_name):
+    fps = round(float(Fraction(r_frame_rate)), 3) if r_frame_rate != "0/0" else 0.0
+    
+    end_tc = None
+    if start_tc and fps and duration:
+        end_tc = str(Timecode(fps, start_tc) + duration - 1)
+    
+    return MovProbe(width, height, r_frame_rate, fps, duration, start_tc, end_tc, reel_name or None)
 
-        if not os.path.exists(input_path):
-            print(f"File not found: {input_path}")
-            logger.error(f"File not found: {input_path}")
-            return None
-        
-        cmd = [
-            'ffprobe', '-v', 'error',
-            '-select_streams', 'd:0', '-show_entries', 
-            'stream_tags=reel_name',
-            '-of', 'default=noprint_wrappers=1:nokey=1', input_path
-        ]
-        try:
-            output = subprocess.check_output(cmd).decode().strip()
-            clip_name = output if output else None
-            return clip_name
-        
-        except Exception as e:
-            print(f"Error processing {input_path}: {e}")
-            logger.error(f"Error processing {input_path}: {e}")
-            return None
 
 if __name__ == "__main__":
     manager = FFMPEGManager()
     input_path = r"C:\workspace\101_S004_0010_mp0_v001.mov"
-    res = manager.extract_mov_metadata(input_path)
+    res = manager.probe_mov(input_path)
     print(res)
     
     
\ No newline at end of file
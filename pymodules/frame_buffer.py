@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import subprocess
+import threading
+from fractions import Fraction
+
+import numpy as np
+from PySide2.QtCore import QSize, QThread, Signal
+from PySide2.QtGui import QImage, QImageReader
+
+# Custom Modules
+try:
+    import constants
+    from ffmpeg_manager import FFMPEGManager
+    from thumbnail_manager import OpenEXR, read_exr_thumbnail, read_dpx_thumbnail, fit_size
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.ffmpeg_manager import FFMPEGManager
+    from pymodules.thumbnail_manager import OpenEXR, read_exr_thumbnail, read_dpx_thumbnail, fit_size
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+
+class FrameRingBuffer():
+    """
+    Decoded proxy frames of any number of plates in one preallocated ring of equal slots,
+    frames are letterboxed into width x height RGB so every slot has the same size.
+    Memory is max_bytes whatever is played, the oldest written slot is reused first.
+    Keys are (source key, frame). put() is called from the read-ahead thread, image() from the GUI thread.
+    """
+    def __init__(self, max_bytes=None, size=None):
+        self.width, self.height = size or constants.SCRUBBER_PROXY_SIZE
+        self.frame_bytes = self.width * self.height * 3
+        self.slot_count = max(2, (max_bytes or constants.SCRUBBER_BUFFER_MB * 1024 * 1024) // self.frame_bytes)
+
+        self.__slots = None  # (slot_count, height, width, 3) uint8, allocated on the first put
+        self.__slot_keys = [None] * self.slot_count
+        self.__index = {}  # key: slot
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self.__index
+
+    def __len__(self):
+        return len(self.__index)
+
+    def put(self, key, rgb):
+        canvas = letterbox(rgb, self.width, self.height)
+        with self.__lock:
+            if self.__slots is None:
+                self.__slots = np.empty((self.slot_count, self.height, self.width, 3), dtype=np.uint8)
+            slot = self.__index.get(key)
+            if slot is None:
+                slot = self.__next
+                self.__next = (self.__next + 1) % self.slot_count
+                old_key = self.__slot_keys[slot]
+                if old_key is not None:
+                    del self.__index[old_key]
+                self.__slot_keys[slot] = key
+                self.__index[key] = slot
+            self.__slots[slot] = canvas
+
+    def image(self, key):
+        """
+        QImage copy of the frame, None if it is not in the buffer.
+        """
+        with self.__lock:
+            slot = self.__index.get(key)
+            if slot is None:
+                return None
+            frame = self.__slots[slot]
+            return QImage(frame.data, self.width, self.height, self.width * 3, QImage.Format_RGB888).copy()
+
+    def clear(self):
+        with self.__lock:
+            self.__index.clear()
+            self.__slot_keys = [None] * self.slot_count
+            self.__next = 0
+
+
+class SequenceFrameSource():
+    """
+    Frames of an ImageSequence by frame number. EXR and DPX are decoded in process
+    (thumbnail_manager readers), other types with Qt, and ffmpeg when those fail.
+    """
+    def __init__(self, sequence):
+        self.sequence = sequence
+        self.key = f"{sequence.folder}/{sequence.label}"
+
+    def read(self, frame, width, height):
+        path = self.sequence.frame_path(frame)
+        if not os.path.isfile(path):
+            return None
+        ext = self.sequence.ext.lower()
+        try:
+            if ext == ".exr" and OpenEXR is not None:
+                return read_exr_thumbnail(path, width, height)
+            if ext == ".dpx":
+                return read_dpx_thumbnail(path, width, height)
+            if ext in (".jpg", ".jpeg", ".png"):
+                return read_qt_image(path, width, height)
+        except Exception as e:
+            logger.debug(f"In-process decode failed, using ffmpeg: {path}: {e}")
+        return ffmpeg_frame(path, width, height)
+
+    def close(self):
+        pass
+
+
+class MovFrameSource():
+    """
+    Frames of a MOV from one ffmpeg process piping scaled rgb24 frames,
+    frame first_frame is the first frame of the MOV. Reading on from the last frame keeps the pipe,
+    any other frame restarts ffmpeg with an input seek.
+    """
+    def __init__(self, path, first_frame):
+        self.path = path
+        self.key = path
+        self.first_frame = first_frame
+        self.__fps = None
+        self.__process = None
+        self.__next_index = None
+        self.__size = None
+
+    def read(self, frame, width, height):
+        index = frame - self.first_frame
+        if index < 0:
+            return None
+        if self.__process is None or self.__next_index != index or self.__size != (width, height):
+            self.__start(index, width, height)
+
+        data = self.__process.stdout.read(width * height * 3)
+        if len(data) < width * height * 3:
+            self.close()
+            return None
+        self.__next_index = index + 1
+        return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+    def close(self):
+        if self.__process is not None:
+            self.__process.kill()
+            self.__process.stdout.close()
+            self.__process.wait()
+            self.__process = None
+        self.__next_index = None
+
+    def __start(self, index, width, height):
+        self.close()
+        if self.__fps is None:
+            probe = FFMPEGManager().probe_mov(self.path)
+            rate = probe.r_frame_rate if probe else "0/0"
+            self.__fps = Fraction(rate) if rate != "0/0" else Fraction(24)
+
+        cmd = [
+            'ffmpeg', '-loglevel', 'error',
+            '-ss', f"{float(index / self.__fps):.6f}",
+            '-i', self.path,
+            '-vf', proxy_filter(width, height),
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'
+        ]
+        self.__process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=width * height * 3
+        )
+        self.__size = (width, height)
+        self.__next_index = index
+
+
+class FrameReadAhead(QThread):
+    """
+    Decodes the frames after the playhead into the buffer on a background thread.
+    The frame asked for comes first, then the next read_ahead frames, wrapping inside the
+    play range so a loop stays in memory when it fits the buffer.
+    frame_ready is emitted for each decoded frame of the current source.
+    """
+    frame_ready = Signal(object, int)  # source key, frame
+
+    def __init__(self, buffer, read_ahead=None, parent=None):
+        super(FrameReadAhead, self).__init__(parent)
+        self.buffer = buffer
+        # Never more than half the ring ahead, the frames just played stay for scrubbing back
+        self.read_ahead = min(read_ahead or constants.SCRUBBER_READ_AHEAD, buffer.slot_count // 2)
+
+        self.__condition = threading.Condition()
+        self.__source = None
+        self.__closing = []  # sources to close on the thread that reads them
+        self.__range = (0, -1)
+        self.__playhead = 0
+        self.__stopped = False
+
+    def set_source(self, source, first, last):
+        with self.__condition:
+            if self.__source is not None:
+                self.__closing.append(self.__source)
+            self.__source = source
+            self.__range = (first, last)
+            self.__playhead = first
+            self.__condition.notify()
+
+    def set_range(self, first, last):
+        with self.__condition:
+            self.__range = (first, last)
+            self.__condition.notify()
+
+    def request(self, frame):
+        with self.__condition:
+            self.__playhead = frame
+            self.__condition.notify()
+
+    def stop(self):
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self.__condition:
+                for source in self.__closing:
+                    source.close()
+                self.__closing = []
+
+                frame = self.__next_frame()
+                while frame is None and not self.__stopped:
+                    self.__condition.wait()
+                    for source in self.__closing:
+                        source.close()
+                    self.__closing = []
+                    frame = self.__next_frame()
+                if self.__stopped:
+                    break
+                source = self.__source
+
+            try:
+                rgb = source.read(frame, self.buffer.width, self.buffer.height)
+            except Exception as e:
+                logger.error(f"Failed to decode frame {frame} of {source.key}: {e}")
+                rgb = None
+            if rgb is None:
+                # Missing frame, kept black so the playhead does not wait on it
+                rgb = np.zeros((self.buffer.height, self.buffer.width, 3), dtype=np.uint8)
+            self.buffer.put((source.key, frame), rgb)
+            self.frame_ready.emit(source.key, frame)
+
+        # Sources swapped out right before stop() are still queued here
+        for source in self.__closing:
+            source.close()
+        self.__closing = []
+        if self.__source is not None:
+            self.__source.close()
+
+    def __next_frame(self):
+        # First frame from the playhead on that is not buffered yet, called with the condition held
+        if self.__source is None:
+            return None
+        first, last = self.__range
+        if last < first:
+            return None
+        playhead = self.__playhead
+        if not first <= playhead <= last:
+            # Scrubbed outside the play range, that frame then the range from its start
+            if (self.__source.key, playhead) not in self.buffer:
+                return playhead
+            playhead = first
+        length = last - first + 1
+        for step in range(min(self.read_ahead, length)):
+            frame = first + (playhead - first + step) % length
+            if (self.__source.key, frame) not in self.buffer:
+                return frame
+        return None
+
+
+def letterbox(rgb, width, height):
+    h, w = rgb.shape[:2]
+    if (h, w) == (height, width):
+        return rgb
+    h, w = min(h, height), min(w, width)
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    y = (height - h) // 2
+    x = (width - w) // 2
+    canvas[y:y + h, x:x + w] = rgb[:h, :w]
+    return canvas
+
+
+def proxy_filter(width, height):
+    return (
+        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+    )
+
+
+def read_qt_image(path, width, height):
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(QSize(*fit_size(size.width(), size.height(), width, height)))
+    image = reader.read()
+    if image.isNull():
+        raise IOError(reader.errorString())
+    image = image.convertToFormat(QImage.Format_RGB888)
+    stride = image.bytesPerLine()
+    lines = np.frombuffer(image.constBits(), dtype=np.uint8, count=stride * image.height())
+    lines = lines.reshape(image.height(), stride)
+    return lines[:, :image.width() * 3].reshape(image.height(), image.width(), 3).copy()
+
+
+def ffmpeg_frame(path, width, height):
+    cmd = [
+        'ffmpeg', '-loglevel', 'error',
+        '-i', path,
+        '-vf', proxy_filter(width, height),
+        '-frames:v', '1',
+        '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'
+    ]
+    try:
+        data = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True).stdout
+    except Exception as e:
+        logger.error(f"Error processing {path}: {e}")
+        return None
+    if len(data) < width * height * 3:
+        return None
+    return np.frombuffer(data[:width * height * 3], dtype=np.uint8).reshape(height, width, 3)
+
+
+if __name__ == "__main__":
+    # Benchmark: python frame_buffer.py <mov or frame folder>
+    from PySide2.QtCore import QCoreApplication
+    try:
+        from sequence_manager import scan_image_sequences
+    except:
+        from pymodules.sequence_manager import scan_image_sequences
+
+    app = QCoreApplication(sys.argv)
+    path = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan\A001C003"
+    if os.path.isdir(path):
+        sequence = scan_image_sequences(path, constants.SEQUENCE_TYPES)[0]
+        source, first, last = SequenceFrameSource(sequence), sequence.first, sequence.last
+    else:
+        source, first, last = MovFrameSource(path, 1001), 1001, 1100
+
+    buffer = FrameRingBuffer()
+    reader = FrameReadAhead(buffer)
+    last = min(last, first + reader.read_ahead - 1)
+    decoded = []
+    reader.frame_ready.connect(lambda key, frame: decoded.append(frame) or (frame == last and app.quit()))
+
+    start = time.perf_counter()
+    reader.start()
+    reader.set_source(source, first, last)
+    app.exec_()
+    reader.stop()
+    elapsed = time.perf_counter() - start
+    print(f"{len(decoded)} frames in {elapsed:.2f}s ({len(decoded) / elapsed:.1f} fps), {buffer.slot_count} slots")
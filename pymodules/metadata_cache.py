@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import sqlite3
+import threading
+
+# Custom Modules
+try:
+    import constants
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+
+class MetadataCache():
+    """
+    On-disk probe cache of a scan folder, stored as SQLite in <scan folder>/_io.
+    Entries are keyed by (path, size, mtime), so any change to a file invalidates it.
+    The whole table is read once on open and new entries are written back in one
+    transaction on flush, which keeps database access off the per-row path.
+    """
+    SCHEMA_VERSION = 2
+
+    def __init__(self, data_root):
+        self.db_path = os.path.join(data_root, "_io", constants.METADATA_CACHE_NAME)
+        self.__entries = {}
+        self.__pending = {}
+        self.__reset = False
+        self.__lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.db_path):
+            return
+
+        try:
+            con = sqlite3.connect(self.db_path)
+            try:
+                version = con.execute("PRAGMA user_version").fetchone()[0]
+                if version != self.SCHEMA_VERSION:
+                    logger.debug(f"Metadata cache version mismatch, resetting: {self.db_path}")
+                    self.__reset = True
+                    return
+                rows = con.execute("SELECT path, size, mtime, data FROM metadata").fetchall()
+            finally:
+                con.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read metadata cache {self.db_path}: {e}")
+            return
+
+        for path, size, mtime, data in rows:
+            self.__entries[path] = (size, mtime, data)
+        logger.debug(f"Metadata cache loaded: {len(rows)} entries from {self.db_path}")
+
+    def get(self, path, size, mtime):
+        entry = self.__entries.get(path)
+        if not entry or entry[0] != size or entry[1] != mtime:
+            return None
+
+        try:
+            return json.loads(entry[2])
+        except ValueError:
+            return None
+
+    def put(self, path, size, mtime, data):
+        try:
+            entry = (size, mtime, json.dumps(data))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Metadata not serializable, skip caching {path}: {e}")
+            return
+
+        with self.__lock:
+            self.__entries[path] = entry
+            self.__pending[path] = entry
+
+    def flush(self):
+        with self.__lock:
+            pending = self.__pending
+            self.__pending = {}
+
+        if not pending:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            con = sqlite3.connect(self.db_path)
+            try:
+                with con:
+                    if self.__reset:
+                        con.execute("DROP TABLE IF EXISTS metadata")
+                        self.__reset = False
+                    con.execute(
+                        "CREATE TABLE IF NOT EXISTS metadata "
+                        "(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, data TEXT)"
+                    )
+                    con.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                    con.executemany(
+                        "INSERT OR REPLACE INTO metadata (path, size, mtime, data) VALUES (?, ?, ?, ?)",
+                        [(path, size, mtime, data) for path, (size, mtime, data) in pending.items()]
+                    )
+            finally:
+                con.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write metadata cache {self.db_path}: {e}")
+            return
+
+        logger.debug(f"Metadata cache saved: {len(pending)} entries to {self.db_path}")
+
+
+def stat_key(*paths):
+    """
+    Returns (size, mtime) for the given files combined, or None if any is missing.
+    """
+    size = 0
+    mtime = 0
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        size += st.st_size
+        mtime = max(mtime, st.st_mtime_ns)
+    return size, mtime
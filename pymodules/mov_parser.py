@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import mmap
+import time
+import shutil
+import struct
+import tempfile
+from fractions import Fraction
+
+# Custom Modules
+try:
+    import constants
+    from ffmpeg_manager import FFMPEGManager, build_mov_probe
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.ffmpeg_manager import FFMPEGManager, build_mov_probe
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+# tmcd flags
+TC_DROP_FRAME = 0x0001
+TC_NEGATIVE = 0x0004
+TC_COUNTER = 0x0008
+
+
+class MovAtomError(Exception):
+    pass
+
+
+class MovParser():
+    """
+    Reads dimensions, frame rate, duration, tmcd start timecode and reel name
+    straight from the QuickTime 'moov' atom. The file is memory-mapped, so only
+    the atom headers, the moov box and the 4-byte timecode sample are read.
+    Files with an unusual layout fall back to ffprobe.
+    """
+    def __init__(self, ffmpeg_io=None):
+        self.ffmpeg_io = ffmpeg_io or FFMPEGManager()
+
+    def probe_mov(self, input_path):
+        try:
+            return read_mov_probe(input_path)
+        except (MovAtomError, struct.error, ValueError, OSError) as e:
+            logger.debug(f"Native mov parse failed, falling back to ffprobe: {input_path} ({e})")
+        return self.ffmpeg_io.probe_mov(input_path)
+
+
+def read_mov_probe(input_path):
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < 8:
+            raise MovAtomError("File too small")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            moov = _find_box(mm, 0, len(mm), b"moov")
+            if not moov:
+                raise MovAtomError("moov atom not found")
+
+            video = None
+            tmcd = None
+            for box_type, start, end in _iter_boxes(mm, *moov):
+                if box_type == b"cmov":
+                    raise MovAtomError("Compressed moov atom")
+                if box_type != b"trak":
+                    continue
+                track = _parse_trak(mm, start, end)
+                if track["handler"] == b"vide" and not video:
+                    video = track
+                elif track["handler"] == b"tmcd" and not tmcd:
+                    tmcd = track
+
+            if not video:
+                raise MovAtomError("Video track not found")
+
+            start_tc = None
+            reel_name = None
+            if tmcd:
+                start_tc = _read_tmcd_start(mm, tmcd)
+                reel_name = tmcd["reel_name"]
+
+    return build_mov_probe(
+        video["width"], video["height"], video["r_frame_rate"], video["frames"], start_tc, reel_name
+    )
+
+
+def _iter_boxes(buf, start, end):
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", buf, offset)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", buf, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            raise MovAtomError(f"Invalid atom size {box_type!r} at {offset}")
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+def _find_box(buf, start, end, *path):
+    for box_type, box_start, box_end in _iter_boxes(buf, start, end):
+        if box_type != path[0]:
+            continue
+        if len(path) == 1:
+            return box_start, box_end
+        return _find_box(buf, box_start, box_end, *path[1:])
+    return None
+
+
+def _require(buf, parent, *path):
+    box = _find_box(buf, parent[0], parent[1], *path)
+    if not box:
+        raise MovAtomError(f"{b'/'.join(path).decode()} atom not found")
+    return box
+
+
+def _parse_trak(buf, start, end):
+    mdia = _require(buf, (start, end), b"mdia")
+    hdlr = _require(buf, mdia, b"hdlr")
+    track = {"handler": bytes(buf[hdlr[0] + 8:hdlr[0] + 12])}
+    if track["handler"] not in (b"vide", b"tmcd"):
+        return track
+
+    mdhd = _require(buf, mdia, b"mdhd")
+    if buf[mdhd[0]] == 1:
+        timescale = struct.unpack_from(">I", buf, mdhd[0] + 20)[0]
+    else:
+        timescale = struct.unpack_from(">I", buf, mdhd[0] + 12)[0]
+
+    stbl = _require(buf, mdia, b"minf", b"stbl")
+    entry_type, entry_start, entry_end = _first_sample_entry(buf, _require(buf, stbl, b"stsd"))
+
+    if track["handler"] == b"vide":
+        track["width"], track["height"] = struct.unpack_from(">HH", buf, entry_start + 24)
+
+        # Constant frame rate only, anything else goes to ffprobe
+        frames = 0
+        deltas = set()
+        stts = _require(buf, stbl, b"stts")
+        count = struct.unpack_from(">I", buf, stts[0] + 4)[0]
+        for i in range(count):
+            sample_count, sample_delta = struct.unpack_from(">II", buf, stts[0] + 8 + i * 8)
+            frames += sample_count
+            deltas.add(sample_delta)
+        if len(deltas) != 1 or not timescale or not frames:
+            raise MovAtomError("Variable or empty video sample timing")
+
+        rate = Fraction(timescale, deltas.pop())
+        track["r_frame_rate"] = f"{rate.numerator}/{rate.denominator}"
+        track["frames"] = frames
+
+    else:
+        if entry_type != b"tmcd" or entry_end - entry_start < 26:
+            raise MovAtomError("Invalid tmcd sample description")
+        track["flags"], _, _, track["nb_frames"] = struct.unpack_from(">IIIB", buf, entry_start + 12)
+
+        # Source reference 'name' atom holds the reel name
+        track["reel_name"] = None
+        if entry_end - entry_start >= 38:
+            name_size, name_type, str_size = struct.unpack_from(">I4sH", buf, entry_start + 26)
+            if name_type == b"name" and entry_start + 38 + str_size <= entry_end:
+                reel_name = bytes(buf[entry_start + 38:entry_start + 38 + str_size])
+                track["reel_name"] = reel_name.decode("utf-8", errors="ignore").strip("\x00") or None
+
+        stco = _find_box(buf, stbl[0], stbl[1], b"stco")
+        if stco:
+            track["offset"] = struct.unpack_from(">I", buf, stco[0] + 8)[0]
+        else:
+            co64 = _require(buf, stbl, b"co64")
+            track["offset"] = struct.unpack_from(">Q", buf, co64[0] + 8)[0]
+
+    return track
+
+
+def _first_sample_entry(buf, stsd):
+    count = struct.unpack_from(">I", buf, stsd[0] + 4)[0]
+    if not count:
+        raise MovAtomError("Empty sample description")
+    for box_type, start, end in _iter_boxes(buf, stsd[0] + 8, stsd[1]):
+        return box_type, start, end
+    raise MovAtomError("Empty sample description")
+
+
+def _read_tmcd_start(buf, tmcd):
+    flags = tmcd["flags"]
+    fps = tmcd["nb_frames"]
+    if flags & (TC_NEGATIVE | TC_COUNTER) or not fps:
+        raise MovAtomError(f"Unsupported tmcd flags: {flags:#x}")
+    if tmcd["offset"] + 4 > len(buf):
+        raise MovAtomError("tmcd sample out of range")
+
+    frame_number = struct.unpack_from(">I", buf, tmcd["offset"])[0]
+    return frames_to_timecode(frame_number, fps, bool(flags & TC_DROP_FRAME))
+
+
+def frames_to_timecode(frame_number, fps, drop_frame=False):
+    """
+    Frame count to 'HH:MM:SS:FF' ('HH:MM:SS;FF' for drop frame), same rules as ffmpeg.
+    """
+    if drop_frame and fps % 30 == 0:
+        drop_frames = fps // 30 * 2
+        frames_per_10mins = fps // 30 * 17982
+        d, m = divmod(frame_number, frames_per_10mins)
+        frame_number += 9 * drop_frames * d + drop_frames * (max(0, m - drop_frames) // (frames_per_10mins // 10))
+    else:
+        drop_frame = False
+
+    ff = frame_number % fps
+    ss = frame_number // fps % 60
+    mm = frame_number // (fps * 60) % 60
+    hh = frame_number // (fps * 3600) % 24
+    return f"{hh:02d}:{mm:02d}:{ss:02d}{';' if drop_frame else ':'}{ff:02d}"
+
+
+def _box(box_type, payload, full=False):
+    if full:
+        payload = b"\x00\x00\x00\x00" + payload
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _write_synthetic_mov(path, frames=100, timescale=24000, delta=1001, start_frame=86400, reel_name=b"A001C001", media_size=262144):
+    # ftyp, mdat (tmcd sample + dummy media), moov with a video and a tmcd track
+    ftyp = _box(b"ftyp", b"qt  " + struct.pack(">I", 0x200) + b"qt  ")
+    mdat = _box(b"mdat", struct.pack(">I", start_frame) + b"\x00" * media_size)
+    tc_offset = len(ftyp) + 8
+
+    def trak(handler, entry, stts, offset):
+        tkhd = _box(b"tkhd", b"\x00" * 72 + struct.pack(">II", 1920 << 16, 1080 << 16), full=True)
+        mdhd = _box(b"mdhd", struct.pack(">IIIIHH", 0, 0, timescale, frames * delta, 0, 0), full=True)
+        hdlr = _box(b"hdlr", b"\x00" * 4 + handler + b"\x00" * 13, full=True)
+        stsd = _box(b"stsd", struct.pack(">I", 1) + entry, full=True)
+        stts = _box(b"stts", struct.pack(">III", 1, *stts), full=True)
+        stco = _box(b"stco", struct.pack(">II", 1, offset), full=True)
+        stbl = _box(b"stbl", stsd + stts + stco)
+        mdia = _box(b"mdia", mdhd + hdlr + _box(b"minf", stbl))
+        return _box(b"trak", tkhd + mdia)
+
+    video_entry = _box(
+        b"apch", b"\x00" * 6 + struct.pack(">H", 1) + b"\x00" * 16 + struct.pack(">HH", 1920, 1080) + b"\x00" * 50
+    )
+    name = _box(b"name", struct.pack(">HH", len(reel_name), 0) + reel_name)
+    tmcd_entry = _box(
+        b"tmcd", b"\x00" * 6 + struct.pack(">H", 1) + struct.pack(">IIIIBB", 0, 0, timescale, delta, 24, 0) + name
+    )
+    mvhd = _box(b"mvhd", struct.pack(">IIII", 0, 0, timescale, frames * delta) + b"\x00" * 80, full=True)
+    moov = _box(
+        b"moov",
+        mvhd
+        + trak(b"vide", video_entry, (frames, delta), tc_offset + 4)
+        + trak(b"tmcd", tmcd_entry, (1, frames * delta), tc_offset)
+    )
+
+    with open(path, "wb") as f:
+        f.write(ftyp + mdat + moov)
+
+
+if __name__ == "__main__":
+    # Benchmark on synthetic MOVs: python mov_parser.py [count]
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    temp_dir = tempfile.mkdtemp(prefix="mov_parser_")
+    try:
+        paths = []
+        for i in range(count):
+            path = os.path.join(temp_dir, f"A001C{i:03d}.mov")
+            _write_synthetic_mov(path, start_frame=86400 + i * 100, reel_name=f"A001C{i:03d}".encode())
+            paths.append(path)
+
+        print(read_mov_probe(paths[0]))
+
+        start = time.perf_counter()
+        for path in paths:
+            read_mov_probe(path)
+        native_time = time.perf_counter() - start
+        print(f"Native  : {native_time:.3f}s for {count} files ({native_time / count * 1000:.2f} ms/file)")
+
+        if shutil.which("ffprobe"):
+            ffmpeg_io = FFMPEGManager()
+            start = time.perf_counter()
+            for path in paths:
+                ffmpeg_io.probe_mov(path)
+            ffprobe_time = time.perf_counter() - start
+            print(f"ffprobe : {ffprobe_time:.3f}s for {count} files ({ffprobe_time / count * 1000:.2f} ms/file)")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -14,11 +14,11 @@ except:
 logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
 
 
-def get_comp_cmd(paths, row_data, render_settings, sg_proj_data, comp_temp_path):
+def get_comp_cmd(paths, shot, render_settings, sg_proj_data, comp_temp_path):
     nuke_shot_work_path, nuke_plate_path, default_nk_file, exr_output_path, mov_output_path, cube_path = paths
     
-    first_frame = row_data.get("Start Frame")
-    last_frame = row_data.get("End Frame")
+    first_frame = shot.start_frame
+    last_frame = shot.end_frame
     use_ocio = render_settings.get('use_ocio_colorspace')
     ocio_path = render_settings.get('ocio_config')
     input_color = render_settings.get('input_colorspace')
@@ -162,19 +162,18 @@ if os.path.exists(comp_temp_path):
 """
     return cmd
 
-def get_render_cmd(paths, row_data, render_settings, project_data):
+def get_render_cmd(paths, shot, render_settings, project_data):
     render_nk_path, data_seq, plate_path, png_path, jpg_path, mov_path, cube_path = paths
     
     # Set Row Data
-    first_frame = row_data.get("Start Frame")
-    last_frame = row_data.get("End Frame")
-    org_range = row_data.get("Org Range")
-    org_sframe = org_range.split('-')[0]
-    org_eframe = org_range.split('-')[1].split('\n')[0]
-    first_frame_offset = row_data.get("First Frame Offset") if row_data.get("First Frame Offset") else 0
-    end_frame_offset = row_data.get("End Frame Offset") if row_data.get("End Frame Offset") else 0
-    retime_end_frame = row_data.get("Retime End Frame") if row_data.get("Retime End Frame") else last_frame
-    shot_name = row_data.get("Shot Name", "")
+    first_frame = shot.start_frame
+    last_frame = shot.end_frame
+    org_sframe = shot.org_first
+    org_eframe = shot.org_last
+    first_frame_offset = shot.first_frame_offset or 0
+    end_frame_offset = shot.end_frame_offset or 0
+    retime_end_frame = shot.retime_end_frame or last_frame
+    shot_name = shot.shot_name
     
     # Set Project Data
     project_name = project_data.get('name', '')
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import threading
+from collections import OrderedDict
+
+from PySide2.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from PySide2.QtGui import QImage, QImageReader, QPixmap
+
+# Custom Modules
+try:
+    import constants
+    from thumbnail_atlas import split_ref
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.thumbnail_atlas import split_ref
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+
+class PixmapCache(QObject):
+    """
+    Size-bounded LRU of scaled thumbnails keyed by (path, mtime, width),
+    one instance is shared by the plate and edit table delegates.
+    pixmap() never touches the disk: a miss queues a load on the cache's own thread pool,
+    where the file is stat'ed, decoded and scaled, and the pixmap is ready on the next paint.
+    Files seen once are not stat'ed again until invalidate(path) is called.
+    Paths may also be thumbnail atlas references of an atlas added with add_atlas(),
+    those are read from the atlas map and versioned by the atlas entry's mtime.
+    """
+    loaded = Signal(str, int)  # path, width
+
+    def __init__(self, max_bytes=None, max_workers=None, parent=None):
+        super(PixmapCache, self).__init__(parent)
+        self.max_bytes = max_bytes or constants.THUMBNAIL_CACHE_MB * 1024 * 1024
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_workers or constants.THUMBNAIL_DECODE_WORKERS)
+
+        self.__pixmaps = OrderedDict()  # (path, mtime, width): QPixmap, oldest first
+        self.__keys = set()  # read by the loaders, guarded by __lock
+        self.__lock = threading.Lock()
+        self.__mtimes = {}  # path: mtime of the file last loaded
+        self.__pending = {}  # (path, width): {widget to repaint}
+        self.__atlases = {}  # atlas path: ThumbnailAtlas
+        self.__bytes = 0
+
+    def pixmap(self, path, width, widget=None):
+        """
+        Returns the cached pixmap, or None while it is being loaded.
+        widget is repainted once the load finishes.
+        """
+        mtime = self.__mtimes.get(path)
+        if mtime is not None:
+            key = (path, mtime, width)
+            pixmap = self.__pixmaps.get(key)
+            if pixmap is not None:
+                self.__pixmaps.move_to_end(key)
+                return pixmap
+
+        self.__request(path, width, widget)
+        return None
+
+    def add_atlas(self, atlas):
+        self.__atlases[atlas.path] = atlas
+
+    def remove_atlas(self, atlas):
+        if self.__atlases.get(atlas.path) is atlas:
+            del self.__atlases[atlas.path]
+
+    def atlas(self, atlas_path):
+        return self.__atlases.get(atlas_path)
+
+    def exists(self, path):
+        ref = split_ref(path)
+        if ref is None:
+            return os.path.exists(path)
+        atlas = self.__atlases.get(ref[0])
+        return atlas is not None and ref[1] in atlas
+
+    def invalidate(self, path):
+        # The file may have been rewritten, stat it again on the next paint
+        self.__mtimes.pop(path, None)
+
+    def clear(self):
+        self.__pixmaps.clear()
+        with self.__lock:
+            self.__keys.clear()
+        self.__mtimes.clear()
+        self.__bytes = 0
+
+    def contains(self, key):
+        with self.__lock:
+            return key in self.__keys
+
+    def __request(self, path, width, widget):
+        pending_key = (path, width)
+        widgets = self.__pending.get(pending_key)
+        if widgets is None:
+            widgets = self.__pending[pending_key] = set()
+            loader = PixmapLoader(self, path, width)
+            loader.signals.finished.connect(self.__on_loaded)
+            self.thread_pool.start(loader)
+        if widget is not None:
+            widgets.add(widget)
+
+    def __on_loaded(self, path, width, mtime, image):
+        widgets = self.__pending.pop((path, width), set())
+        if mtime is None:
+            # Missing file, keep a null pixmap so the row is not retried on every paint
+            mtime = -1.0
+            image = QImage()
+
+        key = (path, mtime, width)
+        if image is not None:
+            self.__insert(key, QPixmap.fromImage(image))
+        if key in self.__pixmaps:
+            self.__mtimes[path] = mtime
+        else:
+            # Evicted while the loader skipped decoding, decode on the next paint
+            self.__mtimes.pop(path, None)
+
+        for widget in widgets:
+            widget.update()
+        self.loaded.emit(path, width)
+
+    def __insert(self, key, pixmap):
+        old = self.__pixmaps.pop(key, None)
+        if old is not None:
+            self.__bytes -= pixmap_bytes(old)
+        self.__pixmaps[key] = pixmap
+        self.__bytes += pixmap_bytes(pixmap)
+        with self.__lock:
+            self.__keys.add(key)
+
+        while self.__bytes > self.max_bytes and len(self.__pixmaps) > 1:
+            old_key, old = self.__pixmaps.popitem(last=False)
+            self.__bytes -= pixmap_bytes(old)
+            with self.__lock:
+                self.__keys.discard(old_key)
+
+
+class PixmapLoaderSignals(QObject):
+    finished = Signal(str, int, object, object)  # path, width, mtime, QImage or None
+
+
+class PixmapLoader(QRunnable):
+    """
+    Stats the file and, unless (path, mtime, width) is already cached, decodes and scales it.
+    QImage is used off the GUI thread, the QPixmap is made on the GUI thread.
+    """
+    def __init__(self, cache, path, width):
+        super(PixmapLoader, self).__init__()
+        self.cache = cache
+        self.path = path
+        self.width = width
+        self.signals = PixmapLoaderSignals()
+
+    def run(self):
+        ref = split_ref(self.path)
+        if ref:
+            atlas = self.cache.atlas(ref[0])
+            mtime = atlas.mtime(ref[1]) if atlas else None
+        else:
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError:
+                mtime = None
+        if mtime is None:
+            logger.warning(f"Thumbnail not found: {self.path}")
+            self.signals.finished.emit(self.path, self.width, None, None)
+            return
+
+        image = None
+        if not self.cache.contains((self.path, mtime, self.width)):
+            if ref:
+                image = load_scaled_image_data(atlas.read(ref[1]), self.width, self.path)
+            else:
+                image = load_scaled_image(self.path, self.width)
+        self.signals.finished.emit(self.path, self.width, mtime, image)
+
+
+def load_scaled_image(path, width):
+    return scale_image(QImageReader(path).read(), width, path)
+
+
+def load_scaled_image_data(data, width, path):
+    image = QImage()
+    if data:
+        image.loadFromData(data)
+    return scale_image(image, width, path)
+
+
+def scale_image(image, width, path):
+    if image.isNull():
+        logger.warning(f"Thumbnail is null: {path}")
+        return QImage()
+    if width > 0 and image.width() != width:
+        image = image.scaledToWidth(width, Qt.SmoothTransformation)
+    return image
+
+
+def pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+if __name__ == "__main__":
+    # Benchmark: python pixmap_cache.py <thumbnail_folder> [width]
+    from PySide2.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    folder = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan\_io\thumbnail"
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    paths = [
+        os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.lower().endswith((".jpg", ".png"))
+    ]
+
+    cache = PixmapCache()
+    remaining = set(paths)
+    cache.loaded.connect(lambda path, _: remaining.discard(path))
+
+    start = time.perf_counter()
+    for path in paths:
+        cache.pixmap(path, width)
+    while remaining:
+        app.processEvents()
+    print(f"Cold : {time.perf_counter() - start:.3f}s ({len(paths)} thumbnails)")
+
+    start = time.perf_counter()
+    hits = sum(cache.pixmap(path, width) is not None for path in paths)
+    print(f"Warm : {time.perf_counter() - start:.4f}s ({hits} hits)")
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+from PySide2.QtCore import Qt, QTimer
+from PySide2.QtGui import QColor, QPainter, QPixmap
+from PySide2.QtWidgets import ( QApplication, QHBoxLayout, QLabel, QSizePolicy, QSlider, QStyle,
+                               QStyleOptionSlider, QToolButton, QVBoxLayout, QWidget )
+
+# Custom Modules
+try:
+    import constants
+    from frame_buffer import FrameRingBuffer, FrameReadAhead
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.frame_buffer import FrameRingBuffer, FrameReadAhead
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+IN_RANGE_COLOR = QColor(138, 180, 247, 90)
+BUFFERED_COLOR = QColor(120, 200, 120)
+
+
+class FrameSlider(QSlider):
+    """
+    Frame slider over the whole plate. The frames used by the render (Start/End/Offset columns)
+    are drawn as a band, the buffered ones as a line under the groove.
+    """
+    def __init__(self, parent=None):
+        super(FrameSlider, self).__init__(Qt.Horizontal, parent)
+        self.in_frame = None
+        self.out_frame = None
+        self.buffered = set()
+
+    def set_used_range(self, in_frame, out_frame):
+        self.in_frame, self.out_frame = in_frame, out_frame
+        self.update()
+
+    def paintEvent(self, event):
+        if self.maximum() > self.minimum():
+            painter = QPainter(self)
+            if self.in_frame is not None and self.out_frame is not None:
+                x1, x2 = self.__frame_x(self.in_frame), self.__frame_x(self.out_frame)
+                painter.fillRect(x1, 0, max(1, x2 - x1), self.height(), IN_RANGE_COLOR)
+            painter.setPen(BUFFERED_COLOR)
+            y = self.height() - 1
+            for frame in self.buffered:
+                x = self.__frame_x(frame)
+                painter.drawLine(x, y - 2, x, y)
+            painter.end()
+        super(FrameSlider, self).paintEvent(event)
+
+    def __frame_x(self, frame):
+        option = QStyleOptionSlider()
+        self.initStyleOption(option)
+        groove = self.style().subControlRect(QStyle.CC_Slider, option, QStyle.SC_SliderGroove, self)
+        handle = self.style().subControlRect(QStyle.CC_Slider, option, QStyle.SC_SliderHandle, self)
+        span = groove.width() - handle.width()
+        offset = QStyle.sliderPositionFromValue(self.minimum(), self.maximum(), frame, span)
+        return groove.x() + handle.width() // 2 + offset
+
+
+class PlateScrubber(QWidget):
+    """
+    Preview of the selected row's plate. Proxy frames are decoded ahead of the playhead
+    into a FrameRingBuffer shared by every row, so going back to a row plays from memory
+    while its frames are still in the ring.
+    Plays the used range (in / out) at fps, and the slider scrubs the whole plate.
+    """
+    def __init__(self, buffer=None, parent=None):
+        super(PlateScrubber, self).__init__(parent)
+        self.buffer = buffer or FrameRingBuffer()
+        self.reader = FrameReadAhead(self.buffer, parent=self)
+        self.reader.frame_ready.connect(self.frame_ready)
+        self.reader.start()
+
+        self.source = None
+        self.fps = 24.0
+        self.first_frame = self.last_frame = 0
+        self.in_frame = self.out_frame = 0
+        self.start_frame = None
+        self.frame = 0
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+        self.set_widgets()
+        self.set_layout()
+
+    def set_widgets(self):
+        self.image_lb = QLabel()
+        self.image_lb.setAlignment(Qt.AlignCenter)
+        self.image_lb.setMinimumSize(320, 180)
+        self.image_lb.setSizePolicy(QSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored))
+        self.image_lb.setStyleSheet("background-color: black;")
+
+        self.play_btn = QToolButton()
+        self.play_btn.setFixedSize(30, 30)
+        self.play_btn.setText("▶")
+        self.play_btn.setToolTip("Play / Pause")
+        self.play_btn.clicked.connect(self.toggle_play)
+
+        self.slider = FrameSlider()
+        self.slider.valueChanged.connect(self.seek)
+
+        self.frame_lb = QLabel()
+        self.frame_lb.setAlignment(Qt.AlignCenter)
+        self.frame_lb.setMinimumWidth(150)
+
+    def set_layout(self):
+        control_layout = QHBoxLayout()
+        control_layout.addWidget(self.play_btn)
+        control_layout.addWidget(self.slider)
+        control_layout.addWidget(self.frame_lb)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.image_lb, 1)
+        layout.addLayout(control_layout)
+        self.setLayout(layout)
+
+    def set_fps(self, fps):
+        self.fps = fps if fps and fps > 0 else 24.0
+        if self.timer.isActive():
+            self.timer.start(round(1000 / self.fps))
+
+    def set_source(self, source, first_frame, last_frame):
+        """
+        source is a frame_buffer source (SequenceFrameSource / MovFrameSource) or None to clear.
+        """
+        self.pause()
+        self.source = source
+        self.slider.buffered = set()
+        if source is None:
+            self.image_lb.clear()
+            self.frame_lb.clear()
+            self.reader.set_source(None, 0, -1)
+            return
+
+        self.first_frame, self.last_frame = first_frame, last_frame
+        self.in_frame, self.out_frame = first_frame, last_frame
+        self.start_frame = None
+        self.reader.set_source(source, first_frame, last_frame)
+
+        self.slider.blockSignals(True)
+        self.slider.setRange(first_frame, last_frame)
+        self.slider.setValue(first_frame)
+        self.slider.blockSignals(False)
+        self.slider.set_used_range(None, None)
+        self.seek(first_frame)
+
+    def set_used_range(self, in_frame, out_frame, start_frame=None):
+        """
+        Plate frames the render uses and the output frame of in_frame ('Start Frame').
+        Playback loops over this range.
+        """
+        if self.source is None:
+            return
+        self.in_frame = max(self.first_frame, min(in_frame, self.last_frame))
+        self.out_frame = max(self.in_frame, min(out_frame, self.last_frame))
+        self.start_frame = start_frame
+        self.slider.set_used_range(self.in_frame, self.out_frame)
+        self.reader.set_range(self.in_frame, self.out_frame)
+        self.update_frame_label()
+
+    def toggle_play(self):
+        if self.timer.isActive():
+            self.pause()
+        else:
+            self.play()
+
+    def play(self):
+        if self.source is None:
+            return
+        if not self.in_frame <= self.frame <= self.out_frame:
+            self.seek(self.in_frame)
+        self.play_btn.setText("❚❚")
+        self.timer.start(round(1000 / self.fps))
+
+    def pause(self):
+        self.timer.stop()
+        self.play_btn.setText("▶")
+
+    def stop(self):
+        self.pause()
+        self.reader.stop()
+
+    def tick(self):
+        # Next frame once it is decoded, the playhead waits on the read-ahead otherwise
+        frame = self.frame + 1 if self.frame < self.out_frame else self.in_frame
+        if (self.source.key, frame) not in self.buffer:
+            self.reader.request(frame)
+            return
+        self.slider.blockSignals(True)
+        self.slider.setValue(frame)
+        self.slider.blockSignals(False)
+        self.seek(frame)
+
+    def seek(self, frame):
+        if self.source is None:
+            return
+        self.frame = frame
+        self.reader.request(frame)
+        self.show_frame()
+
+    def show_frame(self):
+        image = self.buffer.image((self.source.key, self.frame))
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+            self.image_lb.setPixmap(
+                pixmap.scaled(self.image_lb.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            )
+        self.update_frame_label()
+
+    def update_frame_label(self):
+        text = f"{self.frame}"
+        if self.start_frame is not None and self.in_frame <= self.frame <= self.out_frame:
+            text += f" → {self.start_frame + self.frame - self.in_frame}"
+        self.frame_lb.setText(text)
+
+    def frame_ready(self, key, frame):
+        if self.source is None or key != self.source.key:
+            return
+        self.slider.buffered.add(frame)
+        if len(self.slider.buffered) > self.buffer.slot_count:
+            # Drop the marks of frames the ring has reused
+            self.slider.buffered = {f for f in self.slider.buffered if (key, f) in self.buffer}
+        self.slider.update()
+        if frame == self.frame:
+            self.show_frame()
+
+    def resizeEvent(self, event):
+        super(PlateScrubber, self).resizeEvent(event)
+        if self.source is not None:
+            self.show_frame()
+
+
+if __name__ == "__main__":
+    # python plate_scrubber.py <mov or frame folder> [fps]
+    try:
+        from frame_buffer import SequenceFrameSource, MovFrameSource
+        from sequence_manager import scan_image_sequences
+    except:
+        from pymodules.frame_buffer import SequenceFrameSource, MovFrameSource
+        from pymodules.sequence_manager import scan_image_sequences
+
+    app = QApplication(sys.argv)
+    path = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan\A001C003"
+    scrubber = PlateScrubber()
+    scrubber.set_fps(float(sys.argv[2]) if len(sys.argv) > 2 else 23.976)
+    if os.path.isdir(path):
+        sequence = scan_image_sequences(path, constants.SEQUENCE_TYPES)[0]
+        scrubber.set_source(SequenceFrameSource(sequence), sequence.first, sequence.last)
+    else:
+        scrubber.set_source(MovFrameSource(path, 1001), 1001, 1100)
+    scrubber.resize(960, 600)
+    scrubber.show()
+    app.aboutToQuit.connect(scrubber.stop)
+    sys.exit(app.exec_())
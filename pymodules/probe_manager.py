@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Custom Modules
+try:
+    import constants
+    from ffmpeg_manager import FFMPEGManager
+    from mov_parser import MovParser
+    from exr_manager import SequenceHeader, harvest_sequence_header
+    from metadata_cache import MetadataCache, stat_key
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.ffmpeg_manager import FFMPEGManager
+    from pymodules.mov_parser import MovParser
+    from pymodules.exr_manager import SequenceHeader, harvest_sequence_header
+    from pymodules.metadata_cache import MetadataCache, stat_key
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+
+class ProbeManager():
+    """
+    Runs the per-row metadata probes of a scan folder (moov atom reads for MOVs,
+    EXR/DPX header reads for sequences) on a bounded thread pool and
+    yields each result as soon as it is ready.
+    While a cache is open, unchanged files are answered from it without probing.
+    """
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or constants.PROBE_MAX_WORKERS
+        self.ffmpeg_io = FFMPEGManager()
+        self.mov_parser = MovParser(self.ffmpeg_io)
+        self.cache = None
+
+    def open_cache(self, data_root):
+        self.close_cache()
+        self.cache = MetadataCache(data_root)
+
+    def close_cache(self):
+        if not self.cache:
+            return
+        self.cache.flush()
+        self.cache = None
+
+    def probe_iter(self, jobs):
+        """
+        jobs: {key: (func, *args)}
+        Yields (key, result) in completion order. A failed probe yields None.
+        """
+        if not jobs:
+            return
+
+        with self.stream() as stream:
+            for key, job in jobs.items():
+                stream.submit(key, *job)
+            yield from stream.remaining()
+
+    def stream(self):
+        """
+        ProbeStream on this manager's pool size, for submitting probes while rows are still being added.
+        """
+        return ProbeStream(self.max_workers)
+
+    def map_iter(self, func, items):
+        """
+        Runs func over items on the pool and yields (item, result) in input order,
+        each as soon as it and every item before it are done.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from zip(items, executor.map(func, items))
+
+    def probe_mov(self, mov_path):
+        cache = self.cache
+        key = stat_key(mov_path) if cache else None
+        if key:
+            cached = cache.get(mov_path, *key)
+            if cached is not None:
+                return cached
+
+        probe = self.mov_parser.probe_mov(mov_path)
+
+        result = probe._asdict() if probe else {}
+        result["clip_name"] = result.get("reel_name") or os.path.basename(os.path.dirname(mov_path))
+
+        # Only cache complete probes, failed ones are retried next time
+        if key and probe:
+            cache.put(mov_path, *key, result)
+        return result
+
+    def probe_sequence(self, start_frame_path, end_frame_path):
+        """
+        Returns a SequenceHeader for the row, or None if its frames are missing.
+        """
+        if not os.path.exists(start_frame_path) or not os.path.exists(end_frame_path):
+            logger.warning(
+                f"Start or End Frame Path not exists.\n Start Frame: {start_frame_path}\n End Frame: {end_frame_path}"
+                )
+            return None
+
+        cache = self.cache
+        cache_path = f"{start_frame_path}|{end_frame_path}"
+        key = stat_key(start_frame_path, end_frame_path) if cache else None
+        if key:
+            cached = cache.get(cache_path, *key)
+            if cached is not None:
+                try:
+                    return SequenceHeader.from_dict(cached)
+                except (TypeError, KeyError):
+                    pass
+
+        result = harvest_sequence_header(start_frame_path, end_frame_path)
+        if key and result is not None:
+            cache.put(cache_path, *key, result._asdict())
+        return result
+
+
+class ProbeStream():
+    """
+    Probes submitted one by one, results collected without blocking.
+    ready() returns what has finished so far, remaining() waits for the rest.
+    """
+    def __init__(self, max_workers):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def submit(self, key, func, *args):
+        self.futures[self.executor.submit(func, *args)] = key
+
+    def ready(self):
+        done = [future for future in self.futures if future.done()]
+        return [self._pop_result(future) for future in done]
+
+    def remaining(self):
+        for future in as_completed(list(self.futures)):
+            yield self._pop_result(future)
+
+    def close(self):
+        # Drop probes not started yet, e.g. when the load is interrupted
+        for future in self.futures:
+            future.cancel()
+        self.futures = {}
+        self.executor.shutdown(wait=True)
+
+    def _pop_result(self, future):
+        key = self.futures.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Probe failed for {key}: {e}")
+            result = None
+        return key, result
+
+
+def _collect_benchmark_jobs(manager, data_root):
+    # MOV files in root, first/last frame of each sub folder for sequences
+    jobs = {}
+    for name in sorted(os.listdir(data_root)):
+        path = os.path.join(data_root, name)
+        if name.lower().endswith(".mov"):
+            jobs[name] = (manager.probe_mov, path)
+        elif os.path.isdir(path) and name not in ["_io", "xml", "@eaDir", "proxy_thumb"]:
+            frames = sorted(
+                f for f in os.listdir(path) if f.lower().endswith(tuple(constants.SEQUENCE_TYPES))
+            )
+            if frames:
+                jobs[name] = (manager.probe_sequence, os.path.join(path, frames[0]), os.path.join(path, frames[-1]))
+    return jobs
+
+
+if __name__ == "__main__":
+    # Benchmark: python probe_manager.py <scan_folder> [max_workers] [rounds]
+    # The modes alternate which one runs first each round, so neither always gets the warm OS / NAS cache
+    data_root = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan"
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else constants.PROBE_MAX_WORKERS
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    manager = ProbeManager(max_workers)
+    jobs = _collect_benchmark_jobs(manager, data_root)
+    print(f"{len(jobs)} rows in {data_root}, {rounds} rounds")
+
+    def run_serial():
+        for key, job in jobs.items():
+            job[0](*job[1:])
+
+    def run_parallel():
+        for key, result in manager.probe_iter(jobs):
+            pass
+
+    times = {"Serial": [], "Parallel": []}
+    modes = [("Serial", run_serial), ("Parallel", run_parallel)]
+    for round_no in range(rounds):
+        for name, run in (modes if round_no % 2 == 0 else modes[::-1]):
+            start = time.perf_counter()
+            run()
+            times[name].append(time.perf_counter() - start)
+        print(f"Round {round_no + 1} : serial {times['Serial'][-1]:.2f}s, parallel {times['Parallel'][-1]:.2f}s")
+
+    serial_time = sorted(times["Serial"])[len(times["Serial"]) // 2]
+    parallel_time = sorted(times["Parallel"])[len(times["Parallel"]) // 2]
+    print(f"Serial   : {serial_time:.2f}s (median)")
+    print(f"Parallel : {parallel_time:.2f}s (median, {max_workers} workers)")
+
+    if parallel_time:
+        print(f"Speedup  : {serial_time / parallel_time:.1f}x")
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import threading
+
+# Custom Modules
+try:
+    import constants
+    from sequence_manager import ImageSequence
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.sequence_manager import ImageSequence
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+
+class ScanIndex():
+    """
+    What the last load of a scan folder found, stored as JSON in <scan folder>/_io:
+    the sequences of each sub folder (ranges and gaps), their header facts, and the MOVs
+    of the scan folder with their metadata. Folders are recorded with their mtime,
+    a folder changed since it was indexed is a miss and the caller lists it again.
+    Folder names are relative to the scan folder, so the farm can read the index
+    under another mount point.
+    """
+    VERSION = 1
+
+    def __init__(self, data_root):
+        self.data_root = os.path.normpath(data_root)
+        self.path = os.path.join(self.data_root, "_io", constants.SCAN_INDEX_NAME)
+        self.__root_mtime = None
+        self.__movs = {}  # file name: probe metadata
+        self.__folders = {}  # folder name: {"mtime": ns, "sequences": [dict, ...]}
+        self.__headers = {}  # scan data: SequenceHeader dict
+        self.__dirty = False
+        self.__lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read scan index {self.path}: {e}")
+            return
+
+        if data.get("version") != self.VERSION:
+            logger.debug(f"Scan index version mismatch, ignored: {self.path}")
+            return
+
+        self.__root_mtime = data.get("root_mtime")
+        self.__movs = data.get("movs", {})
+        self.__folders = data.get("folders", {})
+        self.__headers = data.get("headers", {})
+        logger.debug(f"Scan index loaded: {len(self.__folders)} folders, {len(self.__movs)} MOVs from {self.path}")
+
+    def save(self):
+        if not self.__dirty:
+            return
+
+        with self.__lock:
+            data = {
+                "version": self.VERSION,
+                "created": time.time(),
+                "root_mtime": self.__root_mtime,
+                "movs": self.__movs,
+                "folders": self.__folders,
+                "headers": self.__headers,
+            }
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            self.__dirty = False
+
+        # Written next to the index and renamed over it, a reader never sees half a file
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write scan index {self.path}: {e}")
+            return
+        logger.debug(f"Scan index saved: {self.path}")
+
+    def is_root(self, data_root):
+        return bool(data_root) and os.path.normpath(data_root) == self.data_root
+
+    def set_root_files(self, mtime, file_names):
+        """
+        mtime is the scan folder's, stat'ed before file_names were listed.
+        """
+        movs = {}
+        for file_name in file_names:
+            if file_name.lower().endswith(".mov"):
+                movs[file_name] = self.__movs.get(file_name, {})
+        self.__root_mtime = mtime
+        self.__movs = movs
+        self.__dirty = True
+
+    def mov_names(self):
+        """
+        Sorted MOV file names of the scan folder, None if it changed since it was indexed.
+        """
+        if self.__root_mtime is None or folder_mtime(self.data_root) != self.__root_mtime:
+            return None
+        return sorted(self.__movs)
+
+    def mov_metadata(self, file_name):
+        return self.__movs.get(file_name) or None
+
+    def mov_changed(self, file_name, metadata):
+        # Metadata probed now differs from the indexed one
+        return not same_data(self.__movs.get(file_name) or None, metadata or None)
+
+    def set_mov_metadata(self, file_name, metadata):
+        if file_name in self.__movs and metadata:
+            self.__movs[file_name] = metadata
+            self.__dirty = True
+
+    def folder_sequences(self, folder):
+        """
+        ImageSequences of a sub folder of the scan folder, None if it is not indexed or changed since.
+        """
+        folder = os.path.normpath(folder)
+        if os.path.dirname(folder) != self.data_root:
+            return None
+        entry = self.__folders.get(os.path.basename(folder))
+        if not entry or folder_mtime(folder) != entry["mtime"]:
+            return None
+        return [
+            ImageSequence(folder, seq["head"], seq["padding"], seq["ext"], [tuple(r) for r in seq["ranges"]])
+            for seq in entry["sequences"]
+        ]
+
+    def set_folder_sequences(self, folder, mtime, sequences):
+        """
+        mtime is the folder's, stat'ed before it was scanned. Called from the probe pool.
+        """
+        folder = os.path.normpath(folder)
+        if os.path.dirname(folder) != self.data_root or mtime is None:
+            return
+        entry = {
+            "mtime": mtime,
+            "sequences": [
+                {
+                    "head": seq.head,
+                    "padding": seq.padding,
+                    "ext": seq.ext,
+                    "ranges": seq.ranges,
+                    "gaps": seq.missing,
+                    "label": seq.label,
+                }
+                for seq in sequences
+            ],
+        }
+        with self.__lock:
+            self.__folders[os.path.basename(folder)] = entry
+            self.__dirty = True
+
+    def sequence(self, scan_data):
+        """
+        Sequence of a 'Scan Data' row, '<folder>' or '<folder>/<label>' when the folder holds several.
+        """
+        folder_name, _, label = scan_data.partition("/")
+        sequences = self.folder_sequences(os.path.join(self.data_root, folder_name))
+        if not sequences:
+            return None
+        if not label:
+            return sequences[0] if len(sequences) == 1 else None
+        return next((seq for seq in sequences if seq.label == label), None)
+
+    def header(self, scan_data):
+        return self.__headers.get(scan_data)
+
+    def header_changed(self, scan_data, header):
+        return not same_data(self.__headers.get(scan_data), header)
+
+    def set_header(self, scan_data, header):
+        self.__headers[scan_data] = header
+        self.__dirty = True
+
+    def retain(self, folder_names):
+        # Drop folders and headers of rows no longer in the scan folder
+        folder_names = set(folder_names)
+        for name in [name for name in self.__folders if name not in folder_names]:
+            del self.__folders[name]
+            self.__dirty = True
+        for scan_data in [s for s in self.__headers if s.partition("/")[0] not in folder_names]:
+            del self.__headers[scan_data]
+            self.__dirty = True
+
+
+def same_data(a, b):
+    # Compared as they are stored, tuples read back as lists
+    return json.dumps(a, sort_keys=True, default=str) == json.dumps(b, sort_keys=True, default=str)
+
+
+def folder_mtime(folder):
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+if __name__ == "__main__":
+    # Benchmark: python scan_index.py <scan_folder>
+    try:
+        from sequence_manager import scan_image_sequences
+    except:
+        from pymodules.sequence_manager import scan_image_sequences
+
+    data_root = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan"
+    folders = [
+        os.path.join(data_root, name) for name in sorted(os.listdir(data_root))
+        if os.path.isdir(os.path.join(data_root, name)) and name not in ["_io", "xml", "@eaDir", "proxy_thumb"]
+    ]
+
+    index = ScanIndex(data_root)
+    start = time.perf_counter()
+    for folder in folders:
+        mtime = folder_mtime(folder)
+        index.set_folder_sequences(folder, mtime, scan_image_sequences(folder, constants.SEQUENCE_TYPES))
+    print(f"Scan   : {time.perf_counter() - start:.3f}s ({len(folders)} folders)")
+    index.save()
+
+    index = ScanIndex(data_root)
+    start = time.perf_counter()
+    hits = sum(index.folder_sequences(folder) is not None for folder in folders)
+    print(f"Index  : {time.perf_counter() - start:.3f}s ({hits} folders unchanged)")
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+# Custom Modules
+try:
+    import constants
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+# ex) A001C003_230101.1001.exr -> ("A001C003_230101.", "1001", ".exr")
+FRAME_PATTERN = re.compile(r"(.+?)(\d+)(\.\w+)$")
+
+
+class ImageSequence():
+    """
+    Frame range of one image sequence, kept as run-length ranges.
+    Frame paths are built on demand from head + padded frame number + ext,
+    so memory stays O(ranges) whatever the frame count.
+    """
+    __slots__ = ("folder", "head", "padding", "ext", "ranges")
+
+    def __init__(self, folder, head, padding, ext, ranges):
+        self.folder = folder.replace(os.sep, "/")
+        self.head = head
+        self.padding = padding
+        self.ext = ext
+        self.ranges = ranges  # [(first, last), ...] of existing frames, sorted
+
+    def __repr__(self):
+        return f"ImageSequence({self.pattern!r}, {self.first}-{self.last}, missing={self.missing})"
+
+    def __len__(self):
+        return sum(last - first + 1 for first, last in self.ranges)
+
+    @property
+    def first(self):
+        return self.ranges[0][0]
+
+    @property
+    def last(self):
+        return self.ranges[-1][1]
+
+    @property
+    def label(self):
+        # ex) A001C003_230101.####.exr
+        return f"{self.head}{'#' * self.padding}{self.ext}"
+
+    @property
+    def pattern(self):
+        # ex) A001C003_230101.%04d.exr
+        return f"{self.head}%0{self.padding}d{self.ext}"
+
+    @property
+    def missing(self):
+        """
+        Gaps between the existing ranges, [(first, last), ...]
+        """
+        return [
+            (prev_last + 1, next_first - 1)
+            for (_, prev_last), (next_first, _) in zip(self.ranges, self.ranges[1:])
+        ]
+
+    @property
+    def start_path(self):
+        return self.frame_path(self.first)
+
+    @property
+    def end_path(self):
+        return self.frame_path(self.last)
+
+    def frame_path(self, frame):
+        return f"{self.folder}/{self.head}{int(frame):0{self.padding}d}{self.ext}"
+
+    def frames(self):
+        for first, last in self.ranges:
+            yield from range(first, last + 1)
+
+    def frame_array(self):
+        return np.concatenate([np.arange(first, last + 1, dtype=np.int64) for first, last in self.ranges])
+
+    def frame_paths(self):
+        for frame in self.frames():
+            yield self.frame_path(frame)
+
+
+def scan_image_sequences(folder, extensions):
+    """
+    Detects every image sequence of a folder in one os.scandir pass.
+    The directory entry type is used as is, so no file is stat'ed.
+    Files are grouped by (head, padding, ext), so several plates, paddings or
+    extensions delivered into one folder each become their own sequence.
+    Returns a list of ImageSequence sorted by head, ext and padding.
+    """
+    extensions = tuple(extensions)
+    groups = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(extensions) or not entry.is_file():
+                    continue
+                match = FRAME_PATTERN.match(name)
+                if not match:
+                    continue
+                head, digits, ext = match.groups()
+                # Zero padded numbers have a fixed width, unpadded ones may grow past it (999 -> 1000)
+                padded = digits[0] == "0" and len(digits) > 1
+                group = groups.setdefault((head, ext, len(digits)), [[], False])
+                group[0].append(int(digits))
+                group[1] = group[1] or padded
+    except OSError as e:
+        logger.warning(f"Failed to scan {folder}: {e}")
+        return []
+
+    sequences = []
+    previous = None
+    previous_width = None
+    for (head, ext, padding), (frames, padded) in sorted(groups.items()):
+        # Unpadded frames one digit wider continue the previous group
+        if (
+            previous and not padded
+            and (previous.head, previous.ext) == (head, ext)
+            and padding == previous_width + 1
+        ):
+            previous.ranges = frames_to_ranges(np.concatenate([previous.frame_array(), frames]))
+            previous_width = padding
+            continue
+        previous = ImageSequence(folder, head, padding, ext, frames_to_ranges(frames))
+        previous_width = padding
+        sequences.append(previous)
+
+    return sequences
+
+
+def frames_to_ranges(frames):
+    """
+    [1001, 1002, 1003, 1010] -> [(1001, 1003), (1010, 1010)]
+    Breaks are found with np.diff on the sorted frame array, no Python loop per frame.
+    """
+    frames = np.array(frames, dtype=np.int64)
+    if not frames.size:
+        return []
+    frames.sort()
+
+    breaks = np.flatnonzero(np.diff(frames) > 1)
+    firsts = np.concatenate(([frames[0]], frames[breaks + 1]))
+    lasts = np.concatenate((frames[breaks], [frames[-1]]))
+    return list(zip(firsts.tolist(), lasts.tolist()))
+
+
+def same_sequence(a, b):
+    """
+    True if both are the same files with the same frames, or both None.
+    """
+    if a is None or b is None:
+        return a is b
+    return (
+        (a.folder, a.head, a.padding, a.ext) == (b.folder, b.head, b.padding, b.ext)
+        and [tuple(r) for r in a.ranges] == [tuple(r) for r in b.ranges]
+    )
+
+
+def format_ranges(ranges):
+    """
+    [(1050, 1062), (1300, 1300)] -> '1050-1062, 1300'
+    """
+    return ", ".join(f"{first}-{last}" if first != last else f"{first}" for first, last in ranges)
+
+
+if __name__ == "__main__":
+    # Benchmark: python sequence_manager.py <sequence_folder>
+    folder = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan\A001C003"
+
+    start = time.perf_counter()
+    sequences = scan_image_sequences(folder, constants.SEQUENCE_TYPES)
+    print(f"scandir : {time.perf_counter() - start:.3f}s")
+    for sequence in sequences:
+        print(sequence)
+
+    # Previous approach, listdir + isfile per entry
+    start = time.perf_counter()
+    files = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
+    print(f"listdir : {time.perf_counter() - start:.3f}s ({len(files)} files)")
@@ -3,6 +3,10 @@
 import os
 import re
 import sys
+import time
+import weakref
+import threading
+from contextlib import contextmanager
 
 import shotgun_api3 as sg
 
@@ -21,7 +25,288 @@ script_name = "your_script_name"
 script_key = "your_script_key"
 server_path = "https://site.shotgrid.autodesk.com"
 
-con = sg.Shotgun(server_path, script_name=script_name, api_key=script_key)
+
+class ConnectionPool():
+    """
+    Shotgun connections made on first use instead of at import, one per thread:
+    a Shotgun instance is not safe to share between threads.
+    At most max_size connections are open, a thread asking for one when all are taken waits
+    for one to be given back, up to timeout seconds. A thread gives its connection back with release()
+    or when it ends. Given back connections are kept and handed to the next thread.
+    A connection not used for keep_alive seconds is checked with info() before it is used again,
+    and replaced if the server does not answer.
+    """
+    def __init__(self, max_size=None, keep_alive=None, timeout=None):
+        self.max_size = max(1, max_size or constants.SG_POOL_SIZE)
+        self.keep_alive = constants.SG_KEEP_ALIVE_S if keep_alive is None else keep_alive
+        self.timeout = constants.SG_POOL_TIMEOUT_S if timeout is None else timeout
+        self.__local = threading.local()
+        self.__idle = []  # [Shotgun, last used]
+        self.__count = 0
+        self.__condition = threading.Condition()
+
+    def get(self):
+        lease = getattr(self.__local, "lease", None)
+        if lease is None:
+            entry = self.__acquire()
+            lease = Lease(entry)
+            # The thread-local is dropped when the thread ends, the connection goes back with it
+            lease.finalizer = weakref.finalize(lease, self.__give_back, entry)
+            self.__local.lease = lease
+        elif time.monotonic() - lease.entry[1] > self.keep_alive:
+            self.__check(lease.entry)
+        lease.entry[1] = time.monotonic()
+        return lease.entry[0]
+
+    def release(self):
+        # Gives the calling thread's connection back, worker threads call it when done
+        lease = getattr(self.__local, "lease", None)
+        if lease is None:
+            return
+        self.__local.lease = None
+        lease.finalizer()
+
+    def __give_back(self, entry):
+        with self.__condition:
+            self.__idle.append(entry)
+            self.__condition.notify()
+
+    @contextmanager
+    def connection(self):
+        try:
+            yield self.get()
+        finally:
+            self.release()
+
+    def __acquire(self):
+        deadline = time.monotonic() + self.timeout
+        with self.__condition:
+            while not self.__idle and self.__count >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No ShotGrid connection given back in {self.timeout}s, {self.max_size} in use")
+                self.__condition.wait(remaining)
+            if self.__idle:
+                entry = self.__idle.pop()
+            else:
+                entry = None
+                self.__count += 1
+
+        if entry is not None:
+            if time.monotonic() - entry[1] > self.keep_alive:
+                self.__check(entry)
+            return entry
+
+        try:
+            return [connect(), time.monotonic()]
+        except Exception:
+            with self.__condition:
+                self.__count -= 1
+                self.__condition.notify()
+            raise
+
+    def __check(self, entry):
+        try:
+            entry[0].info()
+            return
+        except Exception as e:
+            logger.warning(f"ShotGrid connection idle for {time.monotonic() - entry[1]:.0f}s did not answer, reconnecting: {e}")
+        try:
+            entry[0].close()
+        except Exception:
+            pass
+        entry[0] = connect()
+
+
+class Lease():
+    # A thread's connection, held in the pool's thread-local
+    def __init__(self, entry):
+        self.entry = entry
+        self.finalizer = None
+
+
+class ThreadConnection():
+    """
+    The module's con: every attribute is read from the calling thread's connection of the pool,
+    so con.find() and the like work from any thread.
+    """
+    def __init__(self, pool):
+        self.pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self.pool.get(), name)
+
+
+def connect():
+    start = time.perf_counter()
+    connection = sg.Shotgun(server_path, script_name=script_name, api_key=script_key)
+    logger.debug(f"ShotGrid connected in {time.perf_counter() - start:.2f}s ({threading.current_thread().name})")
+    return connection
+
+
+pool = ConnectionPool()
+con = ThreadConnection(pool)
+
+
+class ProjectIndex():
+    """
+    Sequences, Shots, Steps and Tasks of a project read with a few paged finds at the start of a batch,
+    so the per-row find_or_create_* calls are dict lookups and only what is missing is created.
+    sequence_names limits the Shots and Tasks read to the batch's sequences, step_names the Tasks
+    to those steps. Lookups outside them go to ShotGrid as without an index.
+    Entities created through find_or_create_* are added, so later rows of the batch find them.
+    """
+    def __init__(self, sg_project, sequence_names=None, step_names=None):
+        self.project = {"type": "Project", "id": sg_project["id"]}
+        self.sequence_names = set(sequence_names) if sequence_names is not None else None
+        self.step_names = set(step_names) if step_names is not None else None
+        self.sequences = {}  # code: Sequence
+        self.shots = {}  # (sequence id, code): Shot
+        self.steps = {}  # code: Step
+        self.tasks = {}  # (shot id, step code, content): Task
+        self.shot_ids = set()  # Shots whose Tasks are all in tasks
+        self.load()
+
+    def load(self):
+        start = time.perf_counter()
+        project_filter = ["project", "is", self.project]
+        sequence_names = sorted(self.sequence_names) if self.sequence_names is not None else None
+
+        seq_filters = [project_filter]
+        shot_filters = [project_filter]
+        task_filters = [project_filter, ["entity", "type_is", "Shot"]]
+        if sequence_names is not None:
+            seq_filters.append(["code", "in", sequence_names])
+            shot_filters.append(["sg_sequence.Sequence.code", "in", sequence_names])
+            task_filters.append(["entity.Shot.sg_sequence.Sequence.code", "in", sequence_names])
+        if self.step_names is not None:
+            task_filters.append(["step.Step.code", "in", sorted(self.step_names)])
+
+        if sequence_names != []:
+            for sg_seq in con.find("Sequence", seq_filters, ["code"]):
+                self.sequences[sg_seq["code"]] = sg_seq
+            for sg_shot in con.find("Shot", shot_filters, ["project", "code", "sg_sequence"]):
+                if sg_shot.get("sg_sequence"):
+                    self.add_shot(sg_shot["sg_sequence"], sg_shot)
+            if self.step_names != set():
+                for sg_task in con.find("Task", task_filters, ["project", "content", "entity", "step"]):
+                    if sg_task.get("entity") and sg_task.get("step"):
+                        self.add_task(sg_task["entity"], sg_task["step"]["name"], sg_task)
+
+        for sg_step in con.find("Step", [["entity_type", "is", "Shot"]], ["code", "short_name"]):
+            self.steps[sg_step["code"]] = sg_step
+
+        logger.debug(
+            f"ShotGrid prefetch {time.perf_counter() - start:.2f}s: {len(self.sequences)} sequences, "
+            f"{len(self.shots)} shots, {len(self.steps)} steps, {len(self.tasks)} tasks"
+        )
+
+    def covers_sequence(self, sequence_name):
+        return self.sequence_names is None or sequence_name in self.sequence_names
+
+    def covers_tasks(self, sg_shot, step_name):
+        return sg_shot["id"] in self.shot_ids and (self.step_names is None or step_name in self.step_names)
+
+    def add_shot(self, sg_sequence, sg_shot):
+        self.shots[(sg_sequence["id"], sg_shot["code"])] = sg_shot
+        self.shot_ids.add(sg_shot["id"])
+
+    def add_task(self, sg_shot, step_name, sg_task):
+        self.tasks[(sg_shot["id"], step_name, sg_task["content"])] = sg_task
+
+
+class MutationBuffer():
+    """
+    Creates and updates of a batch sent with con.batch() in chunks of chunk_size requests
+    instead of one request each. Updates of the same entity are merged into one request,
+    so the Shot fields a row sets in several steps are written at once.
+    A ShotGrid batch is one transaction, a chunk that fails is sent again request by request
+    so the error is reported for the requests that failed and the others are still written.
+    label is the message reported for a request that failed, followed by the error,
+    label_prefix is put before the labels added while it is set (the table row being processed).
+    """
+    def __init__(self, chunk_size=None):
+        self.chunk_size = max(1, chunk_size or constants.SG_BATCH_SIZE)
+        self.__requests = []
+        self.__updates = {}  # (entity type, id): pending update request
+        self.__errors = []
+        self.sent = 0
+        self.label_prefix = ""
+
+    def __len__(self):
+        return len(self.__requests)
+
+    def create(self, entity_type, data, label=None):
+        request = {"request_type": "create", "entity_type": entity_type, "data": dict(data)}
+        self.__add(request, label)
+
+    def update(self, entity_type, entity_id, data, label=None):
+        request = self.__updates.get((entity_type, entity_id))
+        if request is not None:
+            request["data"].update(data)
+            label = f"{self.label_prefix}{label}" if label else None
+            if label and label not in request["labels"]:
+                request["labels"].append(label)
+            return
+        request = {"request_type": "update", "entity_type": entity_type, "entity_id": entity_id, "data": dict(data)}
+        self.__updates[(entity_type, entity_id)] = request
+        self.__add(request, label)
+
+    def pending_value(self, entity_type, entity_id, field, default=None):
+        """
+        Value of field in the update not sent yet, default if there is none.
+        """
+        request = self.__updates.get((entity_type, entity_id))
+        if request is None or field not in request["data"]:
+            return default
+        return request["data"][field]
+
+    def flush(self):
+        """
+        Sends what is pending. Returns the error messages since the last flush.
+        """
+        while self.__requests:
+            self.__send(self.__requests[:self.chunk_size])
+            del self.__requests[:self.chunk_size]
+        self.__updates.clear()
+        errors, self.__errors = self.__errors, []
+        return errors
+
+    def __add(self, request, label):
+        request["labels"] = [f"{self.label_prefix}{label}"] if label else []
+        self.__requests.append(request)
+        if len(self.__requests) >= self.chunk_size:
+            chunk, self.__requests = self.__requests, []
+            self.__updates.clear()
+            self.__send(chunk)
+
+    def __send(self, chunk):
+        start = time.perf_counter()
+        try:
+            con.batch([strip_labels(request) for request in chunk])
+        except Exception as e:
+            logger.warning(f"ShotGrid batch of {len(chunk)} failed, sending one by one: {e}")
+            for request in chunk:
+                self.__send_one(request)
+        self.sent += len(chunk)
+        logger.debug(f"ShotGrid batch of {len(chunk)} in {time.perf_counter() - start:.2f}s")
+
+    def __send_one(self, request):
+        try:
+            if request["request_type"] == "create":
+                con.create(request["entity_type"], request["data"])
+            else:
+                con.update(request["entity_type"], request["entity_id"], request["data"])
+        except Exception as e:
+            logger.error(f"ShotGrid {request['request_type']} {request['entity_type']} failed: {e}")
+            labels = request["labels"] or [f"Failed to {request['request_type']} {request['entity_type']} {request.get('entity_id', '')}".rstrip()]
+            for label in labels:
+                self.__errors.append(f"{label}: {e}")
+
+
+def strip_labels(request):
+    return {key: value for key, value in request.items() if key != "labels"}
+
 
 def get_user_by_email(email):
     sg_user = con.find_one("HumanUser", [["email", "is", email]], ["name", "department", "email"])
@@ -71,71 +356,95 @@ def get_project_data(project_name):
     
     return sg_project
 
-def find_or_create_sequence(sg_project, sequence):
-    sg_seq = con.find_one(
-        "Sequence",
-        [["project", "is", sg_project], ["code", "is", sequence]]
-    )
+def find_or_create_sequence(sg_project, sequence, index=None):
+    if index is not None and index.covers_sequence(sequence):
+        sg_seq = index.sequences.get(sequence)
+    else:
+        sg_seq = con.find_one(
+            "Sequence",
+            [["project", "is", sg_project], ["code", "is", sequence]]
+        )
     if sg_seq:
         return sg_seq
 
-    return con.create(
+    sg_seq = con.create(
         "Sequence",
         {"project": sg_project, "code": sequence}
     )
+    if index is not None:
+        index.sequences[sequence] = sg_seq
+    return sg_seq
 
-def find_or_create_shot(sg_project, sequence_name, shot_code):
-    sg_sequence = find_or_create_sequence(sg_project, sequence_name)
+def find_or_create_shot(sg_project, sequence_name, shot_code, index=None):
+    sg_sequence = find_or_create_sequence(sg_project, sequence_name, index)
 
-    sg_shot = con.find_one(
-        "Shot",
-        [["project", "is", sg_project], ["code", "is", shot_code], ["sg_sequence", "is", sg_sequence]], 
-        ["project", "code", "sg_sequence"]
-    )
+    if index is not None and index.covers_sequence(sequence_name):
+        sg_shot = index.shots.get((sg_sequence["id"], shot_code))
+    else:
+        sg_shot = con.find_one(
+            "Shot",
+            [["project", "is", sg_project], ["code", "is", shot_code], ["sg_sequence", "is", sg_sequence]], 
+            ["project", "code", "sg_sequence"]
+        )
     
     if sg_shot:
         return sg_shot
     
-    return con.create(
+    sg_shot = con.create(
         "Shot",
         {"project": sg_project, "code": shot_code, "sg_sequence": sg_sequence}
     )
+    if index is not None:
+        # A new Shot has no Tasks yet
+        index.add_shot(sg_sequence, sg_shot)
+    return sg_shot
 
-def find_or_create_step(step_name, step_short_code):
-    sg_step = con.find_one(
-        "Step",
-        [["entity_type", "is", "Shot"], ["code", "is", step_name]]
-    )
+def find_or_create_step(step_name, step_short_code, index=None):
+    if index is not None:
+        sg_step = index.steps.get(step_name)
+    else:
+        sg_step = con.find_one(
+            "Step",
+            [["entity_type", "is", "Shot"], ["code", "is", step_name]]
+        )
     if sg_step:
         return sg_step
 
-    return con.create(
+    sg_step = con.create(
         "Step",
         {"entity_type": "Shot", "code": step_name, "short_name": step_short_code}
     )
+    if index is not None:
+        index.steps[step_name] = sg_step
+    return sg_step
 
 def find_or_create_task(
-        sg_project, sg_shot, step_name, step_short_code, task_name
+        sg_project, sg_shot, step_name, step_short_code, task_name, index=None
 ):
-    
-    filters = [
-        ["project", "is", sg_project], ["entity", "is", sg_shot], 
-        ["step", "name_is", step_name], ["content", "is", task_name]
-    ]
+    if index is not None and index.covers_tasks(sg_shot, step_name):
+        sg_task = index.tasks.get((sg_shot["id"], step_name, task_name))
+    else:
+        filters = [
+            ["project", "is", sg_project], ["entity", "is", sg_shot], 
+            ["step", "name_is", step_name], ["content", "is", task_name]
+        ]
 
-    fields = ["project", "content", "entity"]
+        fields = ["project", "content", "entity"]
 
-    sg_task = con.find_one("Task", filters, fields)
+        sg_task = con.find_one("Task", filters, fields)
 
     if sg_task:
         return sg_task
     
-    sg_step = find_or_create_step(step_name, step_short_code)
-    return con.create(
+    sg_step = find_or_create_step(step_name, step_short_code, index)
+    sg_task = con.create(
         "Task",
         {"project": sg_project, "entity": sg_shot, 
          "step": sg_step, "content": task_name}
     )
+    if index is not None:
+        index.add_task(sg_shot, step_name, sg_task)
+    return sg_task
 
 def validate_versions(project_name, sequence_name, shot_code, _type):
     version_pattern = f"{shot_code}_{_type}_v"
@@ -175,7 +484,80 @@ def validate_versions(project_name, sequence_name, shot_code, _type):
     
     return version_list, cube_name
 
-def retake_low_versions(project_name, shot_code, task_name, _type, status="retake"):
+def validate_versions_bulk(project_name, keys):
+    """
+    validate_versions of many rows with one Version find and one Shot find.
+    keys are (sequence name, shot code, type), returns {key: (version_list, cube_name)}.
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+    sequence_names = sorted({key[0] for key in keys})
+    shot_codes = sorted({key[1] for key in keys})
+    version_patterns = sorted({f"{shot_code}_{_type}_v" for _, shot_code, _type in keys})
+
+    start = time.perf_counter()
+    v_filters = [
+        ["project.Project.name", "is", project_name],
+        ["entity.Shot.sg_sequence.Sequence.code", "in", sequence_names],
+        ["entity.Shot.code", "in", shot_codes],
+        {
+            "filter_operator": "any",
+            "filters": [["code", "starts_with", pattern] for pattern in version_patterns],
+        },
+    ]
+    v_fields = ["code", "entity.Shot.code", "entity.Shot.sg_sequence.Sequence.code"]
+    sg_versions = con.find("Version", v_filters, v_fields)
+
+    s_filters = [
+        ["project.Project.name", "is", project_name],
+        ["sg_sequence.Sequence.code", "in", sequence_names],
+        ["code", "in", shot_codes],
+    ]
+    s_fields = ["code", "sg_luts", "sg_sequence.Sequence.code"]
+    sg_shots = con.find("Shot", s_filters, s_fields)
+
+    # Versions by shot, matched to the row types by code prefix below.
+    # ShotGrid filters ignore case, so the local matching does too.
+    def shot_key(sequence_name, shot_code):
+        return ((sequence_name or "").lower(), (shot_code or "").lower())
+
+    shot_versions = {}
+    for version in sg_versions:
+        code = version.get("code")
+        if not code:
+            continue
+        version_key = shot_key(version.get("entity.Shot.sg_sequence.Sequence.code"), version.get("entity.Shot.code"))
+        shot_versions.setdefault(version_key, []).append(code)
+
+    cube_names = {}
+    for sg_shot in sg_shots:
+        cube_names[shot_key(sg_shot.get("sg_sequence.Sequence.code"), sg_shot.get("code"))] = sg_shot.get("sg_luts")
+
+    result = {}
+    for key in keys:
+        sequence_name, shot_code, _type = key
+        version_pattern = f"{shot_code}_{_type}_v".lower()
+        codes = shot_versions.get(shot_key(sequence_name, shot_code), [])
+        version_list = sorted(code for code in codes if code.lower().startswith(version_pattern))
+        result[key] = (version_list, cube_names.get(shot_key(sequence_name, shot_code)))
+
+    logger.debug(
+        f"Validated {len(keys)} rows in {time.perf_counter() - start:.2f}s: "
+        f"{len(sg_versions)} versions, {len(sg_shots)} shots"
+    )
+    return result
+
+def next_version(version_list):
+    # Version after the last one of the sorted codes, 1 if there is none
+    if not version_list:
+        return 1
+    return int(version_list[-1].split("_v")[-1].split('_')[0]) + 1
+
+def retake_low_versions(project_name, shot_code, task_name, _type, status="retake", buffer=None):
+    """
+    With a MutationBuffer the status updates are added to it, their errors come from its flush().
+    """
     err_list = []
     version_pattern = f"{shot_code}_{_type}_v"
     
@@ -197,6 +579,12 @@ def retake_low_versions(project_name, shot_code, task_name, _type, status="retak
         return err_list
     
     for version in sg_versions:
+        if buffer is not None:
+            buffer.update(
+                "Version", version["id"], {"sg_status_list": status},
+                label=f"Failed to update version: {version.get('code')}"
+            )
+            continue
         try:
             con.update("Version", version["id"], {"sg_status_list": status})
         except Exception as e:
@@ -205,7 +593,11 @@ def retake_low_versions(project_name, shot_code, task_name, _type, status="retak
         
     return err_list
 
-def get_plate_versions(sg_shot, shot_code, current_version):
+def get_plate_versions(sg_shot, shot_code, current_version, buffer=None):
+    """
+    With a MutationBuffer the Shot update is added to it, and Versions it is about to
+    set to another status than "po" are left out.
+    """
     err_list = []
     plate_list = [current_version]
     version_pattern = f"{shot_code}_"
@@ -230,6 +622,8 @@ def get_plate_versions(sg_shot, shot_code, current_version):
             code = po_version.get("code")
             if not code:
                 continue
+            if buffer is not None and buffer.pending_value("Version", po_version["id"], "sg_status_list", "po") != "po":
+                continue
             
             match = pattern.match(code)
             if not match:
@@ -244,6 +638,13 @@ def get_plate_versions(sg_shot, shot_code, current_version):
     
     plate_versions_str = "\n".join(plate_list)
     
+    if buffer is not None:
+        buffer.update(
+            "Shot", sg_shot["id"], {"sg_plate_versions": plate_versions_str},
+            label=f"Failed to update plate versions for {shot_code}"
+        )
+        return err_list
+    
     try:
         con.update("Shot", sg_shot["id"], {"sg_plate_versions": plate_versions_str})
     except Exception as e:
@@ -285,6 +686,20 @@ def get_shot_info(project_name, sg_shot):
 
     return shot_info
 
+def get_shots_info(project_name, shot_codes):
+    """
+    get_shot_info of many Shots with one find, {shot id: shot info}.
+    """
+    shot_codes = sorted(code for code in set(shot_codes) if code)
+    if not shot_codes:
+        return {}
+    sg_shots = con.find(
+        "Shot",
+        [["project.Project.name", "is", project_name], ["code", "in", shot_codes]],
+        ["code", "sg_clip_name", "sg_scan_path", "sg_plate_resolution"]
+    )
+    return {sg_shot["id"]: sg_shot for sg_shot in sg_shots}
+
 if __name__ == "__main__":
     project_name = "TEST_film"
     sequence_name = "EGR"
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+# Table header: (attribute, type), 'Org Range' is kept as org_first / org_last
+HEADER_FIELDS = {
+    "Render": ("render", bool),
+    "Thumbnail": ("thumbnail", str),
+    "Scan Data": ("scan_data", str),
+    "Clip Name": ("clip_name", str),
+    "Episode": ("episode", str),
+    "Sequence": ("sequence", str),
+    "Shot Name": ("shot_name", str),
+    "Type": ("type", str),
+    "Version": ("version", int),
+    "Date": ("date", str),
+    "Version Description": ("version_description", str),
+    "Cube": ("cube", str),
+    "Plate Resolution": ("plate_resolution", str),
+    "TimeCode In": ("timecode_in", str),
+    "TimeCode Out": ("timecode_out", str),
+    "Start Frame": ("start_frame", int),
+    "End Frame": ("end_frame", int),
+    "Duration": ("duration", int),
+    "Frame Handle": ("frame_handle", int),
+    "First Frame Offset": ("first_frame_offset", int),
+    "End Frame Offset": ("end_frame_offset", int),
+    "Retime End Frame": ("retime_end_frame", int),
+    "Retime TimeCode Out": ("retime_timecode_out", str),
+    "Retime Speed": ("retime_speed", float),
+}
+
+# ex) "1001-1100\n(100)", "1001-1100"
+ORG_RANGE_PATTERN = re.compile(r"^\s*(-?\d+)\s*-\s*(-?\d+)")
+
+
+class ShotRow():
+    """
+    One row of the plate / edit table with typed fields.
+    Frames are ints (None when empty), timecodes and names are strings.
+    The table displays these values and the render / edit pipeline reads them as is,
+    text is only parsed where it enters (cell edits, excel load).
+    """
+    __slots__ = tuple(attr for attr, _ in HEADER_FIELDS.values()) + (
+        "org_first", "org_last", "read_only", "cell_roles"
+    )
+
+    def __init__(self, scan_data=""):
+        for attr, field_type in HEADER_FIELDS.values():
+            setattr(self, attr, "" if field_type is str else None)
+        self.render = True
+        self.thumbnail = None
+        self.scan_data = scan_data
+        self.org_first = None
+        self.org_last = None
+        self.read_only = set()  # headers of the cells not editable in the table
+        self.cell_roles = None  # {(header, role): value}, tooltip / color / combo box choices
+
+    def __repr__(self):
+        return f"ShotRow({self.scan_data!r}, {self.org_range!r})"
+
+    @property
+    def org_duration(self):
+        if self.org_first is None or self.org_last is None:
+            return None
+        return self.org_last - self.org_first + 1
+
+    @property
+    def org_range(self):
+        # ex) "1001-1100\n(100)"
+        if self.org_duration is None:
+            return ""
+        return f"{self.org_first}-{self.org_last}\n({self.org_duration})"
+
+    @property
+    def plate_version(self):
+        # ex) mp0_v001
+        return f"{self.type}_v{self.version:03}"
+
+    @property
+    def connect_name(self):
+        # ex) E01_001_mp0_v001
+        return f"{self.shot_name}_{self.plate_version}"
+
+    def value(self, header):
+        if header == "Org Range":
+            return self.org_first
+        return getattr(self, HEADER_FIELDS[header][0])
+
+    def set_value(self, header, value):
+        if header == "Org Range":
+            self.org_first, self.org_last = value if value else (None, None)
+            return
+        setattr(self, HEADER_FIELDS[header][0], value)
+
+    def text(self, header):
+        if header == "Org Range":
+            return self.org_range
+        value = getattr(self, HEADER_FIELDS[header][0])
+        return "" if value is None else str(value)
+
+    def set_text(self, header, text):
+        """
+        Parses the cell text into the header's type, raises ValueError if it does not fit.
+        """
+        text = "" if text is None else str(text).strip()
+        if header == "Org Range":
+            self.set_value(header, parse_org_range(text))
+            return
+
+        attr, field_type = HEADER_FIELDS[header]
+        if field_type is str:
+            value = text
+        elif not text:
+            value = None
+        elif field_type is int:
+            value = int(float(text))
+        elif field_type is float:
+            value = float(text)
+        else:
+            value = text.lower() in ("1", "true", "yes")
+        setattr(self, attr, value)
+
+    def sort_key(self, header):
+        value = self.value(header)
+        return (value is None or value == "", value if value is not None else 0)
+
+
+def parse_org_range(text):
+    """
+    "1001-1100\\n(100)" -> (1001, 1100), "" -> None
+    """
+    if not text:
+        return None
+    match = ORG_RANGE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid Org Range: {text!r}")
+    return int(match.group(1)), int(match.group(2))
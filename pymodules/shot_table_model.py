@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QEvent, Signal
+from PySide2.QtGui import QColor
+from PySide2.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
+
+# Custom Modules
+try:
+    import constants
+    from shot_row import ShotRow
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.shot_row import ShotRow
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+THUMBNAIL_ROLE = Qt.UserRole + 1
+READ_ONLY_COLOR = QColor(30, 30, 30)
+
+
+class ShotTableModel(QAbstractTableModel):
+    """
+    Table model of the plate / edit tab over a list of typed ShotRow.
+    The view, the excel export and the render / edit pipeline all read the same rows,
+    cell text is formatted from the typed fields on display only.
+    cell_edited is emitted for edits made in the view only, not for set_text / set_value calls.
+    """
+    cell_edited = Signal(int, int)  # row, column
+
+    def __init__(self, headers, parent=None):
+        super(ShotTableModel, self).__init__(parent)
+        self.headers = list(headers)
+        self.__columns = {header: col for col, header in enumerate(self.headers)}
+        self.__rows = []
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super(ShotTableModel, self).headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        header = self.headers[index.column()]
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if header == "Render":
+            return flags | Qt.ItemIsUserCheckable
+        if header == "Thumbnail" or header in self.__rows[index.row()].read_only:
+            return flags
+        return flags | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        shot = self.__rows[index.row()]
+        header = self.headers[index.column()]
+
+        if header == "Render":
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if shot.render else Qt.Unchecked
+            return None
+        if header == "Thumbnail":
+            if role == THUMBNAIL_ROLE:
+                return shot.thumbnail
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return shot.text(header)
+        if role == Qt.BackgroundRole and header in shot.read_only:
+            return READ_ONLY_COLOR
+        if shot.cell_roles:
+            return shot.cell_roles.get((header, role))
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        # Edits from the view and delegates
+        if not index.isValid():
+            return False
+        row = index.row()
+        header = self.headers[index.column()]
+
+        if header == "Render" and role == Qt.CheckStateRole:
+            self.set_checked(row, value in (Qt.Checked, 2, True))
+        elif role == Qt.EditRole:
+            try:
+                self.__rows[row].set_text(header, value)
+            except ValueError:
+                logger.warning(f"Invalid {header} value: {value}")
+                return False
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        else:
+            return False
+
+        self.cell_edited.emit(row, index.column())
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        header = self.headers[column]
+        if not self.__rows or header in ("Render", "Thumbnail"):
+            return
+
+        rows = sorted(self.__rows, key=lambda shot: shot.sort_key(header), reverse=order == Qt.DescendingOrder)
+        if all(a is b for a, b in zip(rows, self.__rows)):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        new_rows = {id(shot): new for new, shot in enumerate(rows)}
+        persistent = self.persistentIndexList()
+        moved = [
+            self.index(new_rows[id(self.__rows[index.row()])], index.column()) for index in persistent
+        ]
+        self.__rows = rows
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+    # Row store
+    def column(self, header):
+        return self.__columns[header]
+
+    def clear(self):
+        self.beginResetModel()
+        self.__rows = []
+        self.endResetModel()
+
+    def set_row_count(self, row_count):
+        self.beginResetModel()
+        self.__rows = [ShotRow() for _ in range(row_count)]
+        self.endResetModel()
+
+    def append_row(self, scan_data=""):
+        row = len(self.__rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.__rows.append(ShotRow(scan_data))
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.__rows[row]
+        self.endRemoveRows()
+
+    def shot(self, row):
+        return self.__rows[row]
+
+    def row_of(self, shot):
+        # Current row of the ShotRow, None if it is no longer in the table
+        for row, other in enumerate(self.__rows):
+            if other is shot:
+                return row
+        return None
+
+    def text(self, row, header):
+        return self.__rows[row].text(header)
+
+    def set_text(self, row, header, value, read_only=None):
+        """
+        Parses value into the header's type. Text that does not fit the type clears the cell.
+        """
+        shot = self.__rows[row]
+        try:
+            shot.set_text(header, value)
+        except ValueError:
+            logger.warning(f"Invalid {header} value: {value}")
+            shot.set_value(header, None)
+        self.__cell_changed(row, header, read_only)
+
+    def set_value(self, row, header, value, read_only=None):
+        self.__rows[row].set_value(header, value)
+        self.__cell_changed(row, header, read_only)
+
+    def __cell_changed(self, row, header, read_only):
+        if read_only is not None:
+            read_only_headers = self.__rows[row].read_only
+            if read_only:
+                read_only_headers.add(header)
+            else:
+                read_only_headers.discard(header)
+        index = self.index(row, self.__columns[header])
+        self.dataChanged.emit(index, index)
+
+    def is_read_only(self, row, header):
+        return header in self.__rows[row].read_only
+
+    def is_checked(self, row):
+        return self.__rows[row].render
+
+    def set_checked(self, row, state):
+        self.__rows[row].render = bool(state)
+        index = self.index(row, self.__columns["Render"])
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def thumbnail(self, row):
+        return self.__rows[row].thumbnail
+
+    def set_thumbnail(self, row, thumb_path):
+        self.__rows[row].thumbnail = thumb_path
+        index = self.index(row, self.__columns["Thumbnail"])
+        self.dataChanged.emit(index, index, [THUMBNAIL_ROLE])
+
+    def set_cell_role(self, row, header, role, value):
+        # Tooltip, text color, combo box choices (Qt.UserRole) of a single cell
+        shot = self.__rows[row]
+        if shot.cell_roles is None:
+            shot.cell_roles = {}
+        if value is None:
+            shot.cell_roles.pop((header, role), None)
+        else:
+            shot.cell_roles[(header, role)] = value
+        index = self.index(row, self.__columns[header])
+        self.dataChanged.emit(index, index, [role])
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """
+    Draws the 'Render' check state as a centered check box and toggles it on click.
+    """
+    def paint(self, painter, option, index):
+        # Selection / background only, the item view's own check indicator is replaced below
+        QApplication.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        check_option = QStyleOptionButton()
+        check_option.rect = self.__check_rect(option)
+        check_option.state = QStyle.State_Enabled
+        check_option.state |= QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        QApplication.style().drawControl(QStyle.CE_CheckBox, check_option, painter)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton or not self.__check_rect(option).contains(event.pos()):
+                return False
+        elif event.type() == QEvent.MouseButtonDblClick:
+            return True
+        elif event.type() == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            return False
+
+        state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+        return model.setData(index, state, Qt.CheckStateRole)
+
+    def __check_rect(self, option):
+        size = QApplication.style().pixelMetric(QStyle.PM_IndicatorWidth)
+        return QRect(
+            option.rect.x() + (option.rect.width() - size) // 2,
+            option.rect.y() + (option.rect.height() - size) // 2,
+            size, size
+        )
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """
+    Paints the row's thumbnail scaled to the column width.
+    Images come from the given PixmapCache, decoded off the GUI thread when their row is first painted.
+    """
+    def __init__(self, cache, parent=None):
+        super(ThumbnailDelegate, self).__init__(parent)
+        self.cache = cache
+
+    def paint(self, painter, option, index):
+        QStyledItemDelegate.paint(self, painter, option, index)
+        thumb_path = index.data(THUMBNAIL_ROLE)
+        if not thumb_path:
+            return
+
+        # None while loading, the view is repainted when it is ready
+        pixmap = self.cache.pixmap(thumb_path, option.rect.width(), option.widget)
+        if pixmap is None or pixmap.isNull():
+            return
+
+        x = option.rect.x() + (option.rect.width() - pixmap.width()) // 2
+        y = option.rect.y() + (option.rect.height() - pixmap.height()) // 2
+        painter.drawPixmap(x, y, pixmap)
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import mmap
+import json
+import time
+import struct
+import threading
+
+# Custom Modules
+try:
+    import constants
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+# Atlas file layout: magic, JPEG blobs back to back, JSON index, trailer
+ATLAS_MAGIC = b"IOTHUMB1"
+ATLAS_TRAILER = struct.Struct("<QQ8s")  # index offset, index size, magic
+
+# Table reference of one thumbnail, ex) V:/ORV/stuff/scan/250101/_io/thumbnail.atlas::E01_001_mp0_v001
+REF_SEPARATOR = "::"
+
+
+class ThumbnailAtlasError(Exception):
+    pass
+
+
+class ThumbnailAtlas():
+    """
+    Every thumbnail of a scan folder packed in one file, <scan folder>/_io/THUMBNAIL_ATLAS_NAME.
+    The index maps key -> (offset, size, mtime). mtime is when the thumbnail was written,
+    it versions the key for the pixmap cache.
+    The file is opened and memory-mapped once on load, each thumbnail is a slice of the map,
+    so a whole delivery comes in with a single open instead of one per row.
+    New thumbnails stay in memory until flush(), which appends them over the old index and
+    writes the new index and trailer after them. A damaged file is dropped and rebuilt.
+    """
+    def __init__(self, data_root):
+        self.path = os.path.join(data_root, "_io", constants.THUMBNAIL_ATLAS_NAME).replace("\\", "/")
+        self.__index = {}  # key: [offset, size, mtime]
+        self.__pending = {}  # key: (mtime, data)
+        self.__index_offset = None  # end of the blobs on disk, None if there is no valid file
+        self.__file = None
+        self.__map = None
+        self.__lock = threading.Lock()
+        self.load()
+
+    def __contains__(self, key):
+        return key in self.__pending or key in self.__index
+
+    def __len__(self):
+        return len(set(self.__index) | set(self.__pending))
+
+    def load(self):
+        with self.__lock:
+            self.__close_map()
+            self.__index = {}
+            self.__index_offset = None
+            try:
+                self.__open_map()
+            except FileNotFoundError:
+                return
+            except (OSError, ValueError, ThumbnailAtlasError) as e:
+                logger.warning(f"Thumbnail atlas is not readable, rebuilding: {self.path}: {e}")
+                self.__close_map()
+                return
+        logger.debug(f"Thumbnail atlas loaded: {len(self.__index)} thumbnails from {self.path}")
+
+    def ref(self, key):
+        return f"{self.path}{REF_SEPARATOR}{key}"
+
+    def mtime(self, key):
+        pending = self.__pending.get(key)
+        if pending:
+            return pending[0]
+        entry = self.__index.get(key)
+        return entry[2] if entry else None
+
+    def read(self, key):
+        """
+        JPEG bytes of the thumbnail, or None if the key is not in the atlas.
+        """
+        pending = self.__pending.get(key)
+        if pending:
+            return pending[1]
+
+        with self.__lock:
+            entry = self.__index.get(key)
+            if not entry or self.__map is None:
+                return None
+            offset, size, _ = entry
+            return self.__map[offset:offset + size]
+
+    def put(self, key, data, mtime=None):
+        self.__pending[key] = (mtime or time.time_ns(), bytes(data))
+
+    def flush(self):
+        pending = self.__pending
+        if not pending:
+            return
+
+        with self.__lock:
+            try:
+                self.__write(pending)
+            except OSError as e:
+                # Kept in memory, written with the next flush
+                logger.warning(f"Failed to write thumbnail atlas {self.path}: {e}")
+                return
+            finally:
+                self.__reopen_map()
+            self.__pending = {}
+        logger.debug(f"Thumbnail atlas saved: {len(pending)} thumbnails to {self.path}")
+
+    def close(self):
+        self.flush()
+        with self.__lock:
+            self.__close_map()
+
+    def __write(self, pending):
+        # The map has to be closed before the file grows (Windows)
+        self.__close_map()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        # Another session may have appended since load, keep its thumbnails
+        disk_offset = self.__read_trailer()
+        if disk_offset is None:
+            self.__index = {}
+            self.__index_offset = None
+        elif disk_offset != self.__index_offset:
+            self.__reopen_map()
+            self.__close_map()
+
+        index = dict(self.__index)
+        live_size = sum(entry[1] for entry in index.values())
+        if self.__index_offset is not None and self.__index_offset - len(ATLAS_MAGIC) > 2 * live_size + (1 << 20):
+            self.__compact(index)
+
+        offset = self.__index_offset
+        with open(self.path, "r+b" if offset is not None else "wb") as f:
+            if offset is None:
+                f.write(ATLAS_MAGIC)
+                offset = len(ATLAS_MAGIC)
+            f.seek(offset)
+            for key, (mtime, data) in pending.items():
+                f.write(data)
+                index[key] = [offset, len(data), mtime]
+                offset += len(data)
+
+            index_data = json.dumps(index, separators=(",", ":")).encode("utf-8")
+            f.write(index_data)
+            f.write(ATLAS_TRAILER.pack(offset, len(index_data), ATLAS_MAGIC))
+            f.truncate()
+
+        self.__index = index
+        self.__index_offset = offset
+
+    def __compact(self, index):
+        # Drop thumbnails replaced since the file was written, rewritten next to it and swapped in
+        temp_path = f"{self.path}.tmp"
+        with open(self.path, "rb") as src, open(temp_path, "wb") as dst:
+            dst.write(ATLAS_MAGIC)
+            offset = len(ATLAS_MAGIC)
+            for key, (old_offset, size, mtime) in sorted(index.items(), key=lambda item: item[1][0]):
+                src.seek(old_offset)
+                dst.write(src.read(size))
+                index[key] = [offset, size, mtime]
+                offset += size
+            index_data = json.dumps(index, separators=(",", ":")).encode("utf-8")
+            dst.write(index_data)
+            dst.write(ATLAS_TRAILER.pack(offset, len(index_data), ATLAS_MAGIC))
+        os.replace(temp_path, self.path)
+        self.__index_offset = offset
+        logger.debug(f"Thumbnail atlas compacted: {self.path}")
+
+    def __read_trailer(self):
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() < len(ATLAS_MAGIC) + ATLAS_TRAILER.size:
+                    return None
+                f.seek(-ATLAS_TRAILER.size, os.SEEK_END)
+                index_offset, _, magic = ATLAS_TRAILER.unpack(f.read(ATLAS_TRAILER.size))
+        except OSError:
+            return None
+        return index_offset if magic == ATLAS_MAGIC else None
+
+    def __open_map(self):
+        self.__file = open(self.path, "rb")
+        size = os.fstat(self.__file.fileno()).st_size
+        if size < len(ATLAS_MAGIC) + ATLAS_TRAILER.size:
+            raise ThumbnailAtlasError("File too small")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        index_offset, index_size, magic = ATLAS_TRAILER.unpack_from(self.__map, size - ATLAS_TRAILER.size)
+        if self.__map[:len(ATLAS_MAGIC)] != ATLAS_MAGIC or magic != ATLAS_MAGIC:
+            raise ThumbnailAtlasError("Not a thumbnail atlas")
+        if index_offset + index_size + ATLAS_TRAILER.size != size:
+            raise ThumbnailAtlasError("Truncated index")
+
+        self.__index = json.loads(self.__map[index_offset:index_offset + index_size].decode("utf-8"))
+        self.__index_offset = index_offset
+
+    def __reopen_map(self):
+        self.__close_map()
+        try:
+            self.__open_map()
+        except (OSError, ValueError, ThumbnailAtlasError):
+            self.__close_map()
+            self.__index = {}
+            self.__index_offset = None
+
+    def __close_map(self):
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+def split_ref(ref):
+    """
+    "<atlas path>::<key>" -> (atlas path, key), None for a plain file path.
+    """
+    if not isinstance(ref, str) or REF_SEPARATOR not in ref:
+        return None
+    atlas_path, key = ref.rsplit(REF_SEPARATOR, 1)
+    return atlas_path, key
+
+
+if __name__ == "__main__":
+    # Benchmark against loose JPEGs: python thumbnail_atlas.py <scan_folder>
+    data_root = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan"
+    thumb_paths = []
+    for root, dirs, files in os.walk(data_root):
+        if os.path.basename(root) == "proxy_thumb":
+            thumb_paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(".jpg"))
+    print(f"{len(thumb_paths)} thumbnails in {data_root}")
+
+    start = time.perf_counter()
+    for path in thumb_paths:
+        with open(path, "rb") as f:
+            f.read()
+    print(f"Loose JPEGs : {time.perf_counter() - start:.3f}s")
+
+    atlas = ThumbnailAtlas(data_root)
+    if not len(atlas):
+        for path in thumb_paths:
+            with open(path, "rb") as f:
+                atlas.put(os.path.relpath(path, data_root), f.read())
+        atlas.flush()
+
+    start = time.perf_counter()
+    atlas = ThumbnailAtlas(data_root)
+    for path in thumb_paths:
+        atlas.read(os.path.relpath(path, data_root))
+    print(f"Atlas       : {time.perf_counter() - start:.3f}s")
+    atlas.close()
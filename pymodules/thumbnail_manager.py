@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import struct
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+from PySide2.QtCore import QBuffer, QIODevice
+from PySide2.QtGui import QImage
+
+# Custom Modules
+try:
+    import constants
+    import cube_lut
+    from ffmpeg_manager import FFMPEGManager
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules import cube_lut
+    from pymodules.ffmpeg_manager import FFMPEGManager
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+try:
+    import OpenEXR
+    import Imath
+except ImportError:
+    OpenEXR = None
+    logger.info("OpenEXR is not installed, EXR thumbnails and previews are made with ffmpeg")
+
+# Scanlines compressed together per EXR compression, a line read decompresses its whole chunk
+EXR_CHUNK_LINES = {
+    "NO_COMPRESSION": 1, "RLE_COMPRESSION": 1, "ZIPS_COMPRESSION": 1,
+    "ZIP_COMPRESSION": 16, "PXR24_COMPRESSION": 16,
+    "PIZ_COMPRESSION": 32, "B44_COMPRESSION": 32, "B44A_COMPRESSION": 32,
+    "DWAA_COMPRESSION": 32, "DWAB_COMPRESSION": 256,
+}
+
+# DPX image element 0
+DPX_MAGIC_BE = b"SDPX"
+DPX_MAGIC_LE = b"XPDS"
+DPX_DESCRIPTOR_RGB = 50
+DPX_DESCRIPTOR_RGBA = 51
+DPX_TRANSFER_LOG = (1, 3)  # printing density, logarithmic
+
+# Cineon log to linear, 685 white / 95 black code values of 1023
+CINEON_WHITE = 685
+CINEON_BLACK = 95
+CINEON_GAMMA = 0.6
+
+
+class ThumbnailError(Exception):
+    pass
+
+
+class ThumbnailManager():
+    """
+    Makes the first-frame thumbnail of a row as JPEG bytes.
+    EXR and DPX frames are decoded in process into NumPy, reduced with a box filter,
+    taken to display with a LUT and encoded as JPEG, without starting a process per row.
+    DPX rows are read from a memory map, every n-th line only.
+    MOVs, other image types and frames these readers do not handle go through ffmpeg.
+    lut_thumbnail_data() makes the 'Cube' column preview of an existing thumbnail.
+    """
+    def __init__(self, ffmpeg_io=None, size=None):
+        self.ffmpeg_io = ffmpeg_io or FFMPEGManager()
+        self.width, self.height = size or constants.THUMBNAIL_SIZE
+
+    def thumbnail_data(self, input_path):
+        """
+        JPEG bytes of the thumbnail, None if it could not be made.
+        """
+        ext = os.path.splitext(input_path)[-1].lower()
+        try:
+            if ext == ".exr" and OpenEXR is not None:
+                return self.encode_jpeg(read_exr_thumbnail(input_path, self.width, self.height))
+            if ext == ".dpx":
+                return self.encode_jpeg(read_dpx_thumbnail(input_path, self.width, self.height))
+        except Exception as e:
+            logger.debug(f"In-process thumbnail failed, using ffmpeg: {input_path}: {e}")
+        return self.ffmpeg_thumbnail_data(input_path)
+
+    def lut_thumbnail_data(self, data, cube_path, interpolation=None):
+        """
+        JPEG bytes of the thumbnail with the .cube LUT applied to its display values.
+        """
+        lut = cube_lut.load_cube(cube_path)
+        return encode_jpeg_image(cube_lut.apply_lut_uint8(decode_jpeg(data), lut, interpolation))
+
+    def extract_thumbnail(self, input_path, output_path):
+        data = self.thumbnail_data(input_path)
+        if not data:
+            return None
+        with open(output_path, "wb") as f:
+            f.write(data)
+        return output_path
+
+    def ffmpeg_thumbnail_data(self, input_path):
+        # ffmpeg writes to a local temp file, read back and removed
+        fd, temp_path = tempfile.mkstemp(suffix=".jpg")
+        os.close(fd)
+        try:
+            if not self.ffmpeg_io.extract_thumbnail(input_path, temp_path):
+                return None
+            with open(temp_path, "rb") as f:
+                return f.read() or None
+        finally:
+            os.remove(temp_path)
+
+    def encode_jpeg(self, rgb):
+        # Letterboxed into the thumbnail size, same as the ffmpeg pad filter
+        canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        h, w = rgb.shape[:2]
+        y = (self.height - h) // 2
+        x = (self.width - w) // 2
+        canvas[y:y + h, x:x + w] = rgb
+        return encode_jpeg_image(canvas)
+
+
+def encode_jpeg_image(rgb):
+    rgb = np.ascontiguousarray(rgb)
+    height, width = rgb.shape[:2]
+    image = QImage(rgb.data, width, height, width * 3, QImage.Format_RGB888)
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    if not image.save(buffer, "JPG", constants.THUMBNAIL_JPEG_QUALITY):
+        raise ThumbnailError("Failed to encode JPEG")
+    return bytes(buffer.data())
+
+
+def decode_jpeg(data):
+    # RGB uint8 (h, w, 3) of encoded image bytes
+    image = QImage()
+    if not data or not image.loadFromData(data):
+        raise ThumbnailError("Failed to decode image")
+    image = image.convertToFormat(QImage.Format_RGB888)
+    width, height, stride = image.width(), image.height(), image.bytesPerLine()
+    lines = np.frombuffer(image.constBits(), dtype=np.uint8, count=stride * height).reshape(height, stride)
+    return lines[:, :width * 3].reshape(height, width, 3).copy()
+
+
+def fit_size(width, height, max_width, max_height):
+    scale = min(max_width / width, max_height / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def box_reduce(image, factor_y, factor_x):
+    """
+    Mean of each factor_y x factor_x block, image is (h, w, c).
+    """
+    if factor_y == 1 and factor_x == 1:
+        return image
+    h = image.shape[0] // factor_y * factor_y
+    w = image.shape[1] // factor_x * factor_x
+    blocks = image[:h, :w].reshape(h // factor_y, factor_y, w // factor_x, factor_x, image.shape[2])
+    return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+
+def resample(image, width, height):
+    # Nearest sampling for the remainder after the box filter (less than 2x)
+    rows = (np.arange(height) * image.shape[0] // height)
+    cols = (np.arange(width) * image.shape[1] // width)
+    return image[rows[:, None], cols]
+
+
+def _srgb_lut(size=4096):
+    x = np.linspace(0.0, 1.0, size, dtype=np.float64)
+    srgb = np.where(x <= 0.0031308, x * 12.92, 1.055 * np.power(x, 1 / 2.4) - 0.055)
+    return np.round(srgb * 255).astype(np.uint8)
+
+
+SRGB_LUT = _srgb_lut()
+
+
+def linear_to_display(linear):
+    index = np.clip(np.asarray(linear, dtype=np.float32), 0.0, 1.0) * (len(SRGB_LUT) - 1)
+    return SRGB_LUT[index.astype(np.intp)]
+
+
+@lru_cache(maxsize=None)
+def cineon_lut(max_code):
+    code = np.arange(max_code + 1, dtype=np.float64) * 1023.0 / max_code
+    black = 10 ** ((CINEON_BLACK - CINEON_WHITE) * 0.002 / CINEON_GAMMA)
+    linear = (10 ** ((code - CINEON_WHITE) * 0.002 / CINEON_GAMMA) - black) / (1 - black)
+    return linear_to_display(linear)
+
+
+def read_exr_thumbnail(path, max_width, max_height):
+    """
+    RGB uint8 of the first part, fitted into max_width x max_height.
+    Channels are read as half floats, Y only images are shown as gray.
+    When the decimation is at least a compressed chunk (or tile) high, only every factor-th line
+    is read and the chunks in between are never decompressed, otherwise the image is read whole.
+    """
+    exr = OpenEXR.InputFile(path)
+    try:
+        header = exr.header()
+        data_window = header["dataWindow"]
+        width = data_window.max.x - data_window.min.x + 1
+        height = data_window.max.y - data_window.min.y + 1
+
+        names = list(header["channels"])
+        for rgb in (("R", "G", "B"), ("Y", "Y", "Y")):
+            if all(name in names for name in rgb):
+                break
+        else:
+            rgb = (names[0],) * 3 if names else None
+        if not rgb:
+            raise ThumbnailError(f"No channel to read: {path}")
+
+        fit_width, fit_height = fit_size(width, height, max_width, max_height)
+        factor = max(1, min(width // fit_width, height // fit_height))
+        pixel_type = Imath.PixelType(Imath.PixelType.HALF)
+        decimated = factor > 1 and factor >= exr_chunk_lines(header)
+        if decimated:
+            lines = [
+                exr.channels(list(rgb), pixel_type, y, y)
+                for y in range(data_window.min.y, data_window.max.y + 1, factor)
+            ]
+            planes = [b"".join(line[c] for line in lines) for c in range(3)]
+            rows = len(lines)
+        else:
+            planes = exr.channels(list(rgb), pixel_type)
+            rows = height
+    finally:
+        exr.close()
+
+    image = np.stack(
+        [np.frombuffer(plane, dtype=np.float16).reshape(rows, width) for plane in planes], axis=-1
+    )
+    # Horizontal box filter only when the lines are already decimated
+    reduced = box_reduce(image, 1 if decimated else factor, factor)
+    return resample(linear_to_display(reduced), fit_width, fit_height)
+
+
+def exr_chunk_lines(header):
+    tiles = header.get("tiles")
+    if tiles is not None:
+        return tiles.ySize
+    return EXR_CHUNK_LINES.get(str(header.get("compression")), 16)
+
+
+def read_dpx_header(buf):
+    magic = buf[:4]
+    if magic == DPX_MAGIC_BE:
+        endian = ">"
+    elif magic == DPX_MAGIC_LE:
+        endian = "<"
+    else:
+        raise ThumbnailError("Not a DPX file")
+
+    width, height = struct.unpack_from(f"{endian}II", buf, 772)
+    descriptor, transfer, _, bit_size = struct.unpack_from("BBBB", buf, 800)
+    packing, encoding, data_offset, eol_padding = struct.unpack_from(f"{endian}HHII", buf, 804)
+    if not data_offset or data_offset == 0xFFFFFFFF:
+        data_offset = struct.unpack_from(f"{endian}I", buf, 4)[0]
+    if eol_padding == 0xFFFFFFFF:
+        eol_padding = 0
+    return endian, width, height, descriptor, transfer, bit_size, packing, encoding, data_offset, eol_padding
+
+
+def read_dpx_thumbnail(path, max_width, max_height):
+    """
+    RGB uint8 of an uncompressed 10 bit (filled, method A) or 16 bit RGB(A) DPX,
+    fitted into max_width x max_height. Only the lines kept by the vertical decimation are read,
+    log (printing density) images are converted through a Cineon LUT.
+    """
+    with open(path, "rb") as f:
+        header = f.read(1024)
+        if len(header) < 1024:
+            raise ThumbnailError(f"File too small: {path}")
+        (endian, width, height, descriptor, transfer,
+         bit_size, packing, encoding, data_offset, eol_padding) = read_dpx_header(header)
+
+    if encoding != 0:
+        raise ThumbnailError(f"RLE encoded DPX: {path}")
+    if descriptor not in (DPX_DESCRIPTOR_RGB, DPX_DESCRIPTOR_RGBA):
+        raise ThumbnailError(f"Unsupported DPX descriptor {descriptor}: {path}")
+
+    components = 3 if descriptor == DPX_DESCRIPTOR_RGB else 4
+    if bit_size == 10 and packing == 1 and components == 3:
+        dtype = np.dtype(f"{endian}u4")
+        row_items = width
+        max_code = 1023
+    elif bit_size == 16:
+        dtype = np.dtype(f"{endian}u2")
+        row_items = width * components
+        max_code = 65535
+    else:
+        raise ThumbnailError(f"Unsupported DPX bit size {bit_size} packing {packing}: {path}")
+
+    row_stride = row_items * dtype.itemsize + eol_padding
+    fit_width, fit_height = fit_size(width, height, max_width, max_height)
+    factor = max(1, min(width // fit_width, height // fit_height))
+
+    # Every factor-th line, the pages of the other lines are never read
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=data_offset, shape=(height, row_stride))
+    rows = np.ascontiguousarray(data[::factor, :row_items * dtype.itemsize]).view(dtype)
+    del data
+
+    if bit_size == 10:
+        codes = np.stack(((rows >> 22) & 0x3ff, (rows >> 12) & 0x3ff, (rows >> 2) & 0x3ff), axis=-1)
+    else:
+        codes = rows.reshape(rows.shape[0], width, components)[..., :3]
+
+    # Horizontal box filter on code values, vertical is already decimated
+    reduced = box_reduce(codes.astype(np.float32), 1, factor)
+    if transfer in DPX_TRANSFER_LOG:
+        display = cineon_lut(max_code)[np.round(reduced).astype(np.intp)]
+    else:
+        display = np.round(reduced * (255.0 / max_code)).astype(np.uint8)
+    return resample(display, fit_width, fit_height)
+
+
+if __name__ == "__main__":
+    # Benchmark against ffmpeg: python thumbnail_manager.py <frame_folder>
+    frame_root = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan\A001C003"
+    paths = sorted(
+        os.path.join(frame_root, f) for f in os.listdir(frame_root) if f.lower().endswith((".exr", ".dpx"))
+    )[:20]
+    output_root = os.path.join(frame_root, "_thumbnail_benchmark")
+    os.makedirs(output_root, exist_ok=True)
+
+    manager = ThumbnailManager()
+    start = time.perf_counter()
+    for path in paths:
+        manager.extract_thumbnail(path, os.path.join(output_root, os.path.basename(path) + ".jpg"))
+    native_time = time.perf_counter() - start
+    print(f"In process : {native_time:.3f}s ({len(paths)} frames)")
+
+    start = time.perf_counter()
+    for path in paths:
+        manager.ffmpeg_io.extract_thumbnail(path, os.path.join(output_root, os.path.basename(path) + ".ffmpeg.jpg"))
+    ffmpeg_time = time.perf_counter() - start
+    print(f"ffmpeg     : {ffmpeg_time:.3f}s ({len(paths)} frames)")
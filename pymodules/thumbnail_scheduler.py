@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# Custom Modules
+try:
+    import constants
+    from thumbnail_manager import ThumbnailManager
+    from init_logger import IOManagerLogger
+except:
+    from pymodules import constants
+    from pymodules.thumbnail_manager import ThumbnailManager
+    from pymodules.init_logger import IOManagerLogger
+
+# Set Logger
+logger = IOManagerLogger(os.path.basename(__file__), constants.LOG_PATH)
+
+
+class ThumbnailScheduler(QObject):
+    """
+    Generates missing thumbnails (ThumbnailManager) on a small pool of its own.
+    Jobs wait in a queue and only max_workers run at once, so prioritize() can still move
+    the rows in view to the front. Each result is emitted as soon as it is ready,
+    as JPEG bytes with the target given on submit (ex. the atlas key to store it under).
+    A job given a cube_path applies the LUT to the JPEG bytes it was given instead ('Cube' column preview).
+    cancel() drops the queue and ignores the results of jobs still running, those jobs still
+    count against max_workers until they finish.
+    """
+    succeeded = Signal(object, object, object)  # key, target, JPEG data
+    failed = Signal(object, str)  # key, input path or cube path
+    progress = Signal(int, int)  # done, total
+    finished = Signal(list)  # input paths that failed
+
+    def __init__(self, max_workers=None, parent=None):
+        super(ThumbnailScheduler, self).__init__(parent)
+        self.max_workers = max_workers or constants.THUMBNAIL_FFMPEG_WORKERS
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self.max_workers)
+        self.thumbnail_io = ThumbnailManager()
+
+        self.__queue = OrderedDict()  # key: (input path or JPEG data, target, cube path), next first
+        self.__running = set()
+        self.__stale = 0  # jobs of cancelled generations still running
+        self.__generation = 0
+        self.__done = 0
+        self.__total = 0
+        self.__failed = []
+
+    def is_running(self):
+        return bool(self.__queue or self.__running)
+
+    def submit(self, key, source, target, cube_path=None):
+        # A key still queued takes the new job in its place, a running one is not submitted again
+        if key in self.__queue:
+            self.__queue[key] = (source, target, cube_path)
+            return
+        if key in self.__running:
+            return
+        self.__queue[key] = (source, target, cube_path)
+        self.__total += 1
+        self.__dispatch()
+
+    def prioritize(self, keys):
+        # Keys in view go first, in the given order
+        for key in reversed(list(keys)):
+            if key in self.__queue:
+                self.__queue.move_to_end(key, last=False)
+
+    def cancel(self):
+        if self.is_running():
+            logger.debug(f"Thumbnail generation cancelled: {len(self.__queue)} queued, {len(self.__running)} running")
+        self.__queue.clear()
+        self.__stale += len(self.__running)
+        self.__running.clear()
+        self.__generation += 1
+        self.__done = 0
+        self.__total = 0
+        self.__failed = []
+
+    def __dispatch(self):
+        while self.__queue and len(self.__running) + self.__stale < self.max_workers:
+            key, (source, target, cube_path) = self.__queue.popitem(last=False)
+            self.__running.add(key)
+            job = ThumbnailJob(self.thumbnail_io, key, self.__generation, source, target, cube_path)
+            job.signals.finished.connect(self.__on_finished)
+            self.thread_pool.start(job)
+
+    def __on_finished(self, key, generation, input_path, target, data):
+        if generation != self.__generation:
+            self.__stale -= 1
+            self.__dispatch()
+            return
+        self.__running.discard(key)
+        self.__done += 1
+
+        if data:
+            self.succeeded.emit(key, target, data)
+        else:
+            self.__failed.append(input_path)
+            self.failed.emit(key, input_path)
+        self.progress.emit(self.__done, self.__total)
+
+        self.__dispatch()
+        if not self.is_running():
+            failed = self.__failed
+            self.__done = 0
+            self.__total = 0
+            self.__failed = []
+            self.finished.emit(failed)
+
+
+class ThumbnailJobSignals(QObject):
+    finished = Signal(object, int, str, object, object)  # key, generation, input or cube path, target, JPEG data or None
+
+
+class ThumbnailJob(QRunnable):
+    def __init__(self, thumbnail_io, key, generation, source, target, cube_path=None):
+        super(ThumbnailJob, self).__init__()
+        self.thumbnail_io = thumbnail_io
+        self.key = key
+        self.generation = generation
+        self.source = source
+        self.target = target
+        self.cube_path = cube_path
+        self.signals = ThumbnailJobSignals()
+
+    def run(self):
+        path = self.cube_path or self.source
+        try:
+            if self.cube_path:
+                data = self.thumbnail_io.lut_thumbnail_data(self.source, self.cube_path)
+            else:
+                data = self.thumbnail_io.thumbnail_data(self.source)
+        except Exception as e:
+            logger.error(f"Thumbnail failed for {path}: {e}")
+            data = None
+        self.signals.finished.emit(self.key, self.generation, path, self.target, data)
+
+
+if __name__ == "__main__":
+    # Benchmark: python thumbnail_scheduler.py <mov_folder> [max_workers]
+    from PySide2.QtCore import QCoreApplication
+
+    app = QCoreApplication(sys.argv)
+    data_root = sys.argv[1] if len(sys.argv) > 1 else r"C:\workspace\scan"
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else constants.THUMBNAIL_FFMPEG_WORKERS
+
+    scheduler = ThumbnailScheduler(max_workers)
+    start = time.perf_counter()
+    first = []
+    scheduler.succeeded.connect(lambda key, target, data: first or first.append(time.perf_counter() - start))
+    scheduler.finished.connect(lambda failed: app.quit())
+
+    movs = sorted(f for f in os.listdir(data_root) if f.lower().endswith(".mov"))
+    for name in movs:
+        scheduler.submit(name, os.path.join(data_root, name), name)
+    if movs:
+        app.exec_()
+
+    print(f"First : {first[0] if first else 0:.2f}s")
+    print(f"All   : {time.perf_counter() - start:.2f}s ({len(movs)} thumbnails, {max_workers} workers)")
@@ -11,13 +11,16 @@ import qdarktheme
 from PySide2.QtCore import QSize, Qt
 from PySide2.QtGui import QIcon, QFontDatabase, QFont
 from PySide2.QtWidgets import ( QMainWindow, QTabWidget, QWidget, QLabel, QComboBox, QLineEdit,
-                               QPushButton, QSizePolicy, QFrame, QSpacerItem, QToolButton, QTableWidget,
+                               QPushButton, QSizePolicy, QFrame, QSpacerItem, QToolButton, QTableView,
                                QCheckBox, QSpinBox, QDoubleSpinBox, QGroupBox, QGridLayout, QHBoxLayout,
                                QVBoxLayout, QSplitter, QApplication, QMenuBar, QStatusBar )
 
 # Load Custom Modules
 import pymodules.constants as constants
 from pymodules import aces_combobox
+from pymodules.pixmap_cache import PixmapCache
+from pymodules.plate_scrubber import PlateScrubber
+from pymodules.shot_table_model import ShotTableModel, CheckBoxDelegate, ThumbnailDelegate
 
 
 class IOManager_UI(QMainWindow):
@@ -98,34 +101,41 @@ class IOManager_UI(QMainWindow):
         self.view_mode_btn.setFixedSize(30, 30)
         self.view_mode_btn.setToolTip("View Mode")
         
-        ## Table Widget
-        self.plate_table_widget = QTableWidget()
+        ## Table View
+        # Scaled thumbnails shared by the plate and edit tables
+        self.thumbnail_cache = PixmapCache(parent=self)
+        self.plate_table_view = QTableView()
         self.table_headers = constants.HEADERS
-        
-        ### Set table widget
-        self.plate_table_widget.setSortingEnabled(True)
-        self.plate_table_widget.setColumnCount(len(self.table_headers))
-        self.plate_table_widget.setHorizontalHeaderLabels(self.table_headers)
-        self.plate_table_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        h_header = self.plate_table_widget.horizontalHeader()
-        v_header = self.plate_table_widget.verticalHeader()
+        self.plate_table_model = ShotTableModel(self.table_headers, self)
+        
+        ### Set table view
+        self.plate_table_view.setModel(self.plate_table_model)
+        self.plate_table_view.setSortingEnabled(True)
+        self.plate_table_view.setItemDelegateForColumn(self.table_headers.index("Render"), CheckBoxDelegate(self))
+        self.plate_table_view.setItemDelegateForColumn(self.table_headers.index("Thumbnail"), ThumbnailDelegate(self.thumbnail_cache, self))
+        self.plate_table_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        h_header = self.plate_table_view.horizontalHeader()
+        v_header = self.plate_table_view.verticalHeader()
         h_header.setCascadingSectionResizes(False)
         h_header.setDefaultSectionSize(100)
         h_header.setStretchLastSection(True)
-        v_header.setDefaultSectionSize(30)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Render"), 60)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Thumbnail"), 200)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Scan Data"), 200)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Clip Name"), 230)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Version Description"), 180)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Cube"), 150)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("TimeCode In"), 120)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("TimeCode Out"), 120)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("First Frame Offset"), 140)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("End Frame Offset"), 140)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Retime End Frame"), 140)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Retime TimeCode Out"), 150)
-        self.plate_table_widget.setColumnWidth(self.table_headers.index("Retime Speed"), 110)
+        v_header.setDefaultSectionSize(120)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Render"), 60)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Thumbnail"), 200)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Scan Data"), 200)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Clip Name"), 230)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Version Description"), 180)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Cube"), 150)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("TimeCode In"), 120)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("TimeCode Out"), 120)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("First Frame Offset"), 140)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("End Frame Offset"), 140)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Retime End Frame"), 140)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Retime TimeCode Out"), 150)
+        self.plate_table_view.setColumnWidth(self.table_headers.index("Retime Speed"), 110)
+        
+        # Preview of the selected row, decoded frames shared by every row
+        self.plate_scrubber = PlateScrubber(parent=self)
         
         # Render Settings
         ## Export Option
@@ -330,27 +340,29 @@ class IOManager_UI(QMainWindow):
         self.edit_view_mode_btn.setFixedSize(30, 30)
         self.edit_view_mode_btn.setToolTip("View Mode")
         
-        ## Table Widget
-        self.edit_table_widget = QTableWidget()
+        ## Table View
+        self.edit_table_view = QTableView()
         self.edit_table_headers = constants.EDIT_HEADERS
-        
-        ### Set table widget
-        self.edit_table_widget.setSortingEnabled(True)
-        self.edit_table_widget.setColumnCount(len(self.edit_table_headers))
-        self.edit_table_widget.setHorizontalHeaderLabels(self.edit_table_headers)
-        self.edit_table_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        h_header = self.edit_table_widget.horizontalHeader()
-        v_header = self.edit_table_widget.verticalHeader()
+        self.edit_table_model = ShotTableModel(self.edit_table_headers, self)
+        
+        ### Set table view
+        self.edit_table_view.setModel(self.edit_table_model)
+        self.edit_table_view.setSortingEnabled(True)
+        self.edit_table_view.setItemDelegateForColumn(self.edit_table_headers.index("Render"), CheckBoxDelegate(self))
+        self.edit_table_view.setItemDelegateForColumn(self.edit_table_headers.index("Thumbnail"), ThumbnailDelegate(self.thumbnail_cache, self))
+        self.edit_table_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        h_header = self.edit_table_view.horizontalHeader()
+        v_header = self.edit_table_view.verticalHeader()
         h_header.setCascadingSectionResizes(False)
         h_header.setDefaultSectionSize(100)
         h_header.setStretchLastSection(True)
-        v_header.setDefaultSectionSize(30)
-        self.edit_table_widget.setColumnWidth(self.edit_table_headers.index("Render"), 60)
-        self.edit_table_widget.setColumnWidth(self.edit_table_headers.index("Thumbnail"), 200)
-        self.edit_table_widget.setColumnWidth(self.edit_table_headers.index("Scan Data"), 200)
-        self.edit_table_widget.setColumnWidth(self.edit_table_headers.index("Version Description"), 180)
-        self.edit_table_widget.setColumnWidth(self.edit_table_headers.index("First Frame Offset"), 150)
-        self.edit_table_widget.setColumnWidth(self.edit_table_headers.index("End Frame Offset"), 150)
+        v_header.setDefaultSectionSize(120)
+        self.edit_table_view.setColumnWidth(self.edit_table_headers.index("Render"), 60)
+        self.edit_table_view.setColumnWidth(self.edit_table_headers.index("Thumbnail"), 200)
+        self.edit_table_view.setColumnWidth(self.edit_table_headers.index("Scan Data"), 200)
+        self.edit_table_view.setColumnWidth(self.edit_table_headers.index("Version Description"), 180)
+        self.edit_table_view.setColumnWidth(self.edit_table_headers.index("First Frame Offset"), 150)
+        self.edit_table_view.setColumnWidth(self.edit_table_headers.index("End Frame Offset"), 150)
 
         # Buttons
         self.edit_h_spacer = QSpacerItem(200, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
@@ -399,7 +411,14 @@ class IOManager_UI(QMainWindow):
         self.plate_sub_layout1.addLayout(self.load_layout)
         self.plate_sub_layout1.addWidget(self.h_divider)
         self.plate_sub_layout1.addLayout(self.tool_layout)
-        self.plate_sub_layout1.addWidget(self.plate_table_widget)
+        self.plate_sub_layout1.addWidget(self.plate_table_view)
+        
+        ## Sub Layout 2 - Preview
+        self.preview_group = QGroupBox("Preview")
+        self.preview_layout = QVBoxLayout()
+        self.preview_group.setLayout(self.preview_layout)
+        self.preview_layout.addWidget(self.plate_scrubber)
+        self.plate_sub_layout2.addWidget(self.preview_group)
         
         ## Sub Layout 2 - Render Settings
         self.render_group = QGroupBox("Render Settings")
@@ -576,7 +595,7 @@ class IOManager_UI(QMainWindow):
         self.edit_layout.addLayout(self.edit_load_layout)
         self.edit_layout.addWidget(self.edit_h_divider)
         self.edit_layout.addLayout(self.edit_tool_layout)
-        self.edit_layout.addWidget(self.edit_table_widget)
+        self.edit_layout.addWidget(self.edit_table_view)
         self.edit_layout.addLayout(self.edit_btn_layout)
         
         self.edit_splitter = QSplitter(Qt.Horizontal)